@@ -0,0 +1,276 @@
+"""
+Synthetic load benchmark of the whole tower pipeline.
+
+The generated updates go through `bot.standard_message` (with the chat
+dispatcher, as the application runs it) with the telegram bot stubbed
+out and the towers kept in the memory storage, so only the code of the
+bot itself is measured.
+Every chat builds its towers round by round, and the rounds are mixed
+with:
+- bursts - two letters at the same moment
+- edits of the tower messages
+- repeated participants
+- lookalike letters
+In the middle of the run the day is over: all chats get the end-day
+message and are enabled again in the new day.
+
+Run from the root of the project (it needs the `.envs` file):
+    python -m benchmarks.pipeline_bench --chats 2000 --rounds 40
+"""
+
+import argparse
+import asyncio
+import gc
+import random
+import time
+import tracemalloc
+from itertools import count
+from typing import Any, Dict, List
+
+from telegram import Update
+
+import bot
+from config import Params
+from observer import Observer, TOWER_TRIE
+from sender import Sender, TokenBucket
+from stats import Stats
+from storage import MemoryStorage
+
+
+class StubMessage:
+    """
+    The answer of the stubbed telegram methods (only the id is used).
+    """
+
+    _ids = count(1)
+
+    def __init__(self):
+        self.id = self.message_id = next(self._ids)
+
+
+class StubBot:
+    """
+    The telegram bot, which answers all calls at once.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    async def send_message(self, *args, **kwargs) -> StubMessage:
+        self.calls += 1
+        return StubMessage()
+
+    async def forward_message(self, *args, **kwargs) -> StubMessage:
+        self.calls += 1
+        return StubMessage()
+
+    async def delete_message(self, *args, **kwargs) -> bool:
+        self.calls += 1
+        return True
+
+
+class UnlimitedSender(Sender):
+    """
+    The sender without the telegram limits, they are not a part of the
+    pipeline cost.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.global_bucket = TokenBucket(1e12, 1e12)
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        return self.global_bucket
+
+
+class UpdateFactory:
+    """
+    Creates the updates of the group messages.
+    """
+
+    def __init__(self, stub_bot: StubBot):
+        self.bot = stub_bot
+        self.update_ids = count(1)
+        self.message_ids = count(1)
+        self.date = int(time.time())
+
+    def _message(self, chat_id: int, user_id: int, text: str, message_id: int) -> Dict[str, Any]:
+        return {
+            "message_id": message_id,
+            "date": self.date,
+            "chat": {"id": chat_id, "type": "supergroup", "title": "benchmark"},
+            "from": {"id": user_id, "is_bot": False, "first_name": "user"},
+            "text": text,
+        }
+
+    def letter(self, chat_id: int, user_id: int, text: str) -> Update:
+        data = {
+            "update_id": next(self.update_ids),
+            "message": self._message(chat_id, user_id, text, next(self.message_ids)),
+        }
+        return Update.de_json(data, self.bot)
+
+    def edit(self, chat_id: int, user_id: int, text: str, message_id: int) -> Update:
+        data = {
+            "update_id": next(self.update_ids),
+            "edited_message": self._message(chat_id, user_id, text, message_id),
+        }
+        return Update.de_json(data, self.bot)
+
+
+class Scenario:
+    """
+    Generates the next round of updates of each chat from its current
+    tower, with the given chances of the disruptions.
+    """
+
+    def __init__(self, factory: UpdateFactory, seed: int, burst: float, edit: float, repeat: float, lookalike: float):
+        self.factory = factory
+        self.random = random.Random(seed)
+        self.burst = burst
+        self.edit = edit
+        self.repeat = repeat
+        self.lookalike = lookalike
+        self.user_ids = count(1)
+
+    async def round(self, chat_id: int) -> List[Update]:
+        tower = (await bot.observer.get(chat_id)).tower
+        node = TOWER_TRIE.walk(letter[0] for letter in tower.letters)
+        if tower.is_completed:
+            # the next letter falls the tower and starts over anyway
+            node = TOWER_TRIE.root
+        letter = Params.TOWER[node.depth]
+        roll = self.random.random()
+
+        if tower.letters and roll < self.edit:
+            text, user_id, message_id = self.random.choice(tower.letters)
+            return [self.factory.edit(chat_id, user_id, text + "!", message_id)]
+        roll -= self.edit
+
+        if tower.letters and roll < self.repeat:
+            user_id = self.random.choice(tower.letters)[1]
+            return [self.factory.letter(chat_id, user_id, letter)]
+        roll -= self.repeat
+
+        lookalikes = [char for char in node.letters if char != letter]
+        if lookalikes and roll < self.lookalike:
+            letter = self.random.choice(lookalikes)
+        roll -= self.lookalike
+
+        updates = [self.factory.letter(chat_id, next(self.user_ids), letter)]
+        if roll < self.burst:
+            updates.append(self.factory.letter(chat_id, next(self.user_ids), letter))
+        return updates
+
+
+async def run_round(handler, updates: List[Update], latencies: List[float]) -> float:
+    """
+    Processes the updates at the same moment and returns the wall time.
+    """
+
+    async def process(update: Update):
+        start = time.perf_counter()
+        await handler(update, None)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*map(process, updates))
+    return time.perf_counter() - start
+
+
+async def enable_chats(chat_ids: List[int]):
+    for chat_id in chat_ids:
+        await bot.observer.add(chat_id)
+
+
+def percentile(values: List[float], share: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+
+async def measure_memory(chats: int) -> float:
+    """
+    Returns the memory of one chat (in bytes) with a half-built tower.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    bot.observer = Observer(storage=MemoryStorage())
+    chat_ids = [-chat_id for chat_id in range(1, chats + 1)]
+    await enable_chats(chat_ids)
+    for chat_id in chat_ids:
+        chat = await bot.observer.get(chat_id)
+        for position in range(len(Params.TOWER) // 2):
+            chat.add_letter((Params.TOWER[position], position, chat_id * 100 + position))
+    await bot.observer.flush()
+
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / chats
+
+
+async def main(arguments: argparse.Namespace):
+    stub_bot = StubBot()
+    bot.sender = UnlimitedSender()
+    bot.sender.start(stub_bot)
+    bot.observer = Observer(storage=MemoryStorage())
+    bot.stats = Stats(bot.observer.storage)
+    handler = bot.chat_dispatcher.wrap(bot.standard_message)
+
+    scenario = Scenario(
+        UpdateFactory(stub_bot),
+        seed=arguments.seed,
+        burst=arguments.burst,
+        edit=arguments.edit,
+        repeat=arguments.repeat,
+        lookalike=arguments.lookalike,
+    )
+    chat_ids = [-chat_id for chat_id in range(1, arguments.chats + 1)]
+    await enable_chats(chat_ids)
+
+    latencies: List[float] = []
+    wall_time = 0.0
+    rollover_time = 0.0
+    for number in range(arguments.rounds):
+        if number == arguments.rounds // 2:
+            start = time.perf_counter()
+            # the chats are moved to the yesterday, as if the midnight passed
+            for chat_id in chat_ids:
+                bot.observer.chat_days[chat_id] -= 1
+            await bot.send_end_day_message()
+            await enable_chats(chat_ids)
+            rollover_time = time.perf_counter() - start
+
+        updates = [
+            update
+            for chat_id in chat_ids
+            for update in await scenario.round(chat_id)
+        ]
+        wall_time += await run_round(handler, updates, latencies)
+        await bot.observer.flush()
+
+    await bot.chat_dispatcher.close()
+    await bot.sender.close()
+
+    latencies.sort()
+    print(f"{arguments.chats} chats, {arguments.rounds} rounds, {len(latencies)} updates")
+    print(f"throughput:     {len(latencies) / wall_time:,.0f} updates/sec")
+    print(f"latency p50:    {percentile(latencies, 0.50) * 1000:.3f} ms")
+    print(f"latency p99:    {percentile(latencies, 0.99) * 1000:.3f} ms")
+    print(f"rollover:       {rollover_time * 1000:.1f} ms")
+    print(f"telegram calls: {stub_bot.calls}")
+    print(f"memory:         {await measure_memory(arguments.chats):,.0f} bytes per chat")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chats", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--burst", type=float, default=0.05, help="chance of two letters at once")
+    parser.add_argument("--edit", type=float, default=0.01, help="chance of editing a tower message")
+    parser.add_argument("--repeat", type=float, default=0.01, help="chance of a repeated participant")
+    parser.add_argument("--lookalike", type=float, default=0.01, help="chance of a lookalike letter")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,164 @@
+"""
+Replay of the recorded updates (see `recorder.py`).
+
+The updates are fed into the update queue of the application created by
+`bot.create_app`, so they go through the same handlers as in production.
+The requests to telegram are answered at once without the network, and
+the towers are kept in the memory storage.
+The speed of the replay:
+- `--speed 1` - with the original pauses between the updates
+- `--speed 10` - ten times faster than it was
+- `--speed 0` - as fast as possible
+
+Run from the root of the project (it needs the `.envs` file):
+    python -m benchmarks.replay updates.jsonl --speed 0 --enable-all
+It can be profiled as usual:
+    python -m cProfile -s cumtime -m benchmarks.replay updates.jsonl --speed 0
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from http import HTTPStatus
+from itertools import count
+from typing import Any, Dict, Optional, Tuple
+
+from telegram import Update
+from telegram.constants import ChatType
+from telegram.request import BaseRequest, RequestData
+
+import bot
+from config import Args
+from observer import Observer
+from recorder import read_records
+from sender import Sender
+from stats import Stats
+from storage import MemoryStorage
+from benchmarks.pipeline_bench import UnlimitedSender
+
+
+class ReplayRequest(BaseRequest):
+    """
+    Answers all telegram calls at once, without the network.
+    """
+
+    calls: Counter
+    _message_ids: count
+
+    def __init__(self):
+        self.calls = Counter()
+        self._message_ids = count(1)
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def do_request(
+            self,
+            url: str,
+            method: str,
+            request_data: Optional[RequestData] = None,
+            read_timeout: Optional[float] = None,
+            write_timeout: Optional[float] = None,
+            connect_timeout: Optional[float] = None,
+            pool_timeout: Optional[float] = None,
+    ) -> Tuple[int, bytes]:
+        endpoint = url.rsplit("/", 1)[-1]
+        self.calls[endpoint] += 1
+        parameters = request_data.parameters if request_data is not None else dict()
+        result = {"ok": True, "result": self._answer(endpoint, parameters)}
+        return HTTPStatus.OK, json.dumps(result).encode()
+
+    def _answer(self, endpoint: str, parameters: Dict[str, Any]) -> Any:
+        if endpoint == "getMe":
+            return {
+                "id": 1,
+                "is_bot": True,
+                "first_name": "replay",
+                "username": Args.BOT_USERNAME.removeprefix("@"),
+            }
+        if endpoint in ("sendMessage", "forwardMessage"):
+            return {
+                "message_id": next(self._message_ids),
+                "date": int(time.time()),
+                "chat": {"id": parameters["chat_id"], "type": ChatType.SUPERGROUP},
+                "text": parameters.get("text", ""),
+            }
+        return True
+
+
+async def replay(path: str, speed: float, is_enable_all: bool, is_unlimited: bool):
+    request = ReplayRequest()
+    app = bot.create_app(Args.TOKEN, request=request)
+    records = [
+        (moment, Update.de_json(data, app.bot))
+        for (moment, data) in read_records(path)
+    ]
+    if not records:
+        print("No updates in the file")
+        return
+
+    bot.observer = Observer(storage=MemoryStorage())
+    bot.stats = Stats(bot.observer.storage)
+    # the recording is replayed on any day of the week
+    bot.observer.is_working = lambda chat_id: True
+    if is_enable_all:
+        group_chats = {
+            update.effective_chat.id
+            for (_, update) in records
+            if update.effective_chat is not None
+            and update.effective_chat.type in (ChatType.GROUP, ChatType.SUPERGROUP)
+        }
+        for chat_id in group_chats:
+            await bot.observer.add(chat_id)
+
+    bot.sender = UnlimitedSender() if is_unlimited else Sender()
+    await app.initialize()
+    bot.bot = app.bot
+    bot.sender.start(app.bot)
+    await app.start()
+
+    start = time.monotonic()
+    first_moment = records[0][0]
+    for (moment, update) in records:
+        if speed:
+            delay = (moment - first_moment) / speed - (time.monotonic() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await app.update_queue.put(update)
+    # waits until all the updates are taken by the handlers (and the
+    # stopping waits for the handlers themselves)
+    await app.update_queue.join()
+    await app.stop()
+    elapsed = time.monotonic() - start
+
+    await bot.chat_dispatcher.close()
+    await bot.sender.close()
+    await app.shutdown()
+
+    print(f"{len(records)} updates in {elapsed:.3f} seconds ({len(records) / elapsed:,.0f} updates/sec)")
+    print(f"original duration: {records[-1][0] - first_moment:.3f} seconds")
+    calls = ", ".join(f"{endpoint}: {number}" for (endpoint, number) in request.calls.most_common())
+    print(f"telegram calls: {calls}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="the file recorded by `Args.RECORD_PATH`")
+    parser.add_argument("--speed", type=float, default=1.0, help="0 - as fast as possible")
+    parser.add_argument(
+        "--enable-all",
+        action="store_true",
+        help="enable the observation in all recorded groups before the replay",
+    )
+    parser.add_argument(
+        "--unlimited",
+        action="store_true",
+        help="send the messages without the telegram limits",
+    )
+    arguments = parser.parse_args()
+    asyncio.run(replay(arguments.path, arguments.speed, arguments.enable_all, arguments.unlimited))
@@ -0,0 +1,98 @@
+"""
+Benchmark of the per-letter persistence cost of the storages.
+
+Every chat builds the whole tower letter by letter, and the letters are
+persisted in two ways:
+- "direct" - every letter is written at once (a write-behind batch of
+  one observer)
+- "batched" - the observers are flushed by `Args.FLUSH_BATCH_SIZE`, as
+  the write-behind does under load
+
+Run from the root of the project (it needs the `.envs` file):
+    python -m benchmarks.storage_bench --chats 500
+The memcached is skipped if it is not available.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import List, Optional
+
+from config import Args, Params
+from observer import ChatObserver, WriteBehind
+from periodic import get_day_epoch
+from storage import BaseStorage, McStorage, MemoryStorage, SqliteStorage
+
+
+async def is_available(storage: BaseStorage) -> bool:
+    try:
+        return bool(await storage.set("benchmark_probe", b"1"))
+    except asyncio.TimeoutError:
+        return False
+
+
+async def persist_letters(storage: BaseStorage, chats: int, batch_size: int) -> float:
+    """
+    Builds a tower in each chat and returns the cost of one letter (in
+    microseconds).
+    """
+
+    write_behind = WriteBehind(storage, batch_size=batch_size)
+    day = get_day_epoch()
+    observers = [
+        ChatObserver(write_behind=write_behind, chat_id=-chat_id, day=day)
+        for chat_id in range(1, chats + 1)
+    ]
+
+    letters = 0
+    start = time.perf_counter()
+    for (position, char) in enumerate(Params.TOWER):
+        for chat in observers:
+            chat.add_letter((char, position, chat.chat_id * 100 + position))
+            letters += 1
+            if len(write_behind.dirty) >= batch_size:
+                await write_behind.flush()
+    await write_behind.flush()
+    return (time.perf_counter() - start) / letters * 1_000_000
+
+
+def create_storage(name: str, directory: str) -> Optional[BaseStorage]:
+    if name == "memory":
+        return MemoryStorage()
+    if name == "sqlite":
+        return SqliteStorage(os.path.join(directory, "benchmark.sqlite3"))
+    if name == "memcached":
+        return McStorage(prefix="benchmark_")
+    return None
+
+
+async def main(names: List[str], chats: int):
+    print(f"{chats} chats, {len(Params.TOWER)} letters in each\n")
+    print(f"{'storage':<12}{'direct, us':>14}{'batched, us':>14}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names:
+            storage = create_storage(name, directory)
+            if storage is None or not await is_available(storage):
+                print(f"{name:<12}{'unavailable':>14}")
+                continue
+
+            direct = await persist_letters(storage, chats, batch_size=1)
+            batched = await persist_letters(storage, chats, batch_size=Args.FLUSH_BATCH_SIZE)
+            print(f"{name:<12}{direct:>14.1f}{batched:>14.1f}")
+            storage.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chats", type=int, default=200)
+    parser.add_argument(
+        "--storages",
+        nargs="+",
+        default=["memory", "sqlite", "memcached"],
+        choices=["memory", "sqlite", "memcached"],
+    )
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.storages, arguments.chats))
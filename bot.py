@@ -5,26 +5,63 @@ interface of interaction with the bot.
 """
 
 import asyncio
+import logging
+import signal
+import sys
+from datetime import tzinfo
 from functools import wraps, partial
-from typing import Coroutine, Callable
+from typing import Coroutine, Callable, List, Optional, Tuple
 
-from telegram import Update, Message, Bot
+from telegram import Update, Message, Bot, constants
 from telegram.constants import ParseMode
 from telegram.ext.filters import BaseFilter, MessageFilter, ChatType, COMMAND
 from telegram.ext import (
     Application,
     CommandHandler,
     MessageHandler,
+    TypeHandler,
     CallbackContext,
+    ApplicationHandlerStop,
 )
+from telegram.request import BaseRequest
 
 from messages import *
 from config import Args, Params
 from observer import Observer
-from periodic import everyday_cron, add_action, is_same_day_today, is_next_day_today
+from dispatcher import ChatDispatcher
+from sender import Sender
+from webhook import WebhookReceiver
+from recorder import UpdateRecorder
+from history import EventLog
+from stats import Stats, TowerStats
+from metrics import (
+    MetricsServer,
+    UPDATE_SECONDS,
+    TOWER_LETTERS,
+    TOWER_FALLS,
+    TOWER_CRASHES,
+    TOWERS_BUILT,
+    FAST_PATH_UPDATES,
+)
+from periodic import (
+    ACTION_TYPE,
+    DEFAULT_TIMEZONE,
+    everyday_cron,
+    add_action,
+    get_all_timezones,
+)
 
 
 UNTRACEABLE_CHATS = (Args.NULL_CHAT, )
+GROUP_CHAT_TYPES = frozenset((constants.ChatType.GROUP, constants.ChatType.SUPERGROUP))
+ALLOWED_UPDATES = [
+    Update.MESSAGE,
+    Update.EDITED_MESSAGE,
+    Update.POLL,
+    Update.POLL_ANSWER,
+    Update.CHAT_MEMBER,
+    Update.CHAT_JOIN_REQUEST,
+]
 
 
 class NotTrackFilter(MessageFilter):
@@ -73,7 +110,7 @@ def private_checker(func: Callable):
     async def wrapped(update: Update, context: CallbackContext):
         if ChatType.PRIVATE.filter(update.message):
             return await func(update, context)
-        return await update.effective_chat.send_message(MSG_only_for_private)
+        return sender.post_message(update.effective_chat.id, MSG_only_for_private)
 
     return wrapped
 
@@ -88,7 +125,7 @@ def group_checker(func: Callable):
     async def wrapped(update: Update, context: CallbackContext):
         if ChatType.GROUPS.filter(update.message):
             return await func(update, context)
-        return await update.effective_chat.send_message(MSG_only_for_groups)
+        return sender.post_message(update.effective_chat.id, MSG_only_for_groups)
 
     return wrapped
 
@@ -107,9 +144,9 @@ def wednesday_checker(func: Callable):
 
     @wraps(func)
     async def wrapped(update: Update, context: CallbackContext):
-        # `observer.is_enable == True` only on Wednesdays
-        if not observer.is_enable:
-            return await update.effective_chat.send_message(MSG_not_wednesday)
+        # the bot works only on Wednesdays of the chat timezone
+        if not observer.is_working(update.effective_chat.id):
+            return sender.post_message(update.effective_chat.id, MSG_not_wednesday)
         return await func(update, context)
 
     return wrapped
@@ -126,7 +163,7 @@ def ignore_checker(func: Callable):
         if not observer.is_looked(update.effective_chat.id):
             return
 
-        if observer.get(update.effective_chat.id).is_disable:
+        if (await observer.get(update.effective_chat.id)).is_disable:
             return
 
         return await func(update, context)
@@ -137,12 +174,41 @@ def ignore_checker(func: Callable):
 # === handlers =========================================================
 
 
+async def fast_path(update: Update, context: CallbackContext):
+    """
+    Runs before all other handlers and stops the processing of the group
+    messages that surely do not matter for the towers, so the most of the
+    messages in a busy chat cost one cheap check (see `Observer.triage`).
+    Only the messages of the idle chats are decided this way, so the
+    result is the same as after the full processing in order. The rest
+    are announced to the chat dispatcher, all of them must get there.
+    """
+
+    message = update.message or update.edited_message
+    if message is None:
+        return
+    chat = message.chat
+    if chat.type not in GROUP_CHAT_TYPES or chat.id in UNTRACEABLE_CHATS:
+        return
+
+    text = message.text
+    is_command = text is not None and text.startswith("/")
+    if not is_command and chat_dispatcher.is_idle(chat.id):
+        edited_id = message.id if update.edited_message is not None else None
+        verdict = observer.triage(chat.id, text, edited_id)
+        FAST_PATH_UPDATES.inc(verdict)
+        if verdict == "ignore":
+            raise ApplicationHandlerStop
+    chat_dispatcher.announce(chat.id)
+
+
 @private_checker
 async def start(update: Update, context: CallbackContext):
     """
     Standard welcome for the bot.
     """
-    await update.effective_chat.send_message(
+    sender.post_message(
+        update.effective_chat.id,
         MSG_start,
         parse_mode=ParseMode.HTML,
     )
@@ -153,7 +219,8 @@ async def help(update: Update, context: CallbackContext):
     """
     Standard help for the bot.
     """
-    await update.effective_chat.send_message(
+    sender.post_message(
+        update.effective_chat.id,
         MSG_help,
         parse_mode=ParseMode.HTML,
         disable_web_page_preview=True,
@@ -169,15 +236,15 @@ async def get_ords(update: Update, context: CallbackContext):
     letters = update.message.text.removeprefix("/get_ords")
     letters = letters.replace("\n", "").replace("\t", "").replace(" ", "")
     if not letters:
-        return await update.effective_chat.send_message(MSG_get_ords_no_text)
+        return sender.post_message(update.effective_chat.id, MSG_get_ords_no_text)
     if len(letters) > 30:
-        return await update.effective_chat.send_message(MSG_get_ords_too_long)
+        return sender.post_message(update.effective_chat.id, MSG_get_ords_too_long)
 
     ords = "\n".join(
         f"{let} : {ord(let)}"
         for let in letters
     )
-    await update.effective_chat.send_message(ords)
+    sender.post_message(update.effective_chat.id, ords)
 
 
 @group_checker
@@ -193,13 +260,13 @@ async def enable(update: Update, context: CallbackContext):
     if observer.is_looked(chat_id):
         msg = (
             MSG_enable_but_disable
-            if observer.get(chat_id).is_disable else
+            if (await observer.get(chat_id)).is_disable else
             MSG_enable_already
         )
-        return await update.effective_chat.send_message(msg)
+        return sender.post_message(update.effective_chat.id, msg)
 
-    observer.add(chat_id)
-    await update.effective_chat.send_message(MSG_enable)
+    await observer.add(chat_id)
+    sender.post_message(update.effective_chat.id, MSG_enable)
 
 
 @group_checker
@@ -212,22 +279,75 @@ async def disable(update: Update, context: CallbackContext):
 
     chat_id = update.effective_chat.id
     if not observer.is_looked(chat_id):
-        return await update.effective_chat.send_message(MSG_disable_not_enable)
+        return sender.post_message(update.effective_chat.id, MSG_disable_not_enable)
+
+    chat = await observer.get(chat_id)
+    if chat.is_disable:
+        return sender.post_message(update.effective_chat.id, MSG_disable_already)
+
+    chat.set(is_disable=True)
+    sender.post_message(update.effective_chat.id, MSG_disable)
+
+
+def format_stats(title: str, tower_stats: TowerStats) -> str:
+    """
+    Returns the message with the statistics.
+    """
+
+    fastest = tower_stats.fastest
+    if fastest is None:
+        fastest_text = MSG_stats_no_fastest
+    elif fastest < 60:
+        fastest_text = MSG_stats_seconds.format(seconds=fastest)
+    else:
+        fastest_text = MSG_stats_minutes.format(minutes=int(fastest // 60), seconds=int(fastest % 60))
+
+    reasons = "".join(
+        MSG_stats_reason.format(reason=MSG_stats_reasons.get(reason, reason), count=count)
+        for (reason, count) in sorted(tower_stats.falls.items(), key=lambda item: -item[1])
+    )
+    leaders = "".join(
+        MSG_stats_leader.format(place=place, name=name, letters=letters)
+        for (place, (name, letters)) in enumerate(tower_stats.builders.best(), 1)
+    )
+    return MSG_stats.format(
+        title=title,
+        built=tower_stats.built,
+        fastest=fastest_text,
+        crashes=tower_stats.crashes,
+        falls=tower_stats.falls_count,
+        reasons=reasons,
+        leaders=leaders or MSG_stats_no_leaders,
+    )
+
+
+@group_checker
+async def chat_stats(update: Update, context: CallbackContext):
+    """
+    Shows the statistics of the towers of the chat.
+    """
+
+    tower_stats = (await stats.get(update.effective_chat.id)) or TowerStats()
+    sender.post_message(update.effective_chat.id, format_stats(MSG_stats_chat, tower_stats))
+
 
-    if observer.get(chat_id).is_disable:
-        return await update.effective_chat.send_message(MSG_disable_already)
+async def global_stats(update: Update, context: CallbackContext):
+    """
+    Shows the statistics of the towers of all chats.
+    """
 
-    observer.get(chat_id).set(is_disable=True)
-    await update.effective_chat.send_message(MSG_disable)
+    tower_stats = await stats.get_total()
+    sender.post_message(update.effective_chat.id, format_stats(MSG_stats_global, tower_stats))
 
 
 async def dont_understand(update: Update, context: CallbackContext):
     """
     Stub to all messages.
     """
-    await update.effective_chat.send_message(MSG_dont_understand)
+    sender.post_message(update.effective_chat.id, MSG_dont_understand)
 
 
+@UPDATE_SECONDS.measure()
 @ignore_checker
 async def standard_message(update: Update, context: CallbackContext):
     """
@@ -243,7 +363,7 @@ async def standard_message(update: Update, context: CallbackContext):
     - if it is time to automatically crash the tower, then it crashes the tower
     """
 
-    chat = observer.get(update.effective_chat.id)
+    chat = await observer.get(update.effective_chat.id)
 
     # check for a letter
     # code will be returned if the trigger is not the expected letter
@@ -258,6 +378,9 @@ async def standard_message(update: Update, context: CallbackContext):
         # if the tower is small or the message needs to be ignored,
         # there is no need to notify the fall
         is_show_msg = len(chat.tower) >= Params.MINIMAL_CHECK_LEN
+        TOWER_FALLS.inc(code)
+        history.fall(chat.chat_id, len(chat.tower), code)
+        await stats.fall(chat.chat_id, code)
 
         # nullify the tower and notifying of this
         chat.nullify()
@@ -267,7 +390,7 @@ async def standard_message(update: Update, context: CallbackContext):
                 "fall_edited": MSG_fall_edited,
                 "fall_repetition": MSG_fall_repetition,
             }
-            return await update.effective_chat.send_message(incorrect_codes[code])
+            return sender.post_message(update.effective_chat.id, incorrect_codes[code])
         else:
             return
 
@@ -278,48 +401,52 @@ async def standard_message(update: Update, context: CallbackContext):
         update.message.id,
     )
     chat.add_letter(letter)
+    TOWER_LETTERS.inc()
+    history.letter(chat.chat_id, len(chat.tower), *letter)
+    user = update.message.from_user
+    await stats.letter(chat.chat_id, len(chat.tower), user.id, user.full_name)
 
     if chat.tower.is_completed:
         # if the tower is seemingly complete, extra checks still need to be done
         code_completion = (await chat.tower.check_after_completion(update))
         if code_completion is not None:
             # it turns out the tower cracked somewhere during the building
+            TOWER_FALLS.inc(code_completion)
+            history.fall(chat.chat_id, len(chat.tower), code_completion)
+            await stats.fall(chat.chat_id, code_completion)
             incorrect_codes = {
                 "fail_similar": MSG_fail_similar,
                 "fall_deleted": MSG_fall_deleted,
             }
-            return await update.effective_chat.send_message(incorrect_codes[code_completion])
+            return sender.post_message(update.effective_chat.id, incorrect_codes[code_completion])
 
         # if the tower is built, then it's a win
+        tower_text = chat.tower.text
+        history.built(chat.chat_id, len(chat.tower), tower_text)
+        await stats.built(chat.chat_id)
         chat.nullify()
         chat.set(is_built=True)
-        return await update.effective_chat.send_message(
-            MSG_tower_success,
+        TOWERS_BUILT.inc()
+        return sender.post_message(
+            update.effective_chat.id,
+            MSG_tower_success.format(tower=tower_text),
             parse_mode="html"
         )
 
     # if the tower needs to be crashed, then crash it
     if chat.is_need_to_crash:
         msg = MSG_crashes[chat.crash_type]
+        TOWER_CRASHES.inc(str(chat.crash_type))
+        history.crash(chat.chat_id, len(chat.tower), chat.crash_type)
+        await stats.crash(chat.chat_id)
         chat.nullify()
         chat.set(crash_times=chat.crash_times+1)
-        return await update.effective_chat.send_message(msg)
+        return sender.post_message(update.effective_chat.id, msg)
 
 
 # === cron =============================================================
 
 
-async def only_wednesday_work_switch():
-    """
-    Turns the bot on if it's Wednesday and off if it's Thursday.
-    """
-
-    if is_same_day_today():
-        observer.is_enable = True
-    elif is_next_day_today():
-        observer.is_enable = False
-
-
 end_day_message = (
     MSG_wednesday_end
     if Params.ONEDAY_MODE else
@@ -327,28 +454,22 @@ end_day_message = (
 )
 
 
-async def send_end_day_message():
+async def send_end_day_message(timezone: tzinfo = DEFAULT_TIMEZONE):
     """
-    Notifies all chats that the day is over and clears all towers
-    information.
+    Notifies the chats of the timezone that the day is over and starts
+    the new day (the old towers information expires by itself).
+    In one-day mode there are chats only on Thursday, so the others days
+    nothing is sent.
     """
 
-    if not observer.is_enable:
-        # if the bot is disabled, nothing needs to do
-        return
-
-    send_msg_coros = [
-        bot.send_message(chat_id, end_day_message)
-        for chat_id in observer.all_chats
-    ]
-    await asyncio.gather(*send_msg_coros)
-    observer.delete_all()
+    # the errors are isolated for each chat, the broadcast always ends
+    await sender.broadcast(observer.rollover(timezone), end_day_message)
 
 
 # === bot run ==========================================================
 
 
-def create_app(token: str):
+def create_app(token: str, request: Optional[BaseRequest] = None):
     """
     Bot initialization and start function.
 
@@ -357,13 +478,26 @@ def create_app(token: str):
     - /help - help message, available only in private messages
     - /enable@name_bot - starts tower observation, works only in groups
     - /please_disable@name_bot - stops the observation, works only in groups
+    - /stats@name_bot - the statistics of the towers of the chat, works
+      only in groups
+    - /global_stats@name_bot - the statistics of the towers of all chats
 
     Also adds two handlers, one for private messages and one for groups.
     The private message handler just returns an "I don't understand" stub.
     The handler in groups controls the process of building the towers.
+    All the group handlers are run through the chat dispatcher, so the
+    updates of one chat are processed strictly one after another. The
+    handlers only post their answers to the sender, so the next updates of
+    the chat do not wait for the telegram limits. Before them, the fast
+    path drops the group messages that do not matter.
+    The requests to telegram can be replaced by the given `request` (it
+    is used for the replays).
     """
 
-    app = Application.builder().token(token).build()
+    builder = Application.builder().token(token)
+    if request is not None:
+        builder = builder.request(request).get_updates_request(request)
+    app = builder.build()
 
     command_filter = COMMAND & (
         (NOTRACK_FILTER & ChatType.GROUPS & COMMAND_WITH_NAME)  # only with bot_name in groups
@@ -372,40 +506,78 @@ def create_app(token: str):
     command_handler = partial(CommandHandler, filters=command_filter, block=False)
     message_handler = partial(MessageHandler, block=False)
 
-    app.add_handler(command_handler("start", start))
-    app.add_handler(command_handler("help", help))
-    app.add_handler(command_handler("enable", enable))
-    app.add_handler(command_handler("please_disable", disable))
+    # the group -1 goes before all handlers
+    app.add_handler(TypeHandler(Update, fast_path), group=-1)
+    app.add_handler(command_handler("start", chat_dispatcher.wrap(start)))
+    app.add_handler(command_handler("help", chat_dispatcher.wrap(help)))
+    app.add_handler(command_handler("enable", chat_dispatcher.wrap(enable)))
+    app.add_handler(command_handler("please_disable", chat_dispatcher.wrap(disable)))
+    app.add_handler(command_handler("stats", chat_dispatcher.wrap(chat_stats)))
+    app.add_handler(command_handler("global_stats", chat_dispatcher.wrap(global_stats)))
 
     app.add_handler(CommandHandler("get_ords", get_ords, NEW_MESSAGE & COMMAND & ChatType.PRIVATE, block=False))
     app.add_handler(message_handler(NEW_MESSAGE & ChatType.PRIVATE, dont_understand))
-    app.add_handler(message_handler(NOTRACK_FILTER & ChatType.GROUPS, standard_message))
+    app.add_handler(message_handler(
+        NOTRACK_FILTER & ChatType.GROUPS,
+        chat_dispatcher.wrap(standard_message),
+    ))
 
     return app
 
 
+def get_cron_actions() -> List[Tuple[str, tzinfo, ACTION_TYPE]]:
+    """
+    Returns the actions that are executed every day at midnight, with
+    their names and timezones: the day ends separately in each timezone
+    of the chats.
+    """
+
+    return [
+        (f"send_end_day_message:{timezone}", timezone, partial(send_end_day_message, timezone))
+        for timezone in get_all_timezones()
+    ]
+
+
+async def start_receiving(app: Application):
+    """
+    Starts receiving the updates into the update queue of the (already
+    initialized) application, by long polling or by webhook, depending on
+    `Args.UPDATES_MODE`.
+    """
+
+    if Args.UPDATES_MODE == "webhook":
+        await WebhookReceiver(app).start(allowed_updates=ALLOWED_UPDATES)
+    else:
+        await app.updater.start_polling(allowed_updates=ALLOWED_UPDATES)
+
+
 async def run_app(token: str):
     """
     Coroutine, which starts the program and keeps it running.
+    The cron is started only after the chats are loaded and the sender is
+    started, the actions missed during the restart may be run at once.
     """
 
+    await observer.load()
+    await stats.load()
+
     app = create_app(token)
+    if Args.RECORD_PATH:
+        # the group -2 goes before all handlers, even before the fast path
+        app.add_handler(TypeHandler(Update, UpdateRecorder().record), group=-2)
     global bot
     bot = app.bot
+    sender.start(bot)
 
-    updates = [
-        Update.MESSAGE,
-        Update.EDITED_MESSAGE,
-        Update.POLL,
-        Update.POLL_ANSWER,
-        Update.CHAT_MEMBER,
-        Update.CHAT_JOIN_REQUEST,
-    ]
     await app.initialize()
-    await app.updater.start_polling(allowed_updates=updates)
+    await start_receiving(app)
     await app.start()
+    if Args.METRICS_PORT:
+        await MetricsServer().start()
     print("Bot is running!")
 
+    await everyday_cron(observer.storage)
+
 
 async def pulling(*coros: Coroutine):
     """
@@ -421,15 +593,39 @@ async def pulling(*coros: Coroutine):
 # ===
 
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 bot: Bot
+chat_dispatcher = ChatDispatcher()
+sender = Sender()  # all outgoing messages must be sent through it
+history = EventLog()
 
 if __name__ == "__main__":
+    logging.basicConfig(format=LOG_FORMAT, level=logging.INFO)
+    # systemd stops the bot with SIGTERM, it must stop as gracefully as Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    if Args.WORKERS > 1:
+        # the chats are split between the worker processes
+        from sharding import run_front
+        run_front(Args.WORKERS)
+        sys.exit()
+
     observer = Observer()
+    stats = Stats(observer.storage, is_kept=observer.is_cached)
     run_coro = run_app(Args.TOKEN)
 
-    add_action(send_end_day_message)
-    if Params.ONEDAY_MODE:
-        add_action(only_wednesday_work_switch)
-    cron_coro = everyday_cron()
-
-    asyncio.run(pulling(run_coro, cron_coro))
+    for (name, timezone, action) in get_cron_actions():
+        add_action(action, timezone, name)
+    flush_coro = observer.run()
+    history_coro = history.run()
+    stats_coro = stats.run()
+
+    try:
+        asyncio.run(pulling(run_coro, flush_coro, history_coro, stats_coro))
+    finally:
+        # the last changes of the towers must not be lost, the observer
+        # closes the shared storage, so it goes last
+        asyncio.run(history.close())
+        asyncio.run(stats.close())
+        asyncio.run(observer.close())
@@ -0,0 +1,107 @@
+"""
+Builds the table of lookalike characters `confusables_table.py`.
+
+The skeleton of a character (the character it looks like) is found by
+the NFKC folding (the fullwidth forms, mathematical alphanumerics,
+letterlike symbols and so on) and by the vendored list
+`data/confusables.txt`, both repeated until nothing changes. Only the
+characters with a one-character skeleton get into the table.
+The table is built once and is stored in the repository, so the towers
+do not depend on the Unicode version of the Python that runs the bot.
+
+Run from the root of the project after changing the vendored list:
+    python build_confusables.py
+"""
+
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterator
+
+
+VENDORED_PATH = Path(__file__).parent / "data" / "confusables.txt"
+TABLE_PATH = Path(__file__).parent / "confusables_table.py"
+# how many chars are written to one line of the table
+LINE_SIZE = 32
+
+
+def read_vendored(path: Path) -> Dict[str, str]:
+    """
+    Reads the confusables with one-character sources and targets.
+    """
+
+    confusables = dict()
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            source, target, _ = (field.strip() for field in line.split(";"))
+            target_chars = [chr(int(code, 16)) for code in target.split()]
+            if " " not in source and len(target_chars) == 1:
+                confusables[chr(int(source, 16))] = target_chars[0]
+    return confusables
+
+
+def iter_nfkc() -> Iterator[tuple]:
+    """
+    Yields the characters, which NFKC folds into one other character.
+    """
+
+    for code in range(sys.maxunicode + 1):
+        char = chr(code)
+        if unicodedata.category(char) in ("Cs", "Cn"):
+            continue
+        folded = unicodedata.normalize("NFKC", char)
+        if folded != char and len(folded) == 1:
+            yield char, folded
+
+
+def build_table(confusables: Dict[str, str]) -> Dict[str, str]:
+    """
+    Returns the skeletons of all characters that have them.
+    """
+
+    steps = dict(iter_nfkc())
+    # the vendored list goes over the folding, it is more specific
+    steps.update(confusables)
+
+    table = dict()
+    for char in steps:
+        skeleton = char
+        seen = {char}
+        while skeleton in steps:
+            skeleton = unicodedata.normalize("NFKC", steps[skeleton])
+            if skeleton in seen:
+                break
+            seen.add(skeleton)
+        if len(skeleton) == 1 and skeleton != char:
+            table[char] = skeleton
+    return table
+
+
+def write_table(table: Dict[str, str], path: Path):
+    pairs = "".join(char + skeleton for (char, skeleton) in sorted(table.items()))
+    lines = [
+        f"    {ascii(pairs[start:start + LINE_SIZE])}"
+        for start in range(0, len(pairs), LINE_SIZE)
+    ]
+    source = (
+        '"""\n'
+        "The table of lookalike characters, generated by `build_confusables.py`\n"
+        f"from `data/confusables.txt` and the NFKC folding of Unicode\n"
+        f"{unicodedata.unidata_version}, do not edit.\n"
+        "Every two characters are a character and its skeleton.\n"
+        '"""\n\n'
+        f'UNICODE_VERSION = "{unicodedata.unidata_version}"\n'
+        "PAIRS = (\n"
+        + "\n".join(lines)
+        + "\n)\n"
+    )
+    path.write_text(source, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    skeletons = build_table(read_vendored(VENDORED_PATH))
+    write_table(skeletons, TABLE_PATH)
+    print(f"{len(skeletons)} characters are written to {TABLE_PATH.name}")
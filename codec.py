@@ -0,0 +1,104 @@
+"""
+Compact binary format of the tower state in the storage.
+
+Format (little-endian):
+- header: version (B), hash of the tower trie (I), crash times (H),
+  flags (B, `1` - is built, `2` - is disable), number of letters (B)
+- a byte per letter: the number of the letter among the accepted ones
+  in its trie node (so it also tells which towers it continues)
+- ids of the letter authors (q per letter)
+- ids of the letter messages (q per letter)
+
+The letters themselves are not stored, they are restored by walking the
+tower trie, so the stored letters are valid only for the same tower
+texts (the flags and the crash times are always kept).
+The old values (pickled tuples) are still read.
+"""
+
+import struct
+import zlib
+from typing import Any, List, Optional, Tuple
+
+from funcs import TowerTrie
+
+
+__all__ = [
+    "TowerCodec",
+]
+
+
+TOWER_DATA_TYPE = Tuple[List[Tuple[str, int, int]], int, bool, bool]
+
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<BIHBB")
+FLAG_BUILT = 1
+FLAG_DISABLE = 2
+
+
+class TowerCodec:
+    """
+    Encodes and decodes the tower states for the towers of the trie.
+    """
+
+    trie: TowerTrie
+    tower_hash: int
+
+    def __init__(self, trie: TowerTrie):
+        self.trie = trie
+        all_letters = "\0".join("".join(node.letters) for node in trie.nodes)
+        self.tower_hash = zlib.crc32(all_letters.encode())
+
+    def encode(self, data: TOWER_DATA_TYPE) -> bytes:
+        """
+        Packs the tower state into bytes.
+        """
+
+        letters, crash_times, is_built, is_disable = data
+        count = len(letters)
+        flags = (FLAG_BUILT if is_built else 0) | (FLAG_DISABLE if is_disable else 0)
+
+        header = HEADER.pack(FORMAT_VERSION, self.tower_hash, crash_times, flags, count)
+        numbers = bytearray()
+        node = self.trie.root
+        for letter in letters:
+            numbers.append(node.letters.index(letter[0]))
+            node = node.children[letter[0]]
+        ids = struct.pack(
+            f"<{2 * count}q",
+            *(letter[1] for letter in letters),
+            *(letter[2] for letter in letters),
+        )
+        return header + bytes(numbers) + ids
+
+    def decode(self, value: Any) -> Optional[TOWER_DATA_TYPE]:
+        """
+        Unpacks the tower state.
+        Returns `None` if there is no state or it was stored by an unknown
+        format version. If the state was stored for other towers, only its
+        letters are dropped.
+        """
+
+        if value is None:
+            return None
+        if not isinstance(value, bytes):
+            # the old pickled tuple
+            return value
+
+        version, tower_hash, crash_times, flags, count = HEADER.unpack_from(value)
+        if version != FORMAT_VERSION:
+            return None
+        is_built, is_disable = bool(flags & FLAG_BUILT), bool(flags & FLAG_DISABLE)
+        if tower_hash != self.tower_hash:
+            # the towers have changed, the built tower cannot be continued
+            return [], crash_times, is_built, is_disable
+
+        offset = HEADER.size
+        numbers = value[offset:offset + count]
+        ids = struct.unpack_from(f"<{2 * count}q", value, offset + count)
+        letters = []
+        node = self.trie.root
+        for (position, number) in enumerate(numbers):
+            char = node.letters[number]
+            node = node.children[char]
+            letters.append((char, ids[position], ids[count + position]))
+        return letters, crash_times, is_built, is_disable
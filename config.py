@@ -3,7 +3,7 @@ File with the all project configuration (observation parameters and telegram bot
 parameters).
 """
 
-from typing import Final, Tuple
+from typing import Dict, Final, Tuple
 
 from funcs import ReadonlyEnum, get_args
 
@@ -22,7 +22,9 @@ VERSION: Final[str] = "1.1"
 
 
 class Params(metaclass=ReadonlyEnum):
-    TOWER: Final[str] = "ITSWEDNESDAYMYDUDES!"
+    # all the towers that can be built, the first one is the main one
+    TOWERS: Final[Tuple[str, ...]] = ("ITSWEDNESDAYMYDUDES!", )
+    TOWER: Final[str] = TOWERS[0]
     CRASH_LENS: Tuple[int, ...] = (3, 14, 12, 7, 3)
     MINIMAL_CHECK_LEN: Final[int] = 3
 
@@ -43,4 +45,96 @@ class Args(metaclass=ReadonlyEnum):
     BOT_USERNAME = _args["BOT_USERNAME"]
     NULL_CHAT = _args["NULL_CHAT"]
 
+    # how to receive updates: "polling" or "webhook"
+    UPDATES_MODE: Final[str] = "polling"
+    # the webhook is registered in telegram only if the url is set
+    WEBHOOK_URL = _args.get("WEBHOOK_URL", "")
+    WEBHOOK_SECRET = _args.get("WEBHOOK_SECRET", "")
+    WEBHOOK_LISTEN: Final[str] = "127.0.0.1"
+    WEBHOOK_PORT: Final[int] = 8443
+    WEBHOOK_PATH: Final[str] = "/webhook"
+
+    # the timezone of the day of the chats and the timezones of the chats
+    # that live by another one (`{"<chat id>": "<IANA name>"}` in `.envs`)
+    TIMEZONE: Final[str] = "UTC"
+    CHAT_TIMEZONES: Final[Dict[int, str]] = {
+        int(chat_id): name
+        for (chat_id, name) in _args.get("CHAT_TIMEZONES", dict()).items()
+    }
+
+    # how many worker processes share the chats (`1` - everything runs in
+    # one process)
+    WORKERS: Final[int] = 1
+
+    # the local endpoint of the metrics (`0` - disabled, e.g. `9100`)
+    METRICS_LISTEN: Final[str] = "127.0.0.1"
+    METRICS_PORT: Final[int] = 0
+
+    # the file to record the incoming updates to ("" - no recording) and
+    # whether to hide the personal data in it
+    RECORD_PATH: Final[str] = ""
+    RECORD_ANONYMIZE: Final[bool] = True
+
+    # where to store the towers: "memcached", "memory" or "sqlite"
+    STORAGE: Final[str] = "memcached"
+    SQLITE_PATH: Final[str] = "towers.sqlite3"
+
     MEMCACHED_HOST: Final[str] = "localhost:11211"
+    # the size of the pool of MC clients (and of threads for them) and the
+    # timeouts of MC calls (in seconds)
+    MC_POOL_SIZE: Final[int] = 4
+    MC_TIMEOUT: Final[float] = 1.0
+    MC_CONNECT_TIMEOUT: Final[float] = 0.1
+    MC_POLL_TIMEOUT: Final[float] = 0.3
+    # the local snapshot of the towers ("" - no snapshot) and how often it
+    # is saved (in seconds)
+    SNAPSHOT_PATH: Final[str] = "towers.snapshot"
+    SNAPSHOT_INTERVAL: Final[float] = 30.0
+
+    # the directory of the tower history ("" - no history, e.g. "history"),
+    # the size of its segments (in bytes) and how often it is written (in
+    # seconds); the old segments are not deleted by the bot
+    HISTORY_PATH: Final[str] = ""
+    HISTORY_SEGMENT_SIZE: Final[int] = 64 * 1024 * 1024
+    HISTORY_FLUSH_INTERVAL: Final[float] = 1.0
+    # how often the tower statistics are written (in seconds), how many
+    # best builders are shown and into how many keys the numbers of letters
+    # of all participants are split
+    STATS_FLUSH_INTERVAL: Final[float] = 10.0
+    STATS_TOP_SIZE: Final[int] = 10
+    STATS_BUILDERS_PARTS: Final[int] = 64
+
+    # how many chat observers are kept in memory, for how long (in seconds)
+    # unused observers are kept and how often they are checked
+    OBSERVER_CACHE_SIZE: Final[int] = 10_000
+    OBSERVER_IDLE_TIME: Final[float] = 15 * 60
+    EVICT_INTERVAL: Final[float] = 60.0
+    # into how many MC keys the chat registry is split
+    REGISTRY_SHARDS: Final[int] = 16
+
+    # how many tower messages are forwarded to the null chat at the same
+    # time and how many copies are deleted from it at once
+    VERIFY_CONCURRENCY: Final[int] = 5
+    CLEANUP_BATCH_SIZE: Final[int] = 20
+    # how many times to wait out the telegram flood control
+    FLOOD_RETRIES: Final[int] = 3
+
+    # limits of sending messages (messages per second), the limits of the
+    # group and private chats also allow a short burst; the limits of the
+    # idle chats are forgotten every `SEND_PRUNE_INTERVAL` seconds
+    SEND_GLOBAL_RATE: Final[float] = 30.0
+    SEND_CHAT_RATE: Final[float] = 20 / 60
+    SEND_CHAT_BURST: Final[int] = 3
+    SEND_PRIVATE_RATE: Final[float] = 1.0
+    SEND_PRIVATE_BURST: Final[int] = 3
+    SEND_PRUNE_INTERVAL: Final[float] = 60.0
+    SEND_WORKERS: Final[int] = 8
+    # how long the queued messages are sent on stop (in seconds)
+    SEND_CLOSE_TIMEOUT: Final[float] = 5.0
+
+    # seconds without updates after which the chat worker is stopped
+    WORKER_IDLE_TIMEOUT: Final[float] = 60.0
+    # the changed towers are written to MC every `FLUSH_INTERVAL` seconds
+    # or as soon as `FLUSH_BATCH_SIZE` of them are changed
+    FLUSH_INTERVAL: Final[float] = 1.0
+    FLUSH_BATCH_SIZE: Final[int] = 100
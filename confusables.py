@@ -0,0 +1,50 @@
+"""
+Lookalike characters.
+Every character has a skeleton: the character it looks like (`а`, `Ａ`
+and `𝐚` all look like `a`), and the characters with the same skeleton
+are lookalikes. The skeletons are precomputed by `build_confusables.py`
+and are stored in `confusables_table.py`.
+"""
+
+from typing import Dict, Final, FrozenSet
+
+from confusables_table import PAIRS
+
+
+__all__ = [
+    "skeleton",
+    "get_lookalikes",
+]
+
+
+SKELETON_TABLE: Final[Dict[int, int]] = {
+    ord(PAIRS[index]): ord(PAIRS[index + 1])
+    for index in range(0, len(PAIRS), 2)
+}
+
+
+def _group_lookalikes() -> Dict[str, FrozenSet[str]]:
+    groups: Dict[str, set] = dict()
+    for (code, skeleton_code) in SKELETON_TABLE.items():
+        skeleton_char = chr(skeleton_code)
+        groups.setdefault(skeleton_char, {skeleton_char}).add(chr(code))
+    return {char: frozenset(group) for (char, group) in groups.items()}
+
+
+# the skeleton -> all characters with it
+LOOKALIKES: Final[Dict[str, FrozenSet[str]]] = _group_lookalikes()
+
+
+def skeleton(text: str) -> str:
+    """
+    Returns the text with every character replaced by its skeleton (one
+    `str.translate`, however long the text is).
+    """
+    return text.translate(SKELETON_TABLE)
+
+
+def get_lookalikes(char: str) -> FrozenSet[str]:
+    """
+    Returns all characters that look like the character, including it.
+    """
+    return LOOKALIKES.get(skeleton(char), frozenset()) | {char}
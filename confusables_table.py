@@ -0,0 +1,245 @@
+"""
+The table of lookalike characters, generated by `build_confusables.py`
+from `data/confusables.txt` and the NFKC folding of Unicode
+14.0.0, do not edit.
+Every two characters are a character and its skeleton.
+"""
+
+UNICODE_VERSION = "14.0.0"
+PAIRS = (
+    '0O1lIl|l\xa0 \xaaa\xb22\xb33\xb5\u03bc\xb9l\xbao\u0131i\u017fs\u01c0l\u01c3!\u0237j'
+    '\u0251a\u0261g\u02b0h\u02b1\u0266\u02b2j\u02b3r\u02b4\u0279\u02b5\u027b\u02b6\u0281\u02b7w\u02b8y\u02e0\u0263\u02e1l\u02e2s\u02e3x\u02e4\u0295'
+    '\u0340\u0300\u0341\u0301\u0343\u0313\u0374\u02b9\u037e;\u0387\xb7\u0391A\u0392B\u0395E\u0396Z\u0397H\u0399l\u039aK\u039cM\u039dN\u039fO'
+    '\u03a1P\u03a4T\u03a5Y\u03a7X\u03b1a\u03b3y\u03b9i\u03bdv\u03bfo\u03c1p\u03d0\u03b2\u03d1\u03b8\u03d2Y\u03d3\u038e\u03d4\u03ab\u03d5\u03c6'
+    '\u03d6\u03c0\u03f0\u03ba\u03f1p\u03f2c\u03f3j\u03f4\u0398\u03f5\u03b5\u03f9C\u0405S\u0406l\u0408J\u0410A\u0412B\u0415E\u041aK\u041cM'
+    '\u041dH\u041eO\u0420P\u0421C\u0422T\u0423Y\u0425X\u042cb\u0430a\u0433r\u0435e\u043ak\u043eo\u043fn\u0440p\u0441c'
+    '\u0443y\u0445x\u0455s\u0456i\u0458j\u04aeY\u04afy\u04bbh\u04c0l\u04cfl\u0501d\u051bq\u051cW\u051dw\u054dU\u0555O'
+    '\u0566q\u0570h\u0578n\u057du\u0581g\u0585o\u0f0c\u0f0b\u10fc\u10dc\u13a2T\u13aaA\u13abJ\u13acE\u13b3W\u13b7M\u13bbH\u13c3Z'
+    '\u13daS\u13dfC\u13e2P\u13e6K\u13f4B\u1d2cA\u1d2d\xc6\u1d2eB\u1d30D\u1d31E\u1d32\u018e\u1d33G\u1d34H\u1d35l\u1d36J\u1d37K'
+    '\u1d38L\u1d39M\u1d3aN\u1d3cO\u1d3d\u0222\u1d3eP\u1d3fR\u1d40T\u1d41U\u1d42W\u1d43a\u1d44\u0250\u1d45a\u1d46\u1d02\u1d47b\u1d48d'
+    '\u1d49e\u1d4a\u0259\u1d4b\u025b\u1d4c\u025c\u1d4dg\u1d4fk\u1d50m\u1d51\u014b\u1d52o\u1d53\u0254\u1d54\u1d16\u1d55\u1d17\u1d56p\u1d57t\u1d58u\u1d59\u1d1d'
+    '\u1d5a\u026f\u1d5bv\u1d5c\u1d25\u1d5d\u03b2\u1d5ey\u1d5f\u03b4\u1d60\u03c6\u1d61\u03c7\u1d62i\u1d63r\u1d64u\u1d65v\u1d66\u03b2\u1d67y\u1d68p\u1d69\u03c6'
+    '\u1d6a\u03c7\u1d78\u043d\u1d9b\u0252\u1d9cc\u1d9d\u0255\u1d9e\xf0\u1d9f\u025c\u1da0f\u1da1\u025f\u1da2g\u1da3\u0265\u1da4\u0268\u1da5\u0269\u1da6\u026a\u1da7\u1d7b\u1da8\u029d'
+    '\u1da9\u026d\u1daa\u1d85\u1dab\u029f\u1dac\u0271\u1dad\u0270\u1dae\u0272\u1daf\u0273\u1db0\u0274\u1db1\u0275\u1db2\u0278\u1db3\u0282\u1db4\u0283\u1db5\u01ab\u1db6\u0289\u1db7\u028a\u1db8\u1d1c'
+    '\u1db9\u028b\u1dba\u028c\u1dbbz\u1dbc\u0290\u1dbd\u0291\u1dbe\u0292\u1dbf\u03b8\u1e9b\u1e61\u1f71\u03ac\u1f73\u03ad\u1f75\u03ae\u1f77\u03af\u1f79\u03cc\u1f7b\u03cd\u1f7d\u03ce\u1fbb\u0386'
+    '\u1fbei\u1fc9\u0388\u1fcb\u0389\u1fd3\u0390\u1fdb\u038a\u1fe3\u03b0\u1feb\u038e\u1fef`\u1ff9\u038c\u1ffb\u038f\u2000 \u2001 \u2002 \u2003 \u2004 \u2005 '
+    '\u2006 \u2007 \u2008 \u2009 \u200a \u2011\u2010\u2024.\u202f \u205f \u2070O\u2071i\u20744\u20755\u20766\u20777\u20788'
+    '\u20799\u207a+\u207b\u2212\u207c=\u207d(\u207e)\u207fn\u2080O\u2081l\u20822\u20833\u20844\u20855\u20866\u20877\u20888'
+    '\u20899\u208a+\u208b\u2212\u208c=\u208d(\u208e)\u2090a\u2091e\u2092o\u2093x\u2094\u0259\u2095h\u2096k\u2097l\u2098m\u2099n'
+    '\u209ap\u209bs\u209ct\u2102C\u2107\u0190\u210ag\u210bH\u210cH\u210dH\u210eh\u210f\u0127\u2110l\u2111l\u2112L\u2113l\u2115N'
+    '\u2119P\u211aQ\u211bR\u211cR\u211dR\u2124Z\u2126\u03a9\u2128Z\u212aK\u212b\xc5\u212cB\u212dC\u212fe\u2130E\u2131F\u2133M'
+    '\u2134o\u2135\u05d0\u2136\u05d1\u2137\u05d2\u2138\u05d3\u2139i\u213c\u03c0\u213dy\u213e\u0393\u213f\u03a0\u2140\u2211\u2145D\u2146d\u2147e\u2148i\u2149j'
+    '\u2160l\u2164V\u2169X\u216cL\u216dC\u216eD\u216fM\u2170i\u2174v\u2179x\u217cl\u217dc\u217ed\u217fm\u2223l\u2329\u3008'
+    '\u232a\u3009\u2460l\u24612\u24623\u24634\u24645\u24656\u24667\u24678\u24689\u24b6A\u24b7B\u24b8C\u24b9D\u24baE\u24bbF'
+    '\u24bcG\u24bdH\u24bel\u24bfJ\u24c0K\u24c1L\u24c2M\u24c3N\u24c4O\u24c5P\u24c6Q\u24c7R\u24c8S\u24c9T\u24caU\u24cbV'
+    '\u24ccW\u24cdX\u24ceY\u24cfZ\u24d0a\u24d1b\u24d2c\u24d3d\u24d4e\u24d5f\u24d6g\u24d7h\u24d8i\u24d9j\u24dak\u24dbl'
+    '\u24dcm\u24ddn\u24deo\u24dfp\u24e0q\u24e1r\u24e2s\u24e3t\u24e4u\u24e5v\u24e6w\u24e7x\u24e8y\u24e9z\u24eaO\u2c7cj'
+    '\u2c7dV\u2d51!\u2d6f\u2d61\u2e9f\u6bcd\u2ef3\u9f9f\u2f00\u4e00\u2f01\u4e28\u2f02\u4e36\u2f03\u4e3f\u2f04\u4e59\u2f05\u4e85\u2f06\u4e8c\u2f07\u4ea0\u2f08\u4eba\u2f09\u513f\u2f0a\u5165'
+    '\u2f0b\u516b\u2f0c\u5182\u2f0d\u5196\u2f0e\u51ab\u2f0f\u51e0\u2f10\u51f5\u2f11\u5200\u2f12\u529b\u2f13\u52f9\u2f14\u5315\u2f15\u531a\u2f16\u5338\u2f17\u5341\u2f18\u535c\u2f19\u5369\u2f1a\u5382'
+    '\u2f1b\u53b6\u2f1c\u53c8\u2f1d\u53e3\u2f1e\u56d7\u2f1f\u571f\u2f20\u58eb\u2f21\u5902\u2f22\u590a\u2f23\u5915\u2f24\u5927\u2f25\u5973\u2f26\u5b50\u2f27\u5b80\u2f28\u5bf8\u2f29\u5c0f\u2f2a\u5c22'
+    '\u2f2b\u5c38\u2f2c\u5c6e\u2f2d\u5c71\u2f2e\u5ddb\u2f2f\u5de5\u2f30\u5df1\u2f31\u5dfe\u2f32\u5e72\u2f33\u5e7a\u2f34\u5e7f\u2f35\u5ef4\u2f36\u5efe\u2f37\u5f0b\u2f38\u5f13\u2f39\u5f50\u2f3a\u5f61'
+    '\u2f3b\u5f73\u2f3c\u5fc3\u2f3d\u6208\u2f3e\u6236\u2f3f\u624b\u2f40\u652f\u2f41\u6534\u2f42\u6587\u2f43\u6597\u2f44\u65a4\u2f45\u65b9\u2f46\u65e0\u2f47\u65e5\u2f48\u66f0\u2f49\u6708\u2f4a\u6728'
+    '\u2f4b\u6b20\u2f4c\u6b62\u2f4d\u6b79\u2f4e\u6bb3\u2f4f\u6bcb\u2f50\u6bd4\u2f51\u6bdb\u2f52\u6c0f\u2f53\u6c14\u2f54\u6c34\u2f55\u706b\u2f56\u722a\u2f57\u7236\u2f58\u723b\u2f59\u723f\u2f5a\u7247'
+    '\u2f5b\u7259\u2f5c\u725b\u2f5d\u72ac\u2f5e\u7384\u2f5f\u7389\u2f60\u74dc\u2f61\u74e6\u2f62\u7518\u2f63\u751f\u2f64\u7528\u2f65\u7530\u2f66\u758b\u2f67\u7592\u2f68\u7676\u2f69\u767d\u2f6a\u76ae'
+    '\u2f6b\u76bf\u2f6c\u76ee\u2f6d\u77db\u2f6e\u77e2\u2f6f\u77f3\u2f70\u793a\u2f71\u79b8\u2f72\u79be\u2f73\u7a74\u2f74\u7acb\u2f75\u7af9\u2f76\u7c73\u2f77\u7cf8\u2f78\u7f36\u2f79\u7f51\u2f7a\u7f8a'
+    '\u2f7b\u7fbd\u2f7c\u8001\u2f7d\u800c\u2f7e\u8012\u2f7f\u8033\u2f80\u807f\u2f81\u8089\u2f82\u81e3\u2f83\u81ea\u2f84\u81f3\u2f85\u81fc\u2f86\u820c\u2f87\u821b\u2f88\u821f\u2f89\u826e\u2f8a\u8272'
+    '\u2f8b\u8278\u2f8c\u864d\u2f8d\u866b\u2f8e\u8840\u2f8f\u884c\u2f90\u8863\u2f91\u897e\u2f92\u898b\u2f93\u89d2\u2f94\u8a00\u2f95\u8c37\u2f96\u8c46\u2f97\u8c55\u2f98\u8c78\u2f99\u8c9d\u2f9a\u8d64'
+    '\u2f9b\u8d70\u2f9c\u8db3\u2f9d\u8eab\u2f9e\u8eca\u2f9f\u8f9b\u2fa0\u8fb0\u2fa1\u8fb5\u2fa2\u9091\u2fa3\u9149\u2fa4\u91c6\u2fa5\u91cc\u2fa6\u91d1\u2fa7\u9577\u2fa8\u9580\u2fa9\u961c\u2faa\u96b6'
+    '\u2fab\u96b9\u2fac\u96e8\u2fad\u9751\u2fae\u975e\u2faf\u9762\u2fb0\u9769\u2fb1\u97cb\u2fb2\u97ed\u2fb3\u97f3\u2fb4\u9801\u2fb5\u98a8\u2fb6\u98db\u2fb7\u98df\u2fb8\u9996\u2fb9\u9999\u2fba\u99ac'
+    '\u2fbb\u9aa8\u2fbc\u9ad8\u2fbd\u9adf\u2fbe\u9b25\u2fbf\u9b2f\u2fc0\u9b32\u2fc1\u9b3c\u2fc2\u9b5a\u2fc3\u9ce5\u2fc4\u9e75\u2fc5\u9e7f\u2fc6\u9ea5\u2fc7\u9ebb\u2fc8\u9ec3\u2fc9\u9ecd\u2fca\u9ed1'
+    '\u2fcb\u9ef9\u2fcc\u9efd\u2fcd\u9f0e\u2fce\u9f13\u2fcf\u9f20\u2fd0\u9f3b\u2fd1\u9f4a\u2fd2\u9f52\u2fd3\u9f8d\u2fd4\u9f9c\u2fd5\u9fa0\u3000 \u3036\u3012\u3038\u5341\u3039\u5344\u303a\u5345'
+    '\u3131\u1100\u3132\u1101\u3133\u11aa\u3134\u1102\u3135\u11ac\u3136\u11ad\u3137\u1103\u3138\u1104\u3139\u1105\u313a\u11b0\u313b\u11b1\u313c\u11b2\u313d\u11b3\u313e\u11b4\u313f\u11b5\u3140\u111a'
+    '\u3141\u1106\u3142\u1107\u3143\u1108\u3144\u1121\u3145\u1109\u3146\u110a\u3147\u110b\u3148\u110c\u3149\u110d\u314a\u110e\u314b\u110f\u314c\u1110\u314d\u1111\u314e\u1112\u314f\u1161\u3150\u1162'
+    '\u3151\u1163\u3152\u1164\u3153\u1165\u3154\u1166\u3155\u1167\u3156\u1168\u3157\u1169\u3158\u116a\u3159\u116b\u315a\u116c\u315b\u116d\u315c\u116e\u315d\u116f\u315e\u1170\u315f\u1171\u3160\u1172'
+    '\u3161\u1173\u3162\u1174\u3163\u1175\u3164\u1160\u3165\u1114\u3166\u1115\u3167\u11c7\u3168\u11c8\u3169\u11cc\u316a\u11ce\u316b\u11d3\u316c\u11d7\u316d\u11d9\u316e\u111c\u316f\u11dd\u3170\u11df'
+    '\u3171\u111d\u3172\u111e\u3173\u1120\u3174\u1122\u3175\u1123\u3176\u1127\u3177\u1129\u3178\u112b\u3179\u112c\u317a\u112d\u317b\u112e\u317c\u112f\u317d\u1132\u317e\u1136\u317f\u1140\u3180\u1147'
+    '\u3181\u114c\u3182\u11f1\u3183\u11f2\u3184\u1157\u3185\u1158\u3186\u1159\u3187\u1184\u3188\u1185\u3189\u1188\u318a\u1191\u318b\u1192\u318c\u1194\u318d\u119e\u318e\u11a1\u3192\u4e00\u3193\u4e8c'
+    '\u3194\u4e09\u3195\u56db\u3196\u4e0a\u3197\u4e2d\u3198\u4e0b\u3199\u7532\u319a\u4e59\u319b\u4e19\u319c\u4e01\u319d\u5929\u319e\u5730\u319f\u4eba\u3244\u554f\u3245\u5e7c\u3246\u6587\u3247\u7b8f'
+    '\u3260\u1100\u3261\u1102\u3262\u1103\u3263\u1105\u3264\u1106\u3265\u1107\u3266\u1109\u3267\u110b\u3268\u110c\u3269\u110e\u326a\u110f\u326b\u1110\u326c\u1111\u326d\u1112\u326e\uac00\u326f\ub098'
+    '\u3270\ub2e4\u3271\ub77c\u3272\ub9c8\u3273\ubc14\u3274\uc0ac\u3275\uc544\u3276\uc790\u3277\ucc28\u3278\uce74\u3279\ud0c0\u327a\ud30c\u327b\ud558\u327e\uc6b0\u3280\u4e00\u3281\u4e8c\u3282\u4e09'
+    '\u3283\u56db\u3284\u4e94\u3285\u516d\u3286\u4e03\u3287\u516b\u3288\u4e5d\u3289\u5341\u328a\u6708\u328b\u706b\u328c\u6c34\u328d\u6728\u328e\u91d1\u328f\u571f\u3290\u65e5\u3291\u682a\u3292\u6709'
+    '\u3293\u793e\u3294\u540d\u3295\u7279\u3296\u8ca1\u3297\u795d\u3298\u52b4\u3299\u79d8\u329a\u7537\u329b\u5973\u329c\u9069\u329d\u512a\u329e\u5370\u329f\u6ce8\u32a0\u9805\u32a1\u4f11\u32a2\u5199'
+    '\u32a3\u6b63\u32a4\u4e0a\u32a5\u4e2d\u32a6\u4e0b\u32a7\u5de6\u32a8\u53f3\u32a9\u533b\u32aa\u5b97\u32ab\u5b66\u32ac\u76e3\u32ad\u4f01\u32ae\u8cc7\u32af\u5354\u32b0\u591c\u32d0\u30a2\u32d1\u30a4'
+    '\u32d2\u30a6\u32d3\u30a8\u32d4\u30aa\u32d5\u30ab\u32d6\u30ad\u32d7\u30af\u32d8\u30b1\u32d9\u30b3\u32da\u30b5\u32db\u30b7\u32dc\u30b9\u32dd\u30bb\u32de\u30bd\u32df\u30bf\u32e0\u30c1\u32e1\u30c4'
+    '\u32e2\u30c6\u32e3\u30c8\u32e4\u30ca\u32e5\u30cb\u32e6\u30cc\u32e7\u30cd\u32e8\u30ce\u32e9\u30cf\u32ea\u30d2\u32eb\u30d5\u32ec\u30d8\u32ed\u30db\u32ee\u30de\u32ef\u30df\u32f0\u30e0\u32f1\u30e1'
+    '\u32f2\u30e2\u32f3\u30e4\u32f4\u30e6\u32f5\u30e8\u32f6\u30e9\u32f7\u30ea\u32f8\u30eb\u32f9\u30ec\u32fa\u30ed\u32fb\u30ef\u32fc\u30f0\u32fd\u30f1\u32fe\u30f2\ua4d0B\ua4d1P\ua4d3D'
+    '\ua4d4T\ua4d6G\ua4d7K\ua4d9J\ua4daC\ua4dcZ\ua4ddF\ua4dfM\ua4e0N\ua4e1L\ua4e2S\ua4e3R\ua4e6V\ua4e7H\ua4eaW\ua4ebX'
+    '\ua4ecY\ua4eeA\ua4f0E\ua4f2l\ua4f3O\ua4f4U\ua69c\u044a\ua69d\u044c\ua770\ua76f\ua7f2C\ua7f3F\ua7f4Q\ua7f8\u0126\ua7f9\u0153\uab5c\ua727\uab5d\uab37'
+    '\uab5e\u026b\uab5f\uab52\uab69\u028d\uf900\u8c48\uf901\u66f4\uf902\u8eca\uf903\u8cc8\uf904\u6ed1\uf905\u4e32\uf906\u53e5\uf907\u9f9c\uf908\u9f9c\uf909\u5951\uf90a\u91d1\uf90b\u5587\uf90c\u5948'
+    '\uf90d\u61f6\uf90e\u7669\uf90f\u7f85\uf910\u863f\uf911\u87ba\uf912\u88f8\uf913\u908f\uf914\u6a02\uf915\u6d1b\uf916\u70d9\uf917\u73de\uf918\u843d\uf919\u916a\uf91a\u99f1\uf91b\u4e82\uf91c\u5375'
+    '\uf91d\u6b04\uf91e\u721b\uf91f\u862d\uf920\u9e1e\uf921\u5d50\uf922\u6feb\uf923\u85cd\uf924\u8964\uf925\u62c9\uf926\u81d8\uf927\u881f\uf928\u5eca\uf929\u6717\uf92a\u6d6a\uf92b\u72fc\uf92c\u90ce'
+    '\uf92d\u4f86\uf92e\u51b7\uf92f\u52de\uf930\u64c4\uf931\u6ad3\uf932\u7210\uf933\u76e7\uf934\u8001\uf935\u8606\uf936\u865c\uf937\u8def\uf938\u9732\uf939\u9b6f\uf93a\u9dfa\uf93b\u788c\uf93c\u797f'
+    '\uf93d\u7da0\uf93e\u83c9\uf93f\u9304\uf940\u9e7f\uf941\u8ad6\uf942\u58df\uf943\u5f04\uf944\u7c60\uf945\u807e\uf946\u7262\uf947\u78ca\uf948\u8cc2\uf949\u96f7\uf94a\u58d8\uf94b\u5c62\uf94c\u6a13'
+    '\uf94d\u6dda\uf94e\u6f0f\uf94f\u7d2f\uf950\u7e37\uf951\u964b\uf952\u52d2\uf953\u808b\uf954\u51dc\uf955\u51cc\uf956\u7a1c\uf957\u7dbe\uf958\u83f1\uf959\u9675\uf95a\u8b80\uf95b\u62cf\uf95c\u6a02'
+    '\uf95d\u8afe\uf95e\u4e39\uf95f\u5be7\uf960\u6012\uf961\u7387\uf962\u7570\uf963\u5317\uf964\u78fb\uf965\u4fbf\uf966\u5fa9\uf967\u4e0d\uf968\u6ccc\uf969\u6578\uf96a\u7d22\uf96b\u53c3\uf96c\u585e'
+    '\uf96d\u7701\uf96e\u8449\uf96f\u8aaa\uf970\u6bba\uf971\u8fb0\uf972\u6c88\uf973\u62fe\uf974\u82e5\uf975\u63a0\uf976\u7565\uf977\u4eae\uf978\u5169\uf979\u51c9\uf97a\u6881\uf97b\u7ce7\uf97c\u826f'
+    '\uf97d\u8ad2\uf97e\u91cf\uf97f\u52f5\uf980\u5442\uf981\u5973\uf982\u5eec\uf983\u65c5\uf984\u6ffe\uf985\u792a\uf986\u95ad\uf987\u9a6a\uf988\u9e97\uf989\u9ece\uf98a\u529b\uf98b\u66c6\uf98c\u6b77'
+    '\uf98d\u8f62\uf98e\u5e74\uf98f\u6190\uf990\u6200\uf991\u649a\uf992\u6f23\uf993\u7149\uf994\u7489\uf995\u79ca\uf996\u7df4\uf997\u806f\uf998\u8f26\uf999\u84ee\uf99a\u9023\uf99b\u934a\uf99c\u5217'
+    '\uf99d\u52a3\uf99e\u54bd\uf99f\u70c8\uf9a0\u88c2\uf9a1\u8aaa\uf9a2\u5ec9\uf9a3\u5ff5\uf9a4\u637b\uf9a5\u6bae\uf9a6\u7c3e\uf9a7\u7375\uf9a8\u4ee4\uf9a9\u56f9\uf9aa\u5be7\uf9ab\u5dba\uf9ac\u601c'
+    '\uf9ad\u73b2\uf9ae\u7469\uf9af\u7f9a\uf9b0\u8046\uf9b1\u9234\uf9b2\u96f6\uf9b3\u9748\uf9b4\u9818\uf9b5\u4f8b\uf9b6\u79ae\uf9b7\u91b4\uf9b8\u96b8\uf9b9\u60e1\uf9ba\u4e86\uf9bb\u50da\uf9bc\u5bee'
+    '\uf9bd\u5c3f\uf9be\u6599\uf9bf\u6a02\uf9c0\u71ce\uf9c1\u7642\uf9c2\u84fc\uf9c3\u907c\uf9c4\u9f8d\uf9c5\u6688\uf9c6\u962e\uf9c7\u5289\uf9c8\u677b\uf9c9\u67f3\uf9ca\u6d41\uf9cb\u6e9c\uf9cc\u7409'
+    '\uf9cd\u7559\uf9ce\u786b\uf9cf\u7d10\uf9d0\u985e\uf9d1\u516d\uf9d2\u622e\uf9d3\u9678\uf9d4\u502b\uf9d5\u5d19\uf9d6\u6dea\uf9d7\u8f2a\uf9d8\u5f8b\uf9d9\u6144\uf9da\u6817\uf9db\u7387\uf9dc\u9686'
+    '\uf9dd\u5229\uf9de\u540f\uf9df\u5c65\uf9e0\u6613\uf9e1\u674e\uf9e2\u68a8\uf9e3\u6ce5\uf9e4\u7406\uf9e5\u75e2\uf9e6\u7f79\uf9e7\u88cf\uf9e8\u88e1\uf9e9\u91cc\uf9ea\u96e2\uf9eb\u533f\uf9ec\u6eba'
+    '\uf9ed\u541d\uf9ee\u71d0\uf9ef\u7498\uf9f0\u85fa\uf9f1\u96a3\uf9f2\u9c57\uf9f3\u9e9f\uf9f4\u6797\uf9f5\u6dcb\uf9f6\u81e8\uf9f7\u7acb\uf9f8\u7b20\uf9f9\u7c92\uf9fa\u72c0\uf9fb\u7099\uf9fc\u8b58'
+    '\uf9fd\u4ec0\uf9fe\u8336\uf9ff\u523a\ufa00\u5207\ufa01\u5ea6\ufa02\u62d3\ufa03\u7cd6\ufa04\u5b85\ufa05\u6d1e\ufa06\u66b4\ufa07\u8f3b\ufa08\u884c\ufa09\u964d\ufa0a\u898b\ufa0b\u5ed3\ufa0c\u5140'
+    '\ufa0d\u55c0\ufa10\u585a\ufa12\u6674\ufa15\u51de\ufa16\u732a\ufa17\u76ca\ufa18\u793c\ufa19\u795e\ufa1a\u7965\ufa1b\u798f\ufa1c\u9756\ufa1d\u7cbe\ufa1e\u7fbd\ufa20\u8612\ufa22\u8af8\ufa25\u9038'
+    '\ufa26\u90fd\ufa2a\u98ef\ufa2b\u98fc\ufa2c\u9928\ufa2d\u9db4\ufa2e\u90de\ufa2f\u96b7\ufa30\u4fae\ufa31\u50e7\ufa32\u514d\ufa33\u52c9\ufa34\u52e4\ufa35\u5351\ufa36\u559d\ufa37\u5606\ufa38\u5668'
+    '\ufa39\u5840\ufa3a\u58a8\ufa3b\u5c64\ufa3c\u5c6e\ufa3d\u6094\ufa3e\u6168\ufa3f\u618e\ufa40\u61f2\ufa41\u654f\ufa42\u65e2\ufa43\u6691\ufa44\u6885\ufa45\u6d77\ufa46\u6e1a\ufa47\u6f22\ufa48\u716e'
+    '\ufa49\u722b\ufa4a\u7422\ufa4b\u7891\ufa4c\u793e\ufa4d\u7949\ufa4e\u7948\ufa4f\u7950\ufa50\u7956\ufa51\u795d\ufa52\u798d\ufa53\u798e\ufa54\u7a40\ufa55\u7a81\ufa56\u7bc0\ufa57\u7df4\ufa58\u7e09'
+    '\ufa59\u7e41\ufa5a\u7f72\ufa5b\u8005\ufa5c\u81ed\ufa5d\u8279\ufa5e\u8279\ufa5f\u8457\ufa60\u8910\ufa61\u8996\ufa62\u8b01\ufa63\u8b39\ufa64\u8cd3\ufa65\u8d08\ufa66\u8fb6\ufa67\u9038\ufa68\u96e3'
+    '\ufa69\u97ff\ufa6a\u983b\ufa6b\u6075\ufa6c\U000242ee\ufa6d\u8218\ufa70\u4e26\ufa71\u51b5\ufa72\u5168\ufa73\u4f80\ufa74\u5145\ufa75\u5180\ufa76\u52c7\ufa77\u52fa\ufa78\u559d\ufa79\u5555\ufa7a\u5599'
+    '\ufa7b\u55e2\ufa7c\u585a\ufa7d\u58b3\ufa7e\u5944\ufa7f\u5954\ufa80\u5a62\ufa81\u5b28\ufa82\u5ed2\ufa83\u5ed9\ufa84\u5f69\ufa85\u5fad\ufa86\u60d8\ufa87\u614e\ufa88\u6108\ufa89\u618e\ufa8a\u6160'
+    '\ufa8b\u61f2\ufa8c\u6234\ufa8d\u63c4\ufa8e\u641c\ufa8f\u6452\ufa90\u6556\ufa91\u6674\ufa92\u6717\ufa93\u671b\ufa94\u6756\ufa95\u6b79\ufa96\u6bba\ufa97\u6d41\ufa98\u6edb\ufa99\u6ecb\ufa9a\u6f22'
+    '\ufa9b\u701e\ufa9c\u716e\ufa9d\u77a7\ufa9e\u7235\ufa9f\u72af\ufaa0\u732a\ufaa1\u7471\ufaa2\u7506\ufaa3\u753b\ufaa4\u761d\ufaa5\u761f\ufaa6\u76ca\ufaa7\u76db\ufaa8\u76f4\ufaa9\u774a\ufaaa\u7740'
+    '\ufaab\u78cc\ufaac\u7ab1\ufaad\u7bc0\ufaae\u7c7b\ufaaf\u7d5b\ufab0\u7df4\ufab1\u7f3e\ufab2\u8005\ufab3\u8352\ufab4\u83ef\ufab5\u8779\ufab6\u8941\ufab7\u8986\ufab8\u8996\ufab9\u8abf\ufaba\u8af8'
+    '\ufabb\u8acb\ufabc\u8b01\ufabd\u8afe\ufabe\u8aed\ufabf\u8b39\ufac0\u8b8a\ufac1\u8d08\ufac2\u8f38\ufac3\u9072\ufac4\u9199\ufac5\u9276\ufac6\u967c\ufac7\u96e3\ufac8\u9756\ufac9\u97db\ufaca\u97ff'
+    '\ufacb\u980b\ufacc\u983b\ufacd\u9b12\uface\u9f9c\ufacf\U0002284a\ufad0\U00022844\ufad1\U000233d5\ufad2\u3b9d\ufad3\u4018\ufad4\u4039\ufad5\U00025249\ufad6\U00025cd0\ufad7\U00027ed3\ufad8\u9f43\ufad9\u9f8e\ufb20\u05e2'
+    '\ufb21\u05d0\ufb22\u05d3\ufb23\u05d4\ufb24\u05db\ufb25\u05dc\ufb26\u05dd\ufb27\u05e8\ufb28\u05ea\ufb29+\ufb50\u0671\ufb51\u0671\ufb52\u067b\ufb53\u067b\ufb54\u067b\ufb55\u067b\ufb56\u067e'
+    '\ufb57\u067e\ufb58\u067e\ufb59\u067e\ufb5a\u0680\ufb5b\u0680\ufb5c\u0680\ufb5d\u0680\ufb5e\u067a\ufb5f\u067a\ufb60\u067a\ufb61\u067a\ufb62\u067f\ufb63\u067f\ufb64\u067f\ufb65\u067f\ufb66\u0679'
+    '\ufb67\u0679\ufb68\u0679\ufb69\u0679\ufb6a\u06a4\ufb6b\u06a4\ufb6c\u06a4\ufb6d\u06a4\ufb6e\u06a6\ufb6f\u06a6\ufb70\u06a6\ufb71\u06a6\ufb72\u0684\ufb73\u0684\ufb74\u0684\ufb75\u0684\ufb76\u0683'
+    '\ufb77\u0683\ufb78\u0683\ufb79\u0683\ufb7a\u0686\ufb7b\u0686\ufb7c\u0686\ufb7d\u0686\ufb7e\u0687\ufb7f\u0687\ufb80\u0687\ufb81\u0687\ufb82\u068d\ufb83\u068d\ufb84\u068c\ufb85\u068c\ufb86\u068e'
+    '\ufb87\u068e\ufb88\u0688\ufb89\u0688\ufb8a\u0698\ufb8b\u0698\ufb8c\u0691\ufb8d\u0691\ufb8e\u06a9\ufb8f\u06a9\ufb90\u06a9\ufb91\u06a9\ufb92\u06af\ufb93\u06af\ufb94\u06af\ufb95\u06af\ufb96\u06b3'
+    '\ufb97\u06b3\ufb98\u06b3\ufb99\u06b3\ufb9a\u06b1\ufb9b\u06b1\ufb9c\u06b1\ufb9d\u06b1\ufb9e\u06ba\ufb9f\u06ba\ufba0\u06bb\ufba1\u06bb\ufba2\u06bb\ufba3\u06bb\ufba4\u06c0\ufba5\u06c0\ufba6\u06c1'
+    '\ufba7\u06c1\ufba8\u06c1\ufba9\u06c1\ufbaa\u06be\ufbab\u06be\ufbac\u06be\ufbad\u06be\ufbae\u06d2\ufbaf\u06d2\ufbb0\u06d3\ufbb1\u06d3\ufbd3\u06ad\ufbd4\u06ad\ufbd5\u06ad\ufbd6\u06ad\ufbd7\u06c7'
+    '\ufbd8\u06c7\ufbd9\u06c6\ufbda\u06c6\ufbdb\u06c8\ufbdc\u06c8\ufbde\u06cb\ufbdf\u06cb\ufbe0\u06c5\ufbe1\u06c5\ufbe2\u06c9\ufbe3\u06c9\ufbe4\u06d0\ufbe5\u06d0\ufbe6\u06d0\ufbe7\u06d0\ufbe8\u0649'
+    '\ufbe9\u0649\ufbfc\u06cc\ufbfd\u06cc\ufbfe\u06cc\ufbff\u06cc\ufe10,\ufe11\u3001\ufe12\u3002\ufe13:\ufe14;\ufe15!\ufe16?\ufe17\u3016\ufe18\u3017\ufe31\u2014\ufe32\u2013'
+    '\ufe33_\ufe34_\ufe35(\ufe36)\ufe37{\ufe38}\ufe39\u3014\ufe3a\u3015\ufe3b\u3010\ufe3c\u3011\ufe3d\u300a\ufe3e\u300b\ufe3f\u3008\ufe40\u3009\ufe41\u300c\ufe42\u300d'
+    '\ufe43\u300e\ufe44\u300f\ufe47[\ufe48]\ufe4d_\ufe4e_\ufe4f_\ufe50,\ufe51\u3001\ufe52.\ufe54;\ufe55:\ufe56?\ufe57!\ufe58\u2014\ufe59('
+    '\ufe5a)\ufe5b{\ufe5c}\ufe5d\u3014\ufe5e\u3015\ufe5f#\ufe60&\ufe61*\ufe62+\ufe63-\ufe64<\ufe65>\ufe66=\ufe68\\\ufe69$\ufe6a%'
+    '\ufe6b@\ufe80\u0621\ufe81\u0622\ufe82\u0622\ufe83\u0623\ufe84\u0623\ufe85\u0624\ufe86\u0624\ufe87\u0625\ufe88\u0625\ufe89\u0626\ufe8a\u0626\ufe8b\u0626\ufe8c\u0626\ufe8d\u0627\ufe8e\u0627'
+    '\ufe8f\u0628\ufe90\u0628\ufe91\u0628\ufe92\u0628\ufe93\u0629\ufe94\u0629\ufe95\u062a\ufe96\u062a\ufe97\u062a\ufe98\u062a\ufe99\u062b\ufe9a\u062b\ufe9b\u062b\ufe9c\u062b\ufe9d\u062c\ufe9e\u062c'
+    '\ufe9f\u062c\ufea0\u062c\ufea1\u062d\ufea2\u062d\ufea3\u062d\ufea4\u062d\ufea5\u062e\ufea6\u062e\ufea7\u062e\ufea8\u062e\ufea9\u062f\ufeaa\u062f\ufeab\u0630\ufeac\u0630\ufead\u0631\ufeae\u0631'
+    '\ufeaf\u0632\ufeb0\u0632\ufeb1\u0633\ufeb2\u0633\ufeb3\u0633\ufeb4\u0633\ufeb5\u0634\ufeb6\u0634\ufeb7\u0634\ufeb8\u0634\ufeb9\u0635\ufeba\u0635\ufebb\u0635\ufebc\u0635\ufebd\u0636\ufebe\u0636'
+    '\ufebf\u0636\ufec0\u0636\ufec1\u0637\ufec2\u0637\ufec3\u0637\ufec4\u0637\ufec5\u0638\ufec6\u0638\ufec7\u0638\ufec8\u0638\ufec9\u0639\ufeca\u0639\ufecb\u0639\ufecc\u0639\ufecd\u063a\ufece\u063a'
+    '\ufecf\u063a\ufed0\u063a\ufed1\u0641\ufed2\u0641\ufed3\u0641\ufed4\u0641\ufed5\u0642\ufed6\u0642\ufed7\u0642\ufed8\u0642\ufed9\u0643\ufeda\u0643\ufedb\u0643\ufedc\u0643\ufedd\u0644\ufede\u0644'
+    '\ufedf\u0644\ufee0\u0644\ufee1\u0645\ufee2\u0645\ufee3\u0645\ufee4\u0645\ufee5\u0646\ufee6\u0646\ufee7\u0646\ufee8\u0646\ufee9\u0647\ufeea\u0647\ufeeb\u0647\ufeec\u0647\ufeed\u0648\ufeee\u0648'
+    '\ufeef\u0649\ufef0\u0649\ufef1\u064a\ufef2\u064a\ufef3\u064a\ufef4\u064a\uff01!\uff02"\uff03#\uff04$\uff05%\uff06&\uff07\'\uff08(\uff09)\uff0a*'
+    '\uff0b+\uff0c,\uff0d-\uff0e.\uff0f/\uff10O\uff11l\uff122\uff133\uff144\uff155\uff166\uff177\uff188\uff199\uff1a:'
+    '\uff1b;\uff1c<\uff1d=\uff1e>\uff1f?\uff20@\uff21A\uff22B\uff23C\uff24D\uff25E\uff26F\uff27G\uff28H\uff29l\uff2aJ'
+    '\uff2bK\uff2cL\uff2dM\uff2eN\uff2fO\uff30P\uff31Q\uff32R\uff33S\uff34T\uff35U\uff36V\uff37W\uff38X\uff39Y\uff3aZ'
+    '\uff3b[\uff3c\\\uff3d]\uff3e^\uff3f_\uff40`\uff41a\uff42b\uff43c\uff44d\uff45e\uff46f\uff47g\uff48h\uff49i\uff4aj'
+    '\uff4bk\uff4cl\uff4dm\uff4en\uff4fo\uff50p\uff51q\uff52r\uff53s\uff54t\uff55u\uff56v\uff57w\uff58x\uff59y\uff5az'
+    '\uff5b{\uff5cl\uff5d}\uff5e~\uff5f\u2985\uff60\u2986\uff61\u3002\uff62\u300c\uff63\u300d\uff64\u3001\uff65\u30fb\uff66\u30f2\uff67\u30a1\uff68\u30a3\uff69\u30a5\uff6a\u30a7'
+    '\uff6b\u30a9\uff6c\u30e3\uff6d\u30e5\uff6e\u30e7\uff6f\u30c3\uff70\u30fc\uff71\u30a2\uff72\u30a4\uff73\u30a6\uff74\u30a8\uff75\u30aa\uff76\u30ab\uff77\u30ad\uff78\u30af\uff79\u30b1\uff7a\u30b3'
+    '\uff7b\u30b5\uff7c\u30b7\uff7d\u30b9\uff7e\u30bb\uff7f\u30bd\uff80\u30bf\uff81\u30c1\uff82\u30c4\uff83\u30c6\uff84\u30c8\uff85\u30ca\uff86\u30cb\uff87\u30cc\uff88\u30cd\uff89\u30ce\uff8a\u30cf'
+    '\uff8b\u30d2\uff8c\u30d5\uff8d\u30d8\uff8e\u30db\uff8f\u30de\uff90\u30df\uff91\u30e0\uff92\u30e1\uff93\u30e2\uff94\u30e4\uff95\u30e6\uff96\u30e8\uff97\u30e9\uff98\u30ea\uff99\u30eb\uff9a\u30ec'
+    '\uff9b\u30ed\uff9c\u30ef\uff9d\u30f3\uff9e\u3099\uff9f\u309a\uffa0\u1160\uffa1\u1100\uffa2\u1101\uffa3\u11aa\uffa4\u1102\uffa5\u11ac\uffa6\u11ad\uffa7\u1103\uffa8\u1104\uffa9\u1105\uffaa\u11b0'
+    '\uffab\u11b1\uffac\u11b2\uffad\u11b3\uffae\u11b4\uffaf\u11b5\uffb0\u111a\uffb1\u1106\uffb2\u1107\uffb3\u1108\uffb4\u1121\uffb5\u1109\uffb6\u110a\uffb7\u110b\uffb8\u110c\uffb9\u110d\uffba\u110e'
+    '\uffbb\u110f\uffbc\u1110\uffbd\u1111\uffbe\u1112\uffc2\u1161\uffc3\u1162\uffc4\u1163\uffc5\u1164\uffc6\u1165\uffc7\u1166\uffca\u1167\uffcb\u1168\uffcc\u1169\uffcd\u116a\uffce\u116b\uffcf\u116c'
+    '\uffd2\u116d\uffd3\u116e\uffd4\u116f\uffd5\u1170\uffd6\u1171\uffd7\u1172\uffda\u1173\uffdb\u1174\uffdc\u1175\uffe0\xa2\uffe1\xa3\uffe2\xac\uffe4\xa6\uffe5\xa5\uffe6\u20a9\uffe8\u2502'
+    '\uffe9\u2190\uffea\u2191\uffeb\u2192\uffec\u2193\uffed\u25a0\uffee\u25cb\U00010781\u02d0\U00010782\u02d1\U00010783\xe6\U00010784\u0299\U00010785\u0253\U00010787\u02a3\U00010788\uab66\U00010789\u02a5\U0001078a\u02a4\U0001078b\u0256'
+    '\U0001078c\u0257\U0001078d\u1d91\U0001078e\u0258\U0001078f\u025e\U00010790\u02a9\U00010791\u0264\U00010792\u0262\U00010793\u0260\U00010794\u029b\U00010795\u0127\U00010796\u029c\U00010797\u0267\U00010798\u0284\U00010799\u02aa\U0001079a\u02ab\U0001079b\u026c'
+    '\U0001079c\U0001df04\U0001079d\ua78e\U0001079e\u026e\U0001079f\U0001df05\U000107a0\u028e\U000107a1\U0001df06\U000107a2\xf8\U000107a3\u0276\U000107a4\u0277\U000107a5q\U000107a6\u027a\U000107a7\U0001df08\U000107a8\u027d\U000107a9\u027e\U000107aa\u0280\U000107ab\u02a8'
+    '\U000107ac\u02a6\U000107ad\uab67\U000107ae\u02a7\U000107af\u0288\U000107b0\u2c71\U000107b2\u028f\U000107b3\u02a1\U000107b4\u02a2\U000107b5\u0298\U000107b6l\U000107b7\u01c1\U000107b8\u01c2\U000107b9\U0001df0a\U000107ba\U0001df1e\U0001d400A\U0001d401B'
+    '\U0001d402C\U0001d403D\U0001d404E\U0001d405F\U0001d406G\U0001d407H\U0001d408l\U0001d409J\U0001d40aK\U0001d40bL\U0001d40cM\U0001d40dN\U0001d40eO\U0001d40fP\U0001d410Q\U0001d411R'
+    '\U0001d412S\U0001d413T\U0001d414U\U0001d415V\U0001d416W\U0001d417X\U0001d418Y\U0001d419Z\U0001d41aa\U0001d41bb\U0001d41cc\U0001d41dd\U0001d41ee\U0001d41ff\U0001d420g\U0001d421h'
+    '\U0001d422i\U0001d423j\U0001d424k\U0001d425l\U0001d426m\U0001d427n\U0001d428o\U0001d429p\U0001d42aq\U0001d42br\U0001d42cs\U0001d42dt\U0001d42eu\U0001d42fv\U0001d430w\U0001d431x'
+    '\U0001d432y\U0001d433z\U0001d434A\U0001d435B\U0001d436C\U0001d437D\U0001d438E\U0001d439F\U0001d43aG\U0001d43bH\U0001d43cl\U0001d43dJ\U0001d43eK\U0001d43fL\U0001d440M\U0001d441N'
+    '\U0001d442O\U0001d443P\U0001d444Q\U0001d445R\U0001d446S\U0001d447T\U0001d448U\U0001d449V\U0001d44aW\U0001d44bX\U0001d44cY\U0001d44dZ\U0001d44ea\U0001d44fb\U0001d450c\U0001d451d'
+    '\U0001d452e\U0001d453f\U0001d454g\U0001d456i\U0001d457j\U0001d458k\U0001d459l\U0001d45am\U0001d45bn\U0001d45co\U0001d45dp\U0001d45eq\U0001d45fr\U0001d460s\U0001d461t\U0001d462u'
+    '\U0001d463v\U0001d464w\U0001d465x\U0001d466y\U0001d467z\U0001d468A\U0001d469B\U0001d46aC\U0001d46bD\U0001d46cE\U0001d46dF\U0001d46eG\U0001d46fH\U0001d470l\U0001d471J\U0001d472K'
+    '\U0001d473L\U0001d474M\U0001d475N\U0001d476O\U0001d477P\U0001d478Q\U0001d479R\U0001d47aS\U0001d47bT\U0001d47cU\U0001d47dV\U0001d47eW\U0001d47fX\U0001d480Y\U0001d481Z\U0001d482a'
+    '\U0001d483b\U0001d484c\U0001d485d\U0001d486e\U0001d487f\U0001d488g\U0001d489h\U0001d48ai\U0001d48bj\U0001d48ck\U0001d48dl\U0001d48em\U0001d48fn\U0001d490o\U0001d491p\U0001d492q'
+    '\U0001d493r\U0001d494s\U0001d495t\U0001d496u\U0001d497v\U0001d498w\U0001d499x\U0001d49ay\U0001d49bz\U0001d49cA\U0001d49eC\U0001d49fD\U0001d4a2G\U0001d4a5J\U0001d4a6K\U0001d4a9N'
+    '\U0001d4aaO\U0001d4abP\U0001d4acQ\U0001d4aeS\U0001d4afT\U0001d4b0U\U0001d4b1V\U0001d4b2W\U0001d4b3X\U0001d4b4Y\U0001d4b5Z\U0001d4b6a\U0001d4b7b\U0001d4b8c\U0001d4b9d\U0001d4bbf'
+    '\U0001d4bdh\U0001d4bei\U0001d4bfj\U0001d4c0k\U0001d4c1l\U0001d4c2m\U0001d4c3n\U0001d4c5p\U0001d4c6q\U0001d4c7r\U0001d4c8s\U0001d4c9t\U0001d4cau\U0001d4cbv\U0001d4ccw\U0001d4cdx'
+    '\U0001d4cey\U0001d4cfz\U0001d4d0A\U0001d4d1B\U0001d4d2C\U0001d4d3D\U0001d4d4E\U0001d4d5F\U0001d4d6G\U0001d4d7H\U0001d4d8l\U0001d4d9J\U0001d4daK\U0001d4dbL\U0001d4dcM\U0001d4ddN'
+    '\U0001d4deO\U0001d4dfP\U0001d4e0Q\U0001d4e1R\U0001d4e2S\U0001d4e3T\U0001d4e4U\U0001d4e5V\U0001d4e6W\U0001d4e7X\U0001d4e8Y\U0001d4e9Z\U0001d4eaa\U0001d4ebb\U0001d4ecc\U0001d4edd'
+    '\U0001d4eee\U0001d4eff\U0001d4f0g\U0001d4f1h\U0001d4f2i\U0001d4f3j\U0001d4f4k\U0001d4f5l\U0001d4f6m\U0001d4f7n\U0001d4f8o\U0001d4f9p\U0001d4faq\U0001d4fbr\U0001d4fcs\U0001d4fdt'
+    '\U0001d4feu\U0001d4ffv\U0001d500w\U0001d501x\U0001d502y\U0001d503z\U0001d504A\U0001d505B\U0001d507D\U0001d508E\U0001d509F\U0001d50aG\U0001d50dJ\U0001d50eK\U0001d50fL\U0001d510M'
+    '\U0001d511N\U0001d512O\U0001d513P\U0001d514Q\U0001d516S\U0001d517T\U0001d518U\U0001d519V\U0001d51aW\U0001d51bX\U0001d51cY\U0001d51ea\U0001d51fb\U0001d520c\U0001d521d\U0001d522e'
+    '\U0001d523f\U0001d524g\U0001d525h\U0001d526i\U0001d527j\U0001d528k\U0001d529l\U0001d52am\U0001d52bn\U0001d52co\U0001d52dp\U0001d52eq\U0001d52fr\U0001d530s\U0001d531t\U0001d532u'
+    '\U0001d533v\U0001d534w\U0001d535x\U0001d536y\U0001d537z\U0001d538A\U0001d539B\U0001d53bD\U0001d53cE\U0001d53dF\U0001d53eG\U0001d540l\U0001d541J\U0001d542K\U0001d543L\U0001d544M'
+    '\U0001d546O\U0001d54aS\U0001d54bT\U0001d54cU\U0001d54dV\U0001d54eW\U0001d54fX\U0001d550Y\U0001d552a\U0001d553b\U0001d554c\U0001d555d\U0001d556e\U0001d557f\U0001d558g\U0001d559h'
+    '\U0001d55ai\U0001d55bj\U0001d55ck\U0001d55dl\U0001d55em\U0001d55fn\U0001d560o\U0001d561p\U0001d562q\U0001d563r\U0001d564s\U0001d565t\U0001d566u\U0001d567v\U0001d568w\U0001d569x'
+    '\U0001d56ay\U0001d56bz\U0001d56cA\U0001d56dB\U0001d56eC\U0001d56fD\U0001d570E\U0001d571F\U0001d572G\U0001d573H\U0001d574l\U0001d575J\U0001d576K\U0001d577L\U0001d578M\U0001d579N'
+    '\U0001d57aO\U0001d57bP\U0001d57cQ\U0001d57dR\U0001d57eS\U0001d57fT\U0001d580U\U0001d581V\U0001d582W\U0001d583X\U0001d584Y\U0001d585Z\U0001d586a\U0001d587b\U0001d588c\U0001d589d'
+    '\U0001d58ae\U0001d58bf\U0001d58cg\U0001d58dh\U0001d58ei\U0001d58fj\U0001d590k\U0001d591l\U0001d592m\U0001d593n\U0001d594o\U0001d595p\U0001d596q\U0001d597r\U0001d598s\U0001d599t'
+    '\U0001d59au\U0001d59bv\U0001d59cw\U0001d59dx\U0001d59ey\U0001d59fz\U0001d5a0A\U0001d5a1B\U0001d5a2C\U0001d5a3D\U0001d5a4E\U0001d5a5F\U0001d5a6G\U0001d5a7H\U0001d5a8l\U0001d5a9J'
+    '\U0001d5aaK\U0001d5abL\U0001d5acM\U0001d5adN\U0001d5aeO\U0001d5afP\U0001d5b0Q\U0001d5b1R\U0001d5b2S\U0001d5b3T\U0001d5b4U\U0001d5b5V\U0001d5b6W\U0001d5b7X\U0001d5b8Y\U0001d5b9Z'
+    '\U0001d5baa\U0001d5bbb\U0001d5bcc\U0001d5bdd\U0001d5bee\U0001d5bff\U0001d5c0g\U0001d5c1h\U0001d5c2i\U0001d5c3j\U0001d5c4k\U0001d5c5l\U0001d5c6m\U0001d5c7n\U0001d5c8o\U0001d5c9p'
+    '\U0001d5caq\U0001d5cbr\U0001d5ccs\U0001d5cdt\U0001d5ceu\U0001d5cfv\U0001d5d0w\U0001d5d1x\U0001d5d2y\U0001d5d3z\U0001d5d4A\U0001d5d5B\U0001d5d6C\U0001d5d7D\U0001d5d8E\U0001d5d9F'
+    '\U0001d5daG\U0001d5dbH\U0001d5dcl\U0001d5ddJ\U0001d5deK\U0001d5dfL\U0001d5e0M\U0001d5e1N\U0001d5e2O\U0001d5e3P\U0001d5e4Q\U0001d5e5R\U0001d5e6S\U0001d5e7T\U0001d5e8U\U0001d5e9V'
+    '\U0001d5eaW\U0001d5ebX\U0001d5ecY\U0001d5edZ\U0001d5eea\U0001d5efb\U0001d5f0c\U0001d5f1d\U0001d5f2e\U0001d5f3f\U0001d5f4g\U0001d5f5h\U0001d5f6i\U0001d5f7j\U0001d5f8k\U0001d5f9l'
+    '\U0001d5fam\U0001d5fbn\U0001d5fco\U0001d5fdp\U0001d5feq\U0001d5ffr\U0001d600s\U0001d601t\U0001d602u\U0001d603v\U0001d604w\U0001d605x\U0001d606y\U0001d607z\U0001d608A\U0001d609B'
+    '\U0001d60aC\U0001d60bD\U0001d60cE\U0001d60dF\U0001d60eG\U0001d60fH\U0001d610l\U0001d611J\U0001d612K\U0001d613L\U0001d614M\U0001d615N\U0001d616O\U0001d617P\U0001d618Q\U0001d619R'
+    '\U0001d61aS\U0001d61bT\U0001d61cU\U0001d61dV\U0001d61eW\U0001d61fX\U0001d620Y\U0001d621Z\U0001d622a\U0001d623b\U0001d624c\U0001d625d\U0001d626e\U0001d627f\U0001d628g\U0001d629h'
+    '\U0001d62ai\U0001d62bj\U0001d62ck\U0001d62dl\U0001d62em\U0001d62fn\U0001d630o\U0001d631p\U0001d632q\U0001d633r\U0001d634s\U0001d635t\U0001d636u\U0001d637v\U0001d638w\U0001d639x'
+    '\U0001d63ay\U0001d63bz\U0001d63cA\U0001d63dB\U0001d63eC\U0001d63fD\U0001d640E\U0001d641F\U0001d642G\U0001d643H\U0001d644l\U0001d645J\U0001d646K\U0001d647L\U0001d648M\U0001d649N'
+    '\U0001d64aO\U0001d64bP\U0001d64cQ\U0001d64dR\U0001d64eS\U0001d64fT\U0001d650U\U0001d651V\U0001d652W\U0001d653X\U0001d654Y\U0001d655Z\U0001d656a\U0001d657b\U0001d658c\U0001d659d'
+    '\U0001d65ae\U0001d65bf\U0001d65cg\U0001d65dh\U0001d65ei\U0001d65fj\U0001d660k\U0001d661l\U0001d662m\U0001d663n\U0001d664o\U0001d665p\U0001d666q\U0001d667r\U0001d668s\U0001d669t'
+    '\U0001d66au\U0001d66bv\U0001d66cw\U0001d66dx\U0001d66ey\U0001d66fz\U0001d670A\U0001d671B\U0001d672C\U0001d673D\U0001d674E\U0001d675F\U0001d676G\U0001d677H\U0001d678l\U0001d679J'
+    '\U0001d67aK\U0001d67bL\U0001d67cM\U0001d67dN\U0001d67eO\U0001d67fP\U0001d680Q\U0001d681R\U0001d682S\U0001d683T\U0001d684U\U0001d685V\U0001d686W\U0001d687X\U0001d688Y\U0001d689Z'
+    '\U0001d68aa\U0001d68bb\U0001d68cc\U0001d68dd\U0001d68ee\U0001d68ff\U0001d690g\U0001d691h\U0001d692i\U0001d693j\U0001d694k\U0001d695l\U0001d696m\U0001d697n\U0001d698o\U0001d699p'
+    '\U0001d69aq\U0001d69br\U0001d69cs\U0001d69dt\U0001d69eu\U0001d69fv\U0001d6a0w\U0001d6a1x\U0001d6a2y\U0001d6a3z\U0001d6a4i\U0001d6a5j\U0001d6a8A\U0001d6a9B\U0001d6aa\u0393\U0001d6ab\u0394'
+    '\U0001d6acE\U0001d6adZ\U0001d6aeH\U0001d6af\u0398\U0001d6b0l\U0001d6b1K\U0001d6b2\u039b\U0001d6b3M\U0001d6b4N\U0001d6b5\u039e\U0001d6b6O\U0001d6b7\u03a0\U0001d6b8P\U0001d6b9\u0398\U0001d6ba\u03a3\U0001d6bbT'
+    '\U0001d6bcY\U0001d6bd\u03a6\U0001d6beX\U0001d6bf\u03a8\U0001d6c0\u03a9\U0001d6c1\u2207\U0001d6c2a\U0001d6c3\u03b2\U0001d6c4y\U0001d6c5\u03b4\U0001d6c6\u03b5\U0001d6c7\u03b6\U0001d6c8\u03b7\U0001d6c9\u03b8\U0001d6cai\U0001d6cb\u03ba'
+    '\U0001d6cc\u03bb\U0001d6cd\u03bc\U0001d6cev\U0001d6cf\u03be\U0001d6d0o\U0001d6d1\u03c0\U0001d6d2p\U0001d6d3\u03c2\U0001d6d4\u03c3\U0001d6d5\u03c4\U0001d6d6\u03c5\U0001d6d7\u03c6\U0001d6d8\u03c7\U0001d6d9\u03c8\U0001d6da\u03c9\U0001d6db\u2202'
+    '\U0001d6dc\u03b5\U0001d6dd\u03b8\U0001d6de\u03ba\U0001d6df\u03c6\U0001d6e0p\U0001d6e1\u03c0\U0001d6e2A\U0001d6e3B\U0001d6e4\u0393\U0001d6e5\u0394\U0001d6e6E\U0001d6e7Z\U0001d6e8H\U0001d6e9\u0398\U0001d6eal\U0001d6ebK'
+    '\U0001d6ec\u039b\U0001d6edM\U0001d6eeN\U0001d6ef\u039e\U0001d6f0O\U0001d6f1\u03a0\U0001d6f2P\U0001d6f3\u0398\U0001d6f4\u03a3\U0001d6f5T\U0001d6f6Y\U0001d6f7\u03a6\U0001d6f8X\U0001d6f9\u03a8\U0001d6fa\u03a9\U0001d6fb\u2207'
+    '\U0001d6fca\U0001d6fd\u03b2\U0001d6fey\U0001d6ff\u03b4\U0001d700\u03b5\U0001d701\u03b6\U0001d702\u03b7\U0001d703\u03b8\U0001d704i\U0001d705\u03ba\U0001d706\u03bb\U0001d707\u03bc\U0001d708v\U0001d709\u03be\U0001d70ao\U0001d70b\u03c0'
+    '\U0001d70cp\U0001d70d\u03c2\U0001d70e\u03c3\U0001d70f\u03c4\U0001d710\u03c5\U0001d711\u03c6\U0001d712\u03c7\U0001d713\u03c8\U0001d714\u03c9\U0001d715\u2202\U0001d716\u03b5\U0001d717\u03b8\U0001d718\u03ba\U0001d719\u03c6\U0001d71ap\U0001d71b\u03c0'
+    '\U0001d71cA\U0001d71dB\U0001d71e\u0393\U0001d71f\u0394\U0001d720E\U0001d721Z\U0001d722H\U0001d723\u0398\U0001d724l\U0001d725K\U0001d726\u039b\U0001d727M\U0001d728N\U0001d729\u039e\U0001d72aO\U0001d72b\u03a0'
+    '\U0001d72cP\U0001d72d\u0398\U0001d72e\u03a3\U0001d72fT\U0001d730Y\U0001d731\u03a6\U0001d732X\U0001d733\u03a8\U0001d734\u03a9\U0001d735\u2207\U0001d736a\U0001d737\u03b2\U0001d738y\U0001d739\u03b4\U0001d73a\u03b5\U0001d73b\u03b6'
+    '\U0001d73c\u03b7\U0001d73d\u03b8\U0001d73ei\U0001d73f\u03ba\U0001d740\u03bb\U0001d741\u03bc\U0001d742v\U0001d743\u03be\U0001d744o\U0001d745\u03c0\U0001d746p\U0001d747\u03c2\U0001d748\u03c3\U0001d749\u03c4\U0001d74a\u03c5\U0001d74b\u03c6'
+    '\U0001d74c\u03c7\U0001d74d\u03c8\U0001d74e\u03c9\U0001d74f\u2202\U0001d750\u03b5\U0001d751\u03b8\U0001d752\u03ba\U0001d753\u03c6\U0001d754p\U0001d755\u03c0\U0001d756A\U0001d757B\U0001d758\u0393\U0001d759\u0394\U0001d75aE\U0001d75bZ'
+    '\U0001d75cH\U0001d75d\u0398\U0001d75el\U0001d75fK\U0001d760\u039b\U0001d761M\U0001d762N\U0001d763\u039e\U0001d764O\U0001d765\u03a0\U0001d766P\U0001d767\u0398\U0001d768\u03a3\U0001d769T\U0001d76aY\U0001d76b\u03a6'
+    '\U0001d76cX\U0001d76d\u03a8\U0001d76e\u03a9\U0001d76f\u2207\U0001d770a\U0001d771\u03b2\U0001d772y\U0001d773\u03b4\U0001d774\u03b5\U0001d775\u03b6\U0001d776\u03b7\U0001d777\u03b8\U0001d778i\U0001d779\u03ba\U0001d77a\u03bb\U0001d77b\u03bc'
+    '\U0001d77cv\U0001d77d\u03be\U0001d77eo\U0001d77f\u03c0\U0001d780p\U0001d781\u03c2\U0001d782\u03c3\U0001d783\u03c4\U0001d784\u03c5\U0001d785\u03c6\U0001d786\u03c7\U0001d787\u03c8\U0001d788\u03c9\U0001d789\u2202\U0001d78a\u03b5\U0001d78b\u03b8'
+    '\U0001d78c\u03ba\U0001d78d\u03c6\U0001d78ep\U0001d78f\u03c0\U0001d790A\U0001d791B\U0001d792\u0393\U0001d793\u0394\U0001d794E\U0001d795Z\U0001d796H\U0001d797\u0398\U0001d798l\U0001d799K\U0001d79a\u039b\U0001d79bM'
+    '\U0001d79cN\U0001d79d\u039e\U0001d79eO\U0001d79f\u03a0\U0001d7a0P\U0001d7a1\u0398\U0001d7a2\u03a3\U0001d7a3T\U0001d7a4Y\U0001d7a5\u03a6\U0001d7a6X\U0001d7a7\u03a8\U0001d7a8\u03a9\U0001d7a9\u2207\U0001d7aaa\U0001d7ab\u03b2'
+    '\U0001d7acy\U0001d7ad\u03b4\U0001d7ae\u03b5\U0001d7af\u03b6\U0001d7b0\u03b7\U0001d7b1\u03b8\U0001d7b2i\U0001d7b3\u03ba\U0001d7b4\u03bb\U0001d7b5\u03bc\U0001d7b6v\U0001d7b7\u03be\U0001d7b8o\U0001d7b9\u03c0\U0001d7bap\U0001d7bb\u03c2'
+    '\U0001d7bc\u03c3\U0001d7bd\u03c4\U0001d7be\u03c5\U0001d7bf\u03c6\U0001d7c0\u03c7\U0001d7c1\u03c8\U0001d7c2\u03c9\U0001d7c3\u2202\U0001d7c4\u03b5\U0001d7c5\u03b8\U0001d7c6\u03ba\U0001d7c7\u03c6\U0001d7c8p\U0001d7c9\u03c0\U0001d7ca\u03dc\U0001d7cb\u03dd'
+    '\U0001d7ceO\U0001d7cfl\U0001d7d02\U0001d7d13\U0001d7d24\U0001d7d35\U0001d7d46\U0001d7d57\U0001d7d68\U0001d7d79\U0001d7d8O\U0001d7d9l\U0001d7da2\U0001d7db3\U0001d7dc4\U0001d7dd5'
+    '\U0001d7de6\U0001d7df7\U0001d7e08\U0001d7e19\U0001d7e2O\U0001d7e3l\U0001d7e42\U0001d7e53\U0001d7e64\U0001d7e75\U0001d7e86\U0001d7e97\U0001d7ea8\U0001d7eb9\U0001d7ecO\U0001d7edl'
+    '\U0001d7ee2\U0001d7ef3\U0001d7f04\U0001d7f15\U0001d7f26\U0001d7f37\U0001d7f48\U0001d7f59\U0001d7f6O\U0001d7f7l\U0001d7f82\U0001d7f93\U0001d7fa4\U0001d7fb5\U0001d7fc6\U0001d7fd7'
+    '\U0001d7fe8\U0001d7ff9\U0001ee00\u0627\U0001ee01\u0628\U0001ee02\u062c\U0001ee03\u062f\U0001ee05\u0648\U0001ee06\u0632\U0001ee07\u062d\U0001ee08\u0637\U0001ee09\u064a\U0001ee0a\u0643\U0001ee0b\u0644\U0001ee0c\u0645\U0001ee0d\u0646\U0001ee0e\u0633'
+    '\U0001ee0f\u0639\U0001ee10\u0641\U0001ee11\u0635\U0001ee12\u0642\U0001ee13\u0631\U0001ee14\u0634\U0001ee15\u062a\U0001ee16\u062b\U0001ee17\u062e\U0001ee18\u0630\U0001ee19\u0636\U0001ee1a\u0638\U0001ee1b\u063a\U0001ee1c\u066e\U0001ee1d\u06ba\U0001ee1e\u06a1'
+    '\U0001ee1f\u066f\U0001ee21\u0628\U0001ee22\u062c\U0001ee24\u0647\U0001ee27\u062d\U0001ee29\u064a\U0001ee2a\u0643\U0001ee2b\u0644\U0001ee2c\u0645\U0001ee2d\u0646\U0001ee2e\u0633\U0001ee2f\u0639\U0001ee30\u0641\U0001ee31\u0635\U0001ee32\u0642\U0001ee34\u0634'
+    '\U0001ee35\u062a\U0001ee36\u062b\U0001ee37\u062e\U0001ee39\u0636\U0001ee3b\u063a\U0001ee42\u062c\U0001ee47\u062d\U0001ee49\u064a\U0001ee4b\u0644\U0001ee4d\u0646\U0001ee4e\u0633\U0001ee4f\u0639\U0001ee51\u0635\U0001ee52\u0642\U0001ee54\u0634\U0001ee57\u062e'
+    '\U0001ee59\u0636\U0001ee5b\u063a\U0001ee5d\u06ba\U0001ee5f\u066f\U0001ee61\u0628\U0001ee62\u062c\U0001ee64\u0647\U0001ee67\u062d\U0001ee68\u0637\U0001ee69\u064a\U0001ee6a\u0643\U0001ee6c\u0645\U0001ee6d\u0646\U0001ee6e\u0633\U0001ee6f\u0639\U0001ee70\u0641'
+    '\U0001ee71\u0635\U0001ee72\u0642\U0001ee74\u0634\U0001ee75\u062a\U0001ee76\u062b\U0001ee77\u062e\U0001ee79\u0636\U0001ee7a\u0638\U0001ee7b\u063a\U0001ee7c\u066e\U0001ee7e\u06a1\U0001ee80\u0627\U0001ee81\u0628\U0001ee82\u062c\U0001ee83\u062f\U0001ee84\u0647'
+    '\U0001ee85\u0648\U0001ee86\u0632\U0001ee87\u062d\U0001ee88\u0637\U0001ee89\u064a\U0001ee8b\u0644\U0001ee8c\u0645\U0001ee8d\u0646\U0001ee8e\u0633\U0001ee8f\u0639\U0001ee90\u0641\U0001ee91\u0635\U0001ee92\u0642\U0001ee93\u0631\U0001ee94\u0634\U0001ee95\u062a'
+    '\U0001ee96\u062b\U0001ee97\u062e\U0001ee98\u0630\U0001ee99\u0636\U0001ee9a\u0638\U0001ee9b\u063a\U0001eea1\u0628\U0001eea2\u062c\U0001eea3\u062f\U0001eea5\u0648\U0001eea6\u0632\U0001eea7\u062d\U0001eea8\u0637\U0001eea9\u064a\U0001eeab\u0644\U0001eeac\u0645'
+    '\U0001eead\u0646\U0001eeae\u0633\U0001eeaf\u0639\U0001eeb0\u0641\U0001eeb1\u0635\U0001eeb2\u0642\U0001eeb3\u0631\U0001eeb4\u0634\U0001eeb5\u062a\U0001eeb6\u062b\U0001eeb7\u062e\U0001eeb8\u0630\U0001eeb9\u0636\U0001eeba\u0638\U0001eebb\u063a\U0001f12bC'
+    '\U0001f12cR\U0001f130A\U0001f131B\U0001f132C\U0001f133D\U0001f134E\U0001f135F\U0001f136G\U0001f137H\U0001f138l\U0001f139J\U0001f13aK\U0001f13bL\U0001f13cM\U0001f13dN\U0001f13eO'
+    '\U0001f13fP\U0001f140Q\U0001f141R\U0001f142S\U0001f143T\U0001f144U\U0001f145V\U0001f146W\U0001f147X\U0001f148Y\U0001f149Z\U0001f202\u30b5\U0001f210\u624b\U0001f211\u5b57\U0001f212\u53cc\U0001f213\u30c7'
+    '\U0001f214\u4e8c\U0001f215\u591a\U0001f216\u89e3\U0001f217\u5929\U0001f218\u4ea4\U0001f219\u6620\U0001f21a\u7121\U0001f21b\u6599\U0001f21c\u524d\U0001f21d\u5f8c\U0001f21e\u518d\U0001f21f\u65b0\U0001f220\u521d\U0001f221\u7d42\U0001f222\u751f\U0001f223\u8ca9'
+    '\U0001f224\u58f0\U0001f225\u5439\U0001f226\u6f14\U0001f227\u6295\U0001f228\u6355\U0001f229\u4e00\U0001f22a\u4e09\U0001f22b\u904a\U0001f22c\u5de6\U0001f22d\u4e2d\U0001f22e\u53f3\U0001f22f\u6307\U0001f230\u8d70\U0001f231\u6253\U0001f232\u7981\U0001f233\u7a7a'
+    '\U0001f234\u5408\U0001f235\u6e80\U0001f236\u6709\U0001f237\u6708\U0001f238\u7533\U0001f239\u5272\U0001f23a\u55b6\U0001f23b\u914d\U0001f250\u5f97\U0001f251\u53ef\U0001fbf0O\U0001fbf1l\U0001fbf22\U0001fbf33\U0001fbf44\U0001fbf55'
+    '\U0001fbf66\U0001fbf77\U0001fbf88\U0001fbf99\U0002f800\u4e3d\U0002f801\u4e38\U0002f802\u4e41\U0002f803\U00020122\U0002f804\u4f60\U0002f805\u4fae\U0002f806\u4fbb\U0002f807\u5002\U0002f808\u507a\U0002f809\u5099\U0002f80a\u50e7\U0002f80b\u50cf'
+    '\U0002f80c\u349e\U0002f80d\U0002063a\U0002f80e\u514d\U0002f80f\u5154\U0002f810\u5164\U0002f811\u5177\U0002f812\U0002051c\U0002f813\u34b9\U0002f814\u5167\U0002f815\u518d\U0002f816\U0002054b\U0002f817\u5197\U0002f818\u51a4\U0002f819\u4ecc\U0002f81a\u51ac\U0002f81b\u51b5'
+    '\U0002f81c\U000291df\U0002f81d\u51f5\U0002f81e\u5203\U0002f81f\u34df\U0002f820\u523b\U0002f821\u5246\U0002f822\u5272\U0002f823\u5277\U0002f824\u3515\U0002f825\u52c7\U0002f826\u52c9\U0002f827\u52e4\U0002f828\u52fa\U0002f829\u5305\U0002f82a\u5306\U0002f82b\u5317'
+    '\U0002f82c\u5349\U0002f82d\u5351\U0002f82e\u535a\U0002f82f\u5373\U0002f830\u537d\U0002f831\u537f\U0002f832\u537f\U0002f833\u537f\U0002f834\U00020a2c\U0002f835\u7070\U0002f836\u53ca\U0002f837\u53df\U0002f838\U00020b63\U0002f839\u53eb\U0002f83a\u53f1\U0002f83b\u5406'
+    '\U0002f83c\u549e\U0002f83d\u5438\U0002f83e\u5448\U0002f83f\u5468\U0002f840\u54a2\U0002f841\u54f6\U0002f842\u5510\U0002f843\u5553\U0002f844\u5563\U0002f845\u5584\U0002f846\u5584\U0002f847\u5599\U0002f848\u55ab\U0002f849\u55b3\U0002f84a\u55c2\U0002f84b\u5716'
+    '\U0002f84c\u5606\U0002f84d\u5717\U0002f84e\u5651\U0002f84f\u5674\U0002f850\u5207\U0002f851\u58ee\U0002f852\u57ce\U0002f853\u57f4\U0002f854\u580d\U0002f855\u578b\U0002f856\u5832\U0002f857\u5831\U0002f858\u58ac\U0002f859\U000214e4\U0002f85a\u58f2\U0002f85b\u58f7'
+    '\U0002f85c\u5906\U0002f85d\u591a\U0002f85e\u5922\U0002f85f\u5962\U0002f860\U000216a8\U0002f861\U000216ea\U0002f862\u59ec\U0002f863\u5a1b\U0002f864\u5a27\U0002f865\u59d8\U0002f866\u5a66\U0002f867\u36ee\U0002f868\u36fc\U0002f869\u5b08\U0002f86a\u5b3e\U0002f86b\u5b3e'
+    '\U0002f86c\U000219c8\U0002f86d\u5bc3\U0002f86e\u5bd8\U0002f86f\u5be7\U0002f870\u5bf3\U0002f871\U00021b18\U0002f872\u5bff\U0002f873\u5c06\U0002f874\u5f53\U0002f875\u5c22\U0002f876\u3781\U0002f877\u5c60\U0002f878\u5c6e\U0002f879\u5cc0\U0002f87a\u5c8d\U0002f87b\U00021de4'
+    '\U0002f87c\u5d43\U0002f87d\U00021de6\U0002f87e\u5d6e\U0002f87f\u5d6b\U0002f880\u5d7c\U0002f881\u5de1\U0002f882\u5de2\U0002f883\u382f\U0002f884\u5dfd\U0002f885\u5e28\U0002f886\u5e3d\U0002f887\u5e69\U0002f888\u3862\U0002f889\U00022183\U0002f88a\u387c\U0002f88b\u5eb0'
+    '\U0002f88c\u5eb3\U0002f88d\u5eb6\U0002f88e\u5eca\U0002f88f\U0002a392\U0002f890\u5efe\U0002f891\U00022331\U0002f892\U00022331\U0002f893\u8201\U0002f894\u5f22\U0002f895\u5f22\U0002f896\u38c7\U0002f897\U000232b8\U0002f898\U000261da\U0002f899\u5f62\U0002f89a\u5f6b\U0002f89b\u38e3'
+    '\U0002f89c\u5f9a\U0002f89d\u5fcd\U0002f89e\u5fd7\U0002f89f\u5ff9\U0002f8a0\u6081\U0002f8a1\u393a\U0002f8a2\u391c\U0002f8a3\u6094\U0002f8a4\U000226d4\U0002f8a5\u60c7\U0002f8a6\u6148\U0002f8a7\u614c\U0002f8a8\u614e\U0002f8a9\u614c\U0002f8aa\u617a\U0002f8ab\u618e'
+    '\U0002f8ac\u61b2\U0002f8ad\u61a4\U0002f8ae\u61af\U0002f8af\u61de\U0002f8b0\u61f2\U0002f8b1\u61f6\U0002f8b2\u6210\U0002f8b3\u621b\U0002f8b4\u625d\U0002f8b5\u62b1\U0002f8b6\u62d4\U0002f8b7\u6350\U0002f8b8\U00022b0c\U0002f8b9\u633d\U0002f8ba\u62fc\U0002f8bb\u6368'
+    '\U0002f8bc\u6383\U0002f8bd\u63e4\U0002f8be\U00022bf1\U0002f8bf\u6422\U0002f8c0\u63c5\U0002f8c1\u63a9\U0002f8c2\u3a2e\U0002f8c3\u6469\U0002f8c4\u647e\U0002f8c5\u649d\U0002f8c6\u6477\U0002f8c7\u3a6c\U0002f8c8\u654f\U0002f8c9\u656c\U0002f8ca\U0002300a\U0002f8cb\u65e3'
+    '\U0002f8cc\u66f8\U0002f8cd\u6649\U0002f8ce\u3b19\U0002f8cf\u6691\U0002f8d0\u3b08\U0002f8d1\u3ae4\U0002f8d2\u5192\U0002f8d3\u5195\U0002f8d4\u6700\U0002f8d5\u669c\U0002f8d6\u80ad\U0002f8d7\u43d9\U0002f8d8\u6717\U0002f8d9\u671b\U0002f8da\u6721\U0002f8db\u675e'
+    '\U0002f8dc\u6753\U0002f8dd\U000233c3\U0002f8de\u3b49\U0002f8df\u67fa\U0002f8e0\u6785\U0002f8e1\u6852\U0002f8e2\u6885\U0002f8e3\U0002346d\U0002f8e4\u688e\U0002f8e5\u681f\U0002f8e6\u6914\U0002f8e7\u3b9d\U0002f8e8\u6942\U0002f8e9\u69a3\U0002f8ea\u69ea\U0002f8eb\u6aa8'
+    '\U0002f8ec\U000236a3\U0002f8ed\u6adb\U0002f8ee\u3c18\U0002f8ef\u6b21\U0002f8f0\U000238a7\U0002f8f1\u6b54\U0002f8f2\u3c4e\U0002f8f3\u6b72\U0002f8f4\u6b9f\U0002f8f5\u6bba\U0002f8f6\u6bbb\U0002f8f7\U00023a8d\U0002f8f8\U00021d0b\U0002f8f9\U00023afa\U0002f8fa\u6c4e\U0002f8fb\U00023cbc'
+    '\U0002f8fc\u6cbf\U0002f8fd\u6ccd\U0002f8fe\u6c67\U0002f8ff\u6d16\U0002f900\u6d3e\U0002f901\u6d77\U0002f902\u6d41\U0002f903\u6d69\U0002f904\u6d78\U0002f905\u6d85\U0002f906\U00023d1e\U0002f907\u6d34\U0002f908\u6e2f\U0002f909\u6e6e\U0002f90a\u3d33\U0002f90b\u6ecb'
+    '\U0002f90c\u6ec7\U0002f90d\U00023ed1\U0002f90e\u6df9\U0002f90f\u6f6e\U0002f910\U00023f5e\U0002f911\U00023f8e\U0002f912\u6fc6\U0002f913\u7039\U0002f914\u701e\U0002f915\u701b\U0002f916\u3d96\U0002f917\u704a\U0002f918\u707d\U0002f919\u7077\U0002f91a\u70ad\U0002f91b\U00020525'
+    '\U0002f91c\u7145\U0002f91d\U00024263\U0002f91e\u719c\U0002f91f\U000243ab\U0002f920\u7228\U0002f921\u7235\U0002f922\u7250\U0002f923\U00024608\U0002f924\u7280\U0002f925\u7295\U0002f926\U00024735\U0002f927\U00024814\U0002f928\u737a\U0002f929\u738b\U0002f92a\u3eac\U0002f92b\u73a5'
+    '\U0002f92c\u3eb8\U0002f92d\u3eb8\U0002f92e\u7447\U0002f92f\u745c\U0002f930\u7471\U0002f931\u7485\U0002f932\u74ca\U0002f933\u3f1b\U0002f934\u7524\U0002f935\U00024c36\U0002f936\u753e\U0002f937\U00024c92\U0002f938\u7570\U0002f939\U0002219f\U0002f93a\u7610\U0002f93b\U00024fa1'
+    '\U0002f93c\U00024fb8\U0002f93d\U00025044\U0002f93e\u3ffc\U0002f93f\u4008\U0002f940\u76f4\U0002f941\U000250f3\U0002f942\U000250f2\U0002f943\U00025119\U0002f944\U00025133\U0002f945\u771e\U0002f946\u771f\U0002f947\u771f\U0002f948\u774a\U0002f949\u4039\U0002f94a\u778b\U0002f94b\u4046'
+    '\U0002f94c\u4096\U0002f94d\U0002541d\U0002f94e\u784e\U0002f94f\u788c\U0002f950\u78cc\U0002f951\u40e3\U0002f952\U00025626\U0002f953\u7956\U0002f954\U0002569a\U0002f955\U000256c5\U0002f956\u798f\U0002f957\u79eb\U0002f958\u412f\U0002f959\u7a40\U0002f95a\u7a4a\U0002f95b\u7a4f'
+    '\U0002f95c\U0002597c\U0002f95d\U00025aa7\U0002f95e\U00025aa7\U0002f95f\u7aee\U0002f960\u4202\U0002f961\U00025bab\U0002f962\u7bc6\U0002f963\u7bc9\U0002f964\u4227\U0002f965\U00025c80\U0002f966\u7cd2\U0002f967\u42a0\U0002f968\u7ce8\U0002f969\u7ce3\U0002f96a\u7d00\U0002f96b\U00025f86'
+    '\U0002f96c\u7d63\U0002f96d\u4301\U0002f96e\u7dc7\U0002f96f\u7e02\U0002f970\u7e45\U0002f971\u4334\U0002f972\U00026228\U0002f973\U00026247\U0002f974\u4359\U0002f975\U000262d9\U0002f976\u7f7a\U0002f977\U0002633e\U0002f978\u7f95\U0002f979\u7ffa\U0002f97a\u8005\U0002f97b\U000264da'
+    '\U0002f97c\U00026523\U0002f97d\u8060\U0002f97e\U000265a8\U0002f97f\u8070\U0002f980\U0002335f\U0002f981\u43d5\U0002f982\u80b2\U0002f983\u8103\U0002f984\u440b\U0002f985\u813e\U0002f986\u5ab5\U0002f987\U000267a7\U0002f988\U000267b5\U0002f989\U00023393\U0002f98a\U0002339c\U0002f98b\u8201'
+    '\U0002f98c\u8204\U0002f98d\u8f9e\U0002f98e\u446b\U0002f98f\u8291\U0002f990\u828b\U0002f991\u829d\U0002f992\u52b3\U0002f993\u82b1\U0002f994\u82b3\U0002f995\u82bd\U0002f996\u82e6\U0002f997\U00026b3c\U0002f998\u82e5\U0002f999\u831d\U0002f99a\u8363\U0002f99b\u83ad'
+    '\U0002f99c\u8323\U0002f99d\u83bd\U0002f99e\u83e7\U0002f99f\u8457\U0002f9a0\u8353\U0002f9a1\u83ca\U0002f9a2\u83cc\U0002f9a3\u83dc\U0002f9a4\U00026c36\U0002f9a5\U00026d6b\U0002f9a6\U00026cd5\U0002f9a7\u452b\U0002f9a8\u84f1\U0002f9a9\u84f3\U0002f9aa\u8516\U0002f9ab\U000273ca'
+    '\U0002f9ac\u8564\U0002f9ad\U00026f2c\U0002f9ae\u455d\U0002f9af\u4561\U0002f9b0\U00026fb1\U0002f9b1\U000270d2\U0002f9b2\u456b\U0002f9b3\u8650\U0002f9b4\u865c\U0002f9b5\u8667\U0002f9b6\u8669\U0002f9b7\u86a9\U0002f9b8\u8688\U0002f9b9\u870e\U0002f9ba\u86e2\U0002f9bb\u8779'
+    '\U0002f9bc\u8728\U0002f9bd\u876b\U0002f9be\u8786\U0002f9bf\u45d7\U0002f9c0\u87e1\U0002f9c1\u8801\U0002f9c2\u45f9\U0002f9c3\u8860\U0002f9c4\u8863\U0002f9c5\U00027667\U0002f9c6\u88d7\U0002f9c7\u88de\U0002f9c8\u4635\U0002f9c9\u88fa\U0002f9ca\u34bb\U0002f9cb\U000278ae'
+    '\U0002f9cc\U00027966\U0002f9cd\u46be\U0002f9ce\u46c7\U0002f9cf\u8aa0\U0002f9d0\u8aed\U0002f9d1\u8b8a\U0002f9d2\u8c55\U0002f9d3\U00027ca8\U0002f9d4\u8cab\U0002f9d5\u8cc1\U0002f9d6\u8d1b\U0002f9d7\u8d77\U0002f9d8\U00027f2f\U0002f9d9\U00020804\U0002f9da\u8dcb\U0002f9db\u8dbc'
+    '\U0002f9dc\u8df0\U0002f9dd\U000208de\U0002f9de\u8ed4\U0002f9df\u8f38\U0002f9e0\U000285d2\U0002f9e1\U000285ed\U0002f9e2\u9094\U0002f9e3\u90f1\U0002f9e4\u9111\U0002f9e5\U0002872e\U0002f9e6\u911b\U0002f9e7\u9238\U0002f9e8\u92d7\U0002f9e9\u92d8\U0002f9ea\u927c\U0002f9eb\u93f9'
+    '\U0002f9ec\u9415\U0002f9ed\U00028bfa\U0002f9ee\u958b\U0002f9ef\u4995\U0002f9f0\u95b7\U0002f9f1\U00028d77\U0002f9f2\u49e6\U0002f9f3\u96c3\U0002f9f4\u5db2\U0002f9f5\u9723\U0002f9f6\U00029145\U0002f9f7\U0002921a\U0002f9f8\u4a6e\U0002f9f9\u4a76\U0002f9fa\u97e0\U0002f9fb\U0002940a'
+    '\U0002f9fc\u4ab2\U0002f9fd\U00029496\U0002f9fe\u980b\U0002f9ff\u980b\U0002fa00\u9829\U0002fa01\U000295b6\U0002fa02\u98e2\U0002fa03\u4b33\U0002fa04\u9929\U0002fa05\u99a7\U0002fa06\u99c2\U0002fa07\u99fe\U0002fa08\u4bce\U0002fa09\U00029b30\U0002fa0a\u9b12\U0002fa0b\u9c40'
+    '\U0002fa0c\u9cfd\U0002fa0d\u4cce\U0002fa0e\u4ced\U0002fa0f\u9d67\U0002fa10\U0002a0ce\U0002fa11\u4cf8\U0002fa12\U0002a105\U0002fa13\U0002a20e\U0002fa14\U0002a291\U0002fa15\u9ebb\U0002fa16\u4d56\U0002fa17\u9ef9\U0002fa18\u9efe\U0002fa19\u9f05\U0002fa1a\u9f0f\U0002fa1b\u9f16'
+    '\U0002fa1c\u9f3b\U0002fa1d\U0002a600'
+)
@@ -0,0 +1,143 @@
+"""
+Serialization of the update processing inside one chat.
+All handlers are registered as non-blocking, so without it two letters
+that came to the same chat at the same moment would be checked at the
+same time against the same tower.
+"""
+
+import asyncio
+from functools import wraps
+from typing import Callable, Coroutine, Dict, Tuple
+
+from telegram import Update
+from telegram.ext import CallbackContext
+
+from config import Args
+
+
+__all__ = [
+    "ChatDispatcher",
+]
+
+
+HANDLER_TYPE = Callable[[Update, CallbackContext], Coroutine]
+TASK_TYPE = Tuple[HANDLER_TYPE, Update, CallbackContext, asyncio.Future]
+
+
+class ChatDispatcher:
+    """
+    Sends the updates of each chat to its own queue, which is processed
+    by a separate worker strictly in the order of arrival.
+    The worker is created on the first update of the chat and stops
+    after `idle_timeout` seconds without updates, so the different chats
+    are still processed fully in parallel.
+    The updates can be announced before their handler is run (the
+    handlers are run as tasks later), then the chat is not idle until
+    they are processed.
+    """
+
+    idle_timeout: float
+    queues: Dict[int, asyncio.Queue]
+    workers: Dict[int, asyncio.Task]
+    pending: Dict[int, int]  # the number of unprocessed updates of the chats
+
+    def __init__(self, idle_timeout: float = Args.WORKER_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self.queues = dict()
+        self.workers = dict()
+        self.pending = dict()
+
+    def announce(self, chat_id: int):
+        """
+        Marks that one more update of the chat is on the way to its queue.
+        """
+        self.pending[chat_id] = self.pending.get(chat_id, 0) + 1
+
+    def is_idle(self, chat_id: int) -> bool:
+        """
+        Checks if the chat has no announced or unprocessed updates.
+        """
+        return chat_id not in self.pending
+
+    def _done(self, chat_id: int):
+        count = self.pending.pop(chat_id, 0) - 1
+        if count > 0:
+            self.pending[chat_id] = count
+
+    def wrap(self, handler: HANDLER_TYPE) -> HANDLER_TYPE:
+        """
+        Decorator, which makes the handler run in the chat queue.
+        """
+
+        @wraps(handler)
+        async def wrapped(update: Update, context: CallbackContext):
+            return await self.dispatch(update.effective_chat.id, handler, update, context)
+
+        return wrapped
+
+    async def dispatch(
+            self,
+            chat_id: int,
+            handler: HANDLER_TYPE,
+            update: Update,
+            context: CallbackContext,
+    ):
+        """
+        Puts the update in the chat queue and waits for the result of its
+        processing (errors of the handler are raised here too).
+        """
+
+        queue = self.queues.get(chat_id)
+        if queue is None:
+            queue = self.queues[chat_id] = asyncio.Queue()
+            self.workers[chat_id] = asyncio.create_task(self._work(chat_id, queue))
+
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((handler, update, context, future))
+        try:
+            return await future
+        finally:
+            self._done(chat_id)
+
+    async def _work(self, chat_id: int, queue: asyncio.Queue):
+        """
+        Processes the chat queue one by one until it is idle.
+        """
+
+        try:
+            while True:
+                try:
+                    task: TASK_TYPE = await asyncio.wait_for(queue.get(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    if queue.empty():
+                        # nobody is writing, the worker is not needed anymore
+                        return
+                    continue
+
+                handler, update, context, future = task
+                if future.cancelled():
+                    continue
+                try:
+                    result = await handler(update, context)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+        finally:
+            del self.queues[chat_id]
+            del self.workers[chat_id]
+            # if the worker was stopped, nobody should wait for it forever
+            while not queue.empty():
+                queue.get_nowait()[-1].cancel()
+
+    async def close(self):
+        """
+        Stops all workers (the unprocessed updates are cancelled).
+        """
+
+        for worker in list(self.workers.values()):
+            worker.cancel()
+        await asyncio.gather(*self.workers.values(), return_exceptions=True)
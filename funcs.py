@@ -3,15 +3,20 @@ Things that are necessary but get in the way of reading business logic.
 """
 
 import json
+import zlib
 from pathlib import Path
-from typing import List
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from confusables import get_lookalikes
 
 
 __all__ = [
     "get_args",
     "ReadonlyEnum",
-    "SIMILAR_CHARS",
+    "get_shard",
     "get_all_possible_chars",
+    "TrieNode",
+    "TowerTrie",
 ]
 
 
@@ -33,33 +38,13 @@ class ReadonlyEnum(type):
         pass
 
 
-SIMILAR_CHARS = {
-    "a": ["а"],
-    "b": ["Ь"],
-    "c": ["с"],
-    "e": ["е"],
-    "k": ["к"],
-    "l": ["|", "I"],
-    "n": ["п"],
-    "o": ["о"],
-    "p": ["р"],
-    "r": ["г"],
-    "x": ["х"],
-    "y": ["у"],
-    "A": ["А"],
-    "B": ["В"],
-    "C": ["С"],
-    "E": ["Е"],
-    "H": ["Н"],
-    "I": ["|", "l"],
-    "K": ["К"],
-    "M": ["М"],
-    "O": ["О"],
-    "P": ["Р"],
-    "T": ["Т"],
-    "X": ["Х"],
-    "Y": ["У"],
-}
+def get_shard(chat_id: int, shards: int) -> int:
+    """
+    Returns the number of the shard of the chat.
+    The hash is stable between the processes and restarts (unlike the
+    builtin `hash`).
+    """
+    return zlib.crc32(str(chat_id).encode()) % shards
 
 
 def get_all_possible_chars(tower: str, *, similar_emabled: bool = True) -> List[str]:
@@ -67,11 +52,142 @@ def get_all_possible_chars(tower: str, *, similar_emabled: bool = True) -> List[
     Returns a character set of tower chars and similar chars (if any).
     """
 
-    tower_chars = list(set(tower))
-    similar_chars = []
+    tower_chars = set(tower)
+    if not similar_emabled:
+        return list(tower_chars)
+    return list(set().union(*map(get_lookalikes, tower_chars)))
+
+
+class TrieNode:
+    """
+    A node of the tower trie: the state after some letters.
+    It knows which towers are still possible after these letters and
+    which of them were built without lookalikes, so the towers with a
+    common beginning share the nodes.
+    The accepted letters are numbered in a fixed order (the numbers are
+    used to store the towers compactly).
+    """
+
+    __slots__ = ("depth", "towers", "clean", "letters", "children", "completed")
+
+    depth: int
+    towers: FrozenSet[int]  # the numbers of the possible towers
+    clean: FrozenSet[int]  # the possible towers without lookalike letters
+    letters: Tuple[str, ...]
+    children: Dict[str, "TrieNode"]
+    completed: Optional[int]  # the number of the tower built in this node
+
+    def __init__(self, depth: int, towers: FrozenSet[int], clean: FrozenSet[int], completed: Optional[int]):
+        self.depth = depth
+        self.towers = towers
+        self.clean = clean
+        self.letters = ()
+        self.children = dict()
+        self.completed = completed
+
+
+class TowerTrie:
+    """
+    The prefix trie of all towers, which is compiled once.
+    The lookalike letters are folded into it: they lead to the same
+    towers as the canonical ones, only these towers are no longer clean.
+    So the check of the next letter is one dict lookup no matter how many
+    towers there are.
+    A tower cannot be the beginning of another one (even with lookalike
+    letters): the longer one could never be built after it, so such
+    towers raise `ValueError`.
+    """
+
+    towers: Tuple[str, ...]
+    similar_emabled: bool
+    root: TrieNode
+    nodes: List[TrieNode]
+    all_chars: FrozenSet[str]
+    max_letter_len: int
+
+    def __init__(self, towers: Tuple[str, ...], *, similar_emabled: bool = True):
+        # the repeated towers would be the same towers
+        self.towers = tuple(dict.fromkeys(towers))
+        self.similar_emabled = similar_emabled
+        self.all_chars = frozenset(
+            char
+            for tower in self.towers
+            for char in get_all_possible_chars(tower, similar_emabled=similar_emabled)
+        )
+        # the longer texts are rejected by the length, without hashing
+        self.max_letter_len = max(map(len, self.all_chars), default=0)
+
+        all_towers = frozenset(range(len(self.towers)))
+        self.root = self._create_node(0, all_towers, all_towers)
+        self.nodes = [self.root]
+        self._build()
+
+    def _create_node(self, depth: int, towers: FrozenSet[int], clean: FrozenSet[int]) -> TrieNode:
+        completed = [number for number in sorted(towers) if len(self.towers[number]) == depth]
+        return TrieNode(depth, towers, clean, completed[0] if completed else None)
+
+    def _accepted(self, number: int, depth: int) -> List[str]:
+        """
+        Returns the letters accepted by the tower in the position, the
+        canonical letter goes first.
+        """
+
+        char = self.towers[number][depth]
+        # the order must be stable, the letters are stored by their numbers
+        similars = sorted(get_lookalikes(char) - {char}) if self.similar_emabled else []
+        return [char] + similars
+
+    def _build(self):
+        """
+        Creates the nodes breadth-first, the same states are created once.
+        """
+
+        cache: Dict[Tuple[int, FrozenSet[int], FrozenSet[int]], TrieNode] = dict()
+        for node in self.nodes:
+            if node.completed is not None:
+                # the tower is built, nothing goes after it
+                longer = sorted(node.towers - {node.completed})
+                if longer:
+                    raise ValueError(
+                        f"The tower `{self.towers[node.completed]}` is the beginning of the towers"
+                        f" {', '.join(f'`{self.towers[number]}`' for number in longer)}"
+                    )
+                continue
+
+            # letter -> (the towers that accept it, the ones of them for which
+            # it is canonical)
+            transitions: Dict[str, Tuple[set, set]] = dict()
+            for number in sorted(node.towers):
+                for (index, char) in enumerate(self._accepted(number, node.depth)):
+                    towers, canonical = transitions.setdefault(char, (set(), set()))
+                    towers.add(number)
+                    if index == 0:
+                        canonical.add(number)
+
+            for (char, (towers, canonical)) in transitions.items():
+                key = (node.depth + 1, frozenset(towers), node.clean & frozenset(canonical))
+                child = cache.get(key)
+                if child is None:
+                    child = cache[key] = self._create_node(*key)
+                    self.nodes.append(child)
+                node.children[char] = child
+            node.letters = tuple(node.children)
+
+    def walk(self, letters: Iterable[str]) -> Optional[TrieNode]:
+        """
+        Returns the node after the letters or `None` if they are not the
+        beginning of any tower.
+        """
 
-    if similar_emabled:
-        for char in tower_chars:
-            similar_chars.extend(SIMILAR_CHARS.get(char, []))
+        node = self.root
+        for letter in letters:
+            node = node.children.get(letter)
+            if node is None:
+                return None
+        return node
 
-    return list(set(tower_chars + similar_chars))
+    def is_possible(self, text: Optional[str]) -> bool:
+        """
+        Checks if the text is a letter of any tower position.
+        """
+        return text is not None and len(text) <= self.max_letter_len and text in self.all_chars
@@ -0,0 +1,344 @@
+"""
+History of the towers: an append-only log of the tower events on the
+local disk.
+Every letter, fall (with its reason), built tower and crash by the bot
+is appended to the log, so the history remains after the towers have
+expired in the storage. The events are buffered and are written every
+`flush_interval` seconds.
+The log is a directory of segments `<stream>-<start>.events` (`stream`
+is the number of the process, `start` is the time of the first event of
+the segment in milliseconds); a new segment is started as soon as the
+current one is larger than `segment_size`. The old segments can simply
+be deleted or archived.
+
+Format of the segment (little-endian):
+- header: magic (4s), version (B)
+- records: kind (B), time in milliseconds (Q), chat id (q), length of
+  the data (B), the data:
+  - letter: height (H), user id (q), message id (q), the letter (UTF-8)
+  - fall: height (H), the number of the reason in `FALL_REASONS` (B)
+  - built: height (H), the tower (UTF-8)
+  - crash: height (H), crash type (B)
+The height is the number of letters in the tower at the moment of the
+event. If the bot was killed during the writing, the last record may be
+incomplete, it is skipped by the reader.
+
+The log is read as a stream by `read_history`, which never keeps more
+than one chunk of a segment in memory:
+    for event in read_history("history", since=time.time() - 86400):
+        ...
+"""
+
+import asyncio
+import heapq
+import logging
+import os
+import struct
+import time
+from pathlib import Path
+from typing import IO, Dict, Final, Iterator, List, NamedTuple, Optional, Tuple
+
+from config import Args
+
+
+__all__ = [
+    "Event",
+    "EventLog",
+    "read_history",
+]
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TWEV"
+FORMAT_VERSION = 1
+SEGMENT_HEADER = struct.Struct("<4sB")
+RECORD = struct.Struct("<BQqB")
+LETTER = struct.Struct("<Hqq")
+FALL = struct.Struct("<HB")
+HEIGHT = struct.Struct("<H")
+CRASH = struct.Struct("<HB")
+
+KIND_LETTER = 1
+KIND_FALL = 2
+KIND_BUILT = 3
+KIND_CRASH = 4
+# the reasons are stored by their numbers, so the new ones go to the end
+FALL_REASONS: Final[Tuple[str, ...]] = (
+    "fall",
+    "fall_edited",
+    "fall_repetition",
+    "fail_similar",
+    "fall_deleted",
+)
+UNKNOWN_REASON = "unknown"
+
+SEGMENT_SUFFIX = ".events"
+# how much of the segment is read at once
+READ_CHUNK_SIZE = 1 << 20
+
+
+class Event(NamedTuple):
+    """
+    One event of the history, only the fields of its kind are set.
+    """
+
+    kind: str
+    time: float
+    chat_id: int
+    height: int
+    letter: Optional[str] = None
+    user_id: Optional[int] = None
+    message_id: Optional[int] = None
+    reason: Optional[str] = None
+    tower: Optional[str] = None
+    crash_type: Optional[int] = None
+
+
+class EventLog:
+    """
+    The writer of the history of one process.
+    The events are only packed into the buffer in memory, the file is
+    written in the background by `run()` (and by `close()`). With an
+    empty `directory` the history is not kept at all.
+    """
+
+    directory: str
+    stream: str
+    segment_size: int
+    flush_interval: float
+    buffer: bytearray
+    file: Optional[IO[bytes]]
+    file_size: int
+
+    def __init__(
+            self,
+            directory: str = Args.HISTORY_PATH,
+            stream: str = "0",
+            segment_size: int = Args.HISTORY_SEGMENT_SIZE,
+            flush_interval: float = Args.HISTORY_FLUSH_INTERVAL,
+    ):
+        self.directory = directory
+        self.stream = stream
+        self.segment_size = segment_size
+        self.flush_interval = flush_interval
+        self.buffer = bytearray()
+        self.file = None
+        self.file_size = 0
+
+    def _append(self, kind: int, chat_id: int, data: bytes):
+        if not self.directory:
+            return
+        self.buffer += RECORD.pack(kind, int(time.time() * 1000), chat_id, len(data))
+        self.buffer += data
+
+    def letter(self, chat_id: int, height: int, letter: str, user_id: int, message_id: int):
+        """
+        Writes down the letter added to the tower.
+        """
+        self._append(KIND_LETTER, chat_id, LETTER.pack(height, user_id, message_id) + letter.encode()[:200])
+
+    def fall(self, chat_id: int, height: int, reason: str):
+        """
+        Writes down the fallen tower.
+        """
+
+        number = FALL_REASONS.index(reason) if reason in FALL_REASONS else 255
+        self._append(KIND_FALL, chat_id, FALL.pack(height, number))
+
+    def built(self, chat_id: int, height: int, tower: str):
+        """
+        Writes down the built tower.
+        """
+        self._append(KIND_BUILT, chat_id, HEIGHT.pack(height) + tower.encode()[:200])
+
+    def crash(self, chat_id: int, height: int, crash_type: int):
+        """
+        Writes down the tower crashed by the bot.
+        """
+        self._append(KIND_CRASH, chat_id, CRASH.pack(height, crash_type))
+
+    def _open_segment(self):
+        """
+        Starts the new segment.
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+        start = int(time.time() * 1000)
+        path = Path(self.directory) / f"{self.stream}-{start}{SEGMENT_SUFFIX}"
+        while path.exists():
+            start += 1
+            path = Path(self.directory) / f"{self.stream}-{start}{SEGMENT_SUFFIX}"
+        self.file = open(path, "xb")
+        self.file.write(SEGMENT_HEADER.pack(MAGIC, FORMAT_VERSION))
+        self.file_size = SEGMENT_HEADER.size
+
+    def _close_segment(self):
+        if self.file is None:
+            return
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self.file = None
+
+    def _write(self, data: bytes):
+        """
+        Appends the records to the segment (they are never split between
+        two segments).
+        """
+
+        if self.file is not None and self.file_size >= self.segment_size:
+            self._close_segment()
+        if self.file is None:
+            self._open_segment()
+        self.file.write(data)
+        self.file.flush()
+        self.file_size += len(data)
+
+    async def flush(self):
+        """
+        Writes the buffered events to the disk.
+        """
+
+        if not self.buffer:
+            return
+        data, self.buffer = bytes(self.buffer), bytearray()
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, data)
+        except OSError:
+            logger.exception("Failed to write the history, %d bytes are lost", len(data))
+
+    async def run(self):
+        """
+        Writes the buffered events every `flush_interval` seconds.
+        """
+
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def close(self):
+        """
+        Writes the last events and closes the segment.
+        """
+
+        await self.flush()
+        self._close_segment()
+
+
+def _parse_event(kind: int, moment: int, chat_id: int, data: bytes, start: int, end: int) -> Optional[Event]:
+    """
+    Creates the event from its data `data[start:end]`.
+    """
+
+    moment = moment / 1000
+    if kind == KIND_LETTER:
+        height, user_id, message_id = LETTER.unpack_from(data, start)
+        letter = data[start + LETTER.size:end].decode(errors="replace")
+        return Event("letter", moment, chat_id, height, letter, user_id, message_id)
+    if kind == KIND_FALL:
+        height, number = FALL.unpack_from(data, start)
+        reason = FALL_REASONS[number] if number < len(FALL_REASONS) else UNKNOWN_REASON
+        return Event("fall", moment, chat_id, height, reason=reason)
+    if kind == KIND_BUILT:
+        (height, ) = HEIGHT.unpack_from(data, start)
+        tower = data[start + HEIGHT.size:end].decode(errors="replace")
+        return Event("built", moment, chat_id, height, tower=tower)
+    if kind == KIND_CRASH:
+        height, crash_type = CRASH.unpack_from(data, start)
+        return Event("crash", moment, chat_id, height, crash_type=crash_type)
+    # the events of the newer versions are skipped
+    return None
+
+
+def read_segment(path: Path) -> Iterator[Event]:
+    """
+    Reads the events of the segment chunk by chunk.
+    """
+
+    with open(path, "rb") as file:
+        header = file.read(SEGMENT_HEADER.size)
+        if len(header) < SEGMENT_HEADER.size or SEGMENT_HEADER.unpack(header) != (MAGIC, FORMAT_VERSION):
+            logger.warning("The segment %s is not a history segment and is skipped", path)
+            return
+
+        tail = b""
+        while True:
+            chunk = file.read(READ_CHUNK_SIZE)
+            if not chunk:
+                # the incomplete record at the end is skipped
+                return
+            data = tail + chunk
+            offset = 0
+            while offset + RECORD.size <= len(data):
+                kind, moment, chat_id, size = RECORD.unpack_from(data, offset)
+                end = offset + RECORD.size + size
+                if end > len(data):
+                    break
+                event = _parse_event(kind, moment, chat_id, data, offset + RECORD.size, end)
+                if event is not None:
+                    yield event
+                offset = end
+            tail = data[offset:]
+
+
+def _list_streams(directory: Path) -> Dict[str, List[Tuple[int, Path]]]:
+    """
+    Returns the segments of each stream ordered by their start.
+    """
+
+    streams: Dict[str, List[Tuple[int, Path]]] = dict()
+    for path in directory.glob(f"*{SEGMENT_SUFFIX}"):
+        stream, _, start = path.stem.rpartition("-")
+        if stream and start.isdigit():
+            streams.setdefault(stream, []).append((int(start), path))
+    for segments in streams.values():
+        segments.sort()
+    return streams
+
+
+def _read_stream(
+        segments: List[Tuple[int, Path]],
+        since: Optional[float],
+        until: Optional[float],
+) -> Iterator[Event]:
+    for (number, (start, path)) in enumerate(segments):
+        # the segment contains only the events from before the start of
+        # the next one (but also some from before its own start)
+        next_start = segments[number + 1][0] / 1000 if number + 1 < len(segments) else None
+        if since is not None and next_start is not None and next_start <= since:
+            # the whole segment is before `since`
+            continue
+        for event in read_segment(path):
+            if since is not None and event.time < since:
+                continue
+            if until is not None and event.time > until:
+                return
+            yield event
+
+
+def read_history(
+        directory: str = Args.HISTORY_PATH,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        chat_id: Optional[int] = None,
+) -> Iterator[Event]:
+    """
+    Yields the events (of all processes, ordered by time) from `since`
+    until `until` (unix time), only of the chat if it is given.
+    The segments that end before `since` are not even opened.
+    """
+
+    streams = [
+        _read_stream(segments, since, until)
+        for segments in _list_streams(Path(directory)).values()
+    ]
+    if len(streams) == 1:
+        events = streams[0]
+    else:
+        events = heapq.merge(*streams, key=lambda event: event.time)
+
+    if chat_id is None:
+        yield from events
+    else:
+        yield from (event for event in events if event.chat_id == chat_id)
@@ -25,7 +25,7 @@ MSG_help = (
     "Я есть бот-надзиратель за башнями.\n"
     "\n"
     "Правила простые:\n"
-    f"- башня имеет вид <b>{Params.TOWER}</b>\n"
+    f"- башня имеет вид {' или '.join(f'<b>{tower}</b>' for tower in Params.TOWERS)}\n"
     "- одна буква - одно сообщение\n"
     "- сообщения с буквами должны идти подряд, не должно быть других сообщений"
     " посреди башни\n"
@@ -42,6 +42,9 @@ MSG_help = (
     " в 00:00 я сбрасываю все собранные башни"
     f"{' и отключаюсь до 00:00 среды' if Params.ONEDAY_MODE else ', чтобы вы не скучали'}.\n"
     "\n"
+    f"Статистика чата - <code>/stats{Args.BOT_USERNAME}</code>, всех чатов -"
+    f" <code>/global_stats</code>.\n"
+    "\n"
     f"Мои исходники <a href='{_github_link}'>тут</a>."
 )
 
@@ -131,10 +134,11 @@ MSG_fall_deleted = (
 )
 
 
+# the text of the built tower is inserted into it
 MSG_tower_success = (
     "🏆🏆🏆 БАШНЯ СОБРАНА 🏆🏆🏆\n"
     "\n"
-    f"<code>{Params.TOWER}</code>"
+    "<code>{tower}</code>"
 )
 
 
@@ -161,4 +165,35 @@ MSG_crashes = [
 ]
 
 
+# the title, the counters and the lines of the reasons and the leaders are
+# inserted into it
+MSG_stats = (
+    "📊 {title}\n"
+    "\n"
+    "Построено башен: {built}\n"
+    "Самая быстрая башня: {fastest}\n"
+    "Сломано мной: {crashes}\n"
+    "Упало башен: {falls}\n"
+    "{reasons}"
+    "\n"
+    "Лучшие строители (по буквам):\n"
+    "{leaders}"
+)
+MSG_stats_chat = "Башни этого чата"
+MSG_stats_global = "Башни всех чатов"
+MSG_stats_reason = "- {reason}: {count}\n"
+MSG_stats_reasons = {
+    "fall": "лишние сообщения",
+    "fall_edited": "изменённые буквы",
+    "fall_repetition": "повторы участников",
+    "fail_similar": "похожие буквы",
+    "fall_deleted": "удалённые буквы",
+}
+MSG_stats_leader = "{place}. {name} - {letters}\n"
+MSG_stats_no_leaders = "пока никого 🦗\n"
+MSG_stats_no_fastest = "ещё не было ⏳"
+MSG_stats_seconds = "{seconds:.1f} сек ⚡"
+MSG_stats_minutes = "{minutes} мин {seconds} сек"
+
+
 __all__ = [name for name in locals().keys() if name.startswith("MSG_")]
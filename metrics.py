@@ -0,0 +1,280 @@
+"""
+Metrics of the bot in the Prometheus text format.
+All metrics of the bot are defined here and are served by a local HTTP
+endpoint (`Args.METRICS_PORT`, `0` - off):
+    curl localhost:9100/metrics
+"""
+
+import logging
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Callable, Dict, Final, List, Sequence, Tuple
+
+from config import Args
+from web import HttpServer, Request, Response
+
+
+__all__ = [
+    "Counter",
+    "Histogram",
+    "render",
+    "MetricsServer",
+    "UPDATE_SECONDS",
+    "CHECK_SECONDS",
+    "STORAGE_SECONDS",
+    "TELEGRAM_SECONDS",
+    "TELEGRAM_ERRORS",
+    "TOWER_LETTERS",
+    "TOWER_FALLS",
+    "TOWER_CRASHES",
+    "TOWERS_BUILT",
+    "FAST_PATH_UPDATES",
+]
+
+
+logger = logging.getLogger(__name__)
+
+LABELS_TYPE = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+REGISTRY: List["Metric"] = []
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for (name, value) in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """
+    The base of the metrics, registers the metric for rendering.
+    """
+
+    type: str = ""
+
+    name: str
+    description: str
+    label_names: LABELS_TYPE
+
+    def __init__(self, name: str, description: str, label_names: LABELS_TYPE = ()):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        REGISTRY.append(self)
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+
+
+class Counter(Metric):
+    """
+    The value that only grows.
+    """
+
+    type = "counter"
+    values: Dict[LABELS_TYPE, float]
+
+    def __init__(self, name: str, description: str, label_names: LABELS_TYPE = ()):
+        super().__init__(name, description, label_names)
+        self.values = dict()
+
+    def inc(self, *label_values: str, amount: float = 1):
+        self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        for (label_values, value) in self.values.items():
+            lines.append(f"{self.name}{format_labels(self.label_names, label_values)} {value}")
+        return lines
+
+
+class _Timer:
+    """
+    The context manager that observes its duration in the histogram.
+    """
+
+    __slots__ = ("histogram", "label_values", "start")
+
+    def __init__(self, histogram: "Histogram", label_values: LABELS_TYPE):
+        self.histogram = histogram
+        self.label_values = label_values
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, *self.label_values)
+
+
+class Histogram(Metric):
+    """
+    The distribution of values (usually of durations, in seconds).
+    """
+
+    type = "histogram"
+    buckets: Tuple[float, ...]
+    # labels -> [counts by buckets (not cumulative), sum, count]
+    values: Dict[LABELS_TYPE, list]
+
+    def __init__(
+            self,
+            name: str,
+            description: str,
+            label_names: LABELS_TYPE = (),
+            buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, description, label_names)
+        self.buckets = buckets
+        self.values = dict()
+
+    def observe(self, value: float, *label_values: str):
+        data = self.values.get(label_values)
+        if data is None:
+            data = self.values[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        data[0][bisect_left(self.buckets, value)] += 1
+        data[1] += value
+        data[2] += 1
+
+    def time(self, *label_values: str) -> _Timer:
+        """
+        Returns the context manager that measures the duration of its
+        block.
+        """
+        return _Timer(self, label_values)
+
+    def measure(self, *label_values: str) -> Callable:
+        """
+        Decorator, which measures the duration of the coroutine function.
+        """
+
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            async def wrapped(*args, **kwargs):
+                with self.time(*label_values):
+                    return await func(*args, **kwargs)
+            return wrapped
+
+        return decorator
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        bucket_names = self.label_names + ("le", )
+        for (label_values, (counts, total, count)) in self.values.items():
+            cumulative = 0
+            for (bound, bucket_count) in zip(self.buckets + (float("inf"), ), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = format_labels(bucket_names, label_values + (le, ))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {total}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+# === the bot metrics ==================================================
+
+
+UPDATE_SECONDS: Final[Histogram] = Histogram(
+    "tower_update_seconds",
+    "Processing time of the messages in the groups.",
+)
+CHECK_SECONDS: Final[Histogram] = Histogram(
+    "tower_check_seconds",
+    "Time of the tower checks.",
+    ("check", ),
+)
+STORAGE_SECONDS: Final[Histogram] = Histogram(
+    "tower_storage_seconds",
+    "Time of the storage operations.",
+    ("storage", "operation"),
+)
+TELEGRAM_SECONDS: Final[Histogram] = Histogram(
+    "tower_telegram_seconds",
+    "Time of the calls to the telegram API.",
+    ("method", ),
+)
+TELEGRAM_ERRORS: Final[Counter] = Counter(
+    "tower_telegram_errors_total",
+    "Failed calls to the telegram API.",
+    ("method", "error"),
+)
+TOWER_LETTERS: Final[Counter] = Counter(
+    "tower_letters_total",
+    "Letters added to the towers.",
+)
+TOWER_FALLS: Final[Counter] = Counter(
+    "tower_falls_total",
+    "Fallen towers by the reason.",
+    ("reason", ),
+)
+TOWER_CRASHES: Final[Counter] = Counter(
+    "tower_crashes_total",
+    "Towers crashed by the bot by the crash type.",
+    ("crash_type", ),
+)
+TOWERS_BUILT: Final[Counter] = Counter(
+    "tower_built_total",
+    "Successfully built towers.",
+)
+FAST_PATH_UPDATES: Final[Counter] = Counter(
+    "tower_fast_path_total",
+    "Group messages by the decision of the fast path.",
+    ("verdict", ),
+)
+
+
+# ===
+
+
+def render() -> str:
+    """
+    Returns all metrics in the text exposition format.
+    """
+
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    Local HTTP endpoint `GET /metrics`.
+    The metrics are not needed for the bot to work, so if the port is
+    busy, it is only logged.
+    """
+
+    server: HttpServer
+
+    def __init__(self, host: str = Args.METRICS_LISTEN, port: int = Args.METRICS_PORT):
+        self.server = HttpServer(host, port)
+        self.server.route("GET", "/metrics", self.metrics)
+
+    async def start(self):
+        try:
+            await self.server.start()
+        except OSError:
+            logger.exception("Failed to start the metrics server, the metrics are not served")
+
+    async def close(self):
+        await self.server.close()
+
+    async def metrics(self, request: Request) -> Response:
+        return Response(
+            body=render().encode(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
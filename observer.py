@@ -1,21 +1,28 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Tuple, Optional, Final, Literal
+import logging
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, List, Set, Tuple, Optional, Final, Literal
 from dataclasses import dataclass, field
+from datetime import tzinfo
 
 from telegram import Update, Chat
-from telegram.ext.filters import Text
-from telegram.error import BadRequest
-
-from libmc import Client as McClient
 
 from config import Args, Params, Checks
-from funcs import SIMILAR_CHARS, get_all_possible_chars
-from periodic import is_same_day_today
+from funcs import TowerTrie, TrieNode, get_shard
+from codec import TowerCodec
+from periodic import is_same_day_today, get_chat_timezone, get_day_epoch, get_day_end
+from storage import BaseStorage, get_storage
+from registry import ChatRegistry
+from verifier import DeletionVerifier
+from metrics import CHECK_SECONDS
+from snapshot import Snapshot
 
 
 __all__ = [
+    "WriteBehind",
     "ChatObserver",
     "Observer",
 ]
@@ -36,10 +43,14 @@ TOWER_ON_MC_TYPE = Tuple[
     IS_DISABLE_TYPE,
 ]
 
-IS_LETTER = Text(get_all_possible_chars(Params.TOWER, similar_emabled=Checks.SIMILAR))
-TOWER_LENGTH: Final[int] = len(Params.TOWER)
+TOWER_TRIE: Final[TowerTrie] = TowerTrie(Params.TOWERS, similar_emabled=Checks.SIMILAR)
+TOWER_CODEC: Final[TowerCodec] = TowerCodec(TOWER_TRIE)
+DELETION_VERIFIER: Final[DeletionVerifier] = DeletionVerifier()
+
+logger = logging.getLogger(__name__)
 
-TOWER_META_KEY: Final[str] = "all_towers_chat_ids"
+# the old list of all chat ids, now it is only migrated to the registry
+LEGACY_META_KEY: Final[str] = "all_towers_chat_ids"
 get_null_tower_data = lambda: [[], 0, False, False]
 
 
@@ -51,6 +62,12 @@ class Tower:
     """
 
     letters: TOWER_LETTERS_TYPE = field(default_factory=list)
+    # indexes, they are updated together with the letters
+    _chars: str = field(init=False, repr=False, compare=False)  # the already built text
+    _user_ids: Set[ID_AUTHOR_TYPE] = field(init=False, repr=False, compare=False)  # the participants
+    _message_ids: Set[ID_MESSAGE_TYPE] = field(init=False, repr=False, compare=False)  # the tower messages
+    _node: TrieNode = field(init=False, repr=False, compare=False)  # the state in the tower trie
+
     CHECKING_CODES = Optional[Literal[
         "ignore",
         "fall",
@@ -62,50 +79,30 @@ class Tower:
         "fall_deleted",
     ]]
 
-    def __len__(self):
+    def __post_init__(self):
         """
-        Returns the number of already built letters.
+        Builds the indexes of the already built letters.
         """
-        return len(self.letters)
 
-    def __str__(self):
-        return "".join(self._chars)
+        node = TOWER_TRIE.walk(letter[0] for letter in self.letters)
+        if node is None:
+            # the letters of the towers that are no longer built
+            self.letters = []
+            node = TOWER_TRIE.root
 
-    @property
-    def _chars(self) -> List[LETTER_TYPE]:
-        """
-        A list of letters that are already built.
-        """
-        return list(letter[0] for letter in self.letters)
+        self._chars = "".join(letter[0] for letter in self.letters)
+        self._user_ids = set(letter[1] for letter in self.letters)
+        self._message_ids = set(letter[2] for letter in self.letters)
+        self._node = node
 
-    @property
-    def _user_ids(self) -> List[ID_AUTHOR_TYPE]:
-        """
-        A list of user id's that have participated in the current tower.
-        """
-        return list(letter[1] for letter in self.letters)
-
-    @property
-    def _message_ids(self) -> List[ID_MESSAGE_TYPE]:
-        """
-        A list of the id messages that build up the tower.
-        """
-        return list(letter[2] for letter in self.letters)
-
-    @property
-    def _expected_letters(self) -> List[LETTER_TYPE]:
+    def __len__(self):
         """
-        A list of letters, one of which may be the next in the tower.
-        If the tower is built, it will raise an error.
+        Returns the number of already built letters.
         """
+        return len(self.letters)
 
-        expected_char = Params.TOWER[len(self)]
-        possible_chars = [expected_char]
-
-        if Checks.SIMILAR:
-            possible_chars += SIMILAR_CHARS.get(expected_char, [])
-
-        return possible_chars
+    def __str__(self):
+        return self._chars
 
     def _is_repeat_participant(self, user_id) -> bool:
         """
@@ -118,15 +115,8 @@ class Tower:
         Checks if there are deleted messages in the tower.
         """
 
-        coros = [
-            chat.forward_to(Args.NULL_CHAT, message_id)
-            for message_id in self._message_ids
-        ]
-        try:
-            await asyncio.gather(*coros)
-            return True
-        except BadRequest:
-            return False
+        message_ids = [letter[2] for letter in self.letters]
+        return await DELETION_VERIFIER.verify(chat, message_ids)
 
     # =====
 
@@ -135,13 +125,25 @@ class Tower:
         """
         Checks if the tower is built or not.
         """
-        return len(self) == TOWER_LENGTH
+        return self._node.completed is not None
+
+    @property
+    def text(self) -> str:
+        """
+        Returns the text of the built tower.
+        """
+        return TOWER_TRIE.towers[self._node.completed]
 
     def add_letter(self, letter: LETTER_MSG_TYPE):
         """
         Adds the next letter to the tower.
         """
+
+        self._node = self._node.children[letter[0]]
         self.letters.append(letter)
+        self._chars += letter[0]
+        self._user_ids.add(letter[1])
+        self._message_ids.add(letter[2])
 
     async def check_correct(self, update: Update) -> CHECKING_CODES:
         """
@@ -159,23 +161,26 @@ class Tower:
         """
 
         message = update.message
-        if Checks.CHANGING and (update.edited_message is not None):
-            # some message has been edited
-            if update.edited_message.id in self._message_ids:
-                # if the message is from the tower, the tower has fallen
-                return "fall_edited"
-            else:
-                # if not, we just ignore the event
-                return "ignore"
-
-        if (not IS_LETTER.filter(message)) or (message.text not in self._expected_letters):
-            # if message is not an expected letter, the tower is fallen;
-            # remember to check for correctness after building
-            return "fall"
-
-        if Checks.UNIQUENESS and self._is_repeat_participant(message.from_user.id):
-            # if the user has already participated, he cannot do it a second time
-            return "fall_repetition"
+        with CHECK_SECONDS.time("changing"):
+            if Checks.CHANGING and (update.edited_message is not None):
+                # some message has been edited
+                if update.edited_message.id in self._message_ids:
+                    # if the message is from the tower, the tower has fallen
+                    return "fall_edited"
+                else:
+                    # if not, we just ignore the event
+                    return "ignore"
+
+        with CHECK_SECONDS.time("letter"):
+            if message.text not in self._node.children:
+                # if message is not an expected letter, the tower is fallen;
+                # remember to check for correctness after building
+                return "fall"
+
+        with CHECK_SECONDS.time("uniqueness"):
+            if Checks.UNIQUENESS and self._is_repeat_participant(message.from_user.id):
+                # if the user has already participated, he cannot do it a second time
+                return "fall_repetition"
 
     async def check_after_completion(self, update: Update) -> CHECKING_COMPLETE_CODES:
         """
@@ -192,17 +197,131 @@ class Tower:
         Some checks may not be run depending on the settings.
         """
 
-        if Checks.SIMILAR and (str(self) != Params.TOWER):
-            # if the tower is built but does not equal the required tower, then
-            # someone tricked it!
-            return "fail_similar"
+        with CHECK_SECONDS.time("similar"):
+            if Checks.SIMILAR and self._node.completed not in self._node.clean:
+                # if the tower is built but does not equal the required tower, then
+                # someone tricked it!
+                return "fail_similar"
+
+        with CHECK_SECONDS.time("deleting"):
+            if Checks.DELETING:
+                # since it is too high cost, checking is the most recent
+                if not (await self._is_no_deleted(update.effective_chat)):
+                    # if any message from the tower has been deleted, the tower has fallen
+                    return "fall_deleted"
+
+
+class WriteBehind:
+    """
+    A write-behind layer between the chat observers and the storage.
+    The changed observers are only marked as dirty and are written with
+    one multi-set every `interval` seconds or as soon as `batch_size` of
+    them are collected. All changes of one observer between two flushes
+    are coalesced into one write.
+    The data is written with an expiry at the end of the day of its chat.
+    If there is a snapshot, the written data is also remembered in it.
+    The observers being written are counted in `writing` until their
+    writes end (a changed observer can be written again before the first
+    write ends), they are not saved yet either.
+    """
+
+    storage: BaseStorage
+    interval: float
+    batch_size: int
+    snapshot: Optional[Snapshot]
+    dirty: Dict[str, ChatObserver]
+    writing: Counter[str]
+    _batch_full: Optional[asyncio.Event]
+
+    def __init__(
+            self,
+            storage: BaseStorage,
+            interval: float = Args.FLUSH_INTERVAL,
+            batch_size: int = Args.FLUSH_BATCH_SIZE,
+            snapshot: Optional[Snapshot] = None,
+    ):
+        self.storage = storage
+        self.interval = interval
+        self.batch_size = batch_size
+        self.snapshot = snapshot
+        self.dirty = dict()
+        self.writing = Counter()
+        self._batch_full = None  # it is created inside the event loop
+
+    def mark(self, chat: ChatObserver):
+        """
+        Marks the observer as changed.
+        """
+
+        self.dirty[chat.key] = chat
+        if len(self.dirty) >= self.batch_size and self._batch_full is not None:
+            self._batch_full.set()
+
+    def is_saved(self, chat: ChatObserver) -> bool:
+        """
+        Checks if all changes of the observer are in the storage.
+        """
+        return chat.key not in self.dirty and not self.writing[chat.key]
+
+    async def flush(self):
+        """
+        Writes all dirty observers to the storage.
+        The observers that could not be written (for any error of the
+        storage) remain dirty.
+        """
 
-        if Checks.DELETING:
-            # since it is too high cost, checking is the most recent
-            if not (await self._is_no_deleted(update.effective_chat)):
-                # if any message from the tower has been deleted, the tower has fallen
-                return "fall_deleted"
+        if not self.dirty:
+            return
 
+        dirty, self.dirty = self.dirty, dict()
+        self.writing.update(dirty.keys())
+        try:
+            await self._write(dirty)
+        finally:
+            for key in dirty:
+                self.writing[key] -= 1
+                if not self.writing[key]:
+                    del self.writing[key]
+
+    async def _write(self, dirty: Dict[str, ChatObserver]):
+        # the observers of the chats from the same timezone and day expire
+        # together, so usually there are only a few groups
+        data_by_expiry: Dict[int, Dict[str, bytes]] = dict()
+        for (key, chat) in dirty.items():
+            value = chat._dump()
+            data_by_expiry.setdefault(chat.expire, dict())[key] = value
+            if self.snapshot is not None:
+                self.snapshot.remember(chat.day, chat.chat_id, value)
+
+        for (expire, data) in data_by_expiry.items():
+            try:
+                is_success, failed_keys = await self.storage.set_multi(data, expire)
+            except asyncio.TimeoutError:
+                is_success, failed_keys = False, list(data.keys())
+            except Exception:
+                logger.exception("Failed to write %d observers, they are written later", len(data))
+                is_success, failed_keys = False, list(data.keys())
+            if not is_success:
+                for key in failed_keys:
+                    self.dirty.setdefault(key, dirty[key])
+
+    async def run(self):
+        """
+        Flushes the dirty observers every `interval` seconds or as soon
+        as the batch is full. A failed flush does not stop the writing.
+        """
+
+        self._batch_full = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_full.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush the observers")
 
 
 @dataclass
@@ -212,10 +331,12 @@ class ChatObserver:
     Also stores some flags to control building and crashes: is it
     necessary to observe this chat, is the tower built today and how
     many times the bot crashed it.
+    The data belongs to one day, on the next day the chat starts over.
     """
 
-    mc_client: McClient
+    write_behind: WriteBehind = field(repr=False)
     chat_id: int
+    day: int
     tower: Tower = field(default_factory=Tower)
     crash_times: CRASH_TIMES_TYPE = 0
     is_built: IS_BUILT_TYPE = False
@@ -227,17 +348,45 @@ class ChatObserver:
     def __repr__(self):
         return f"<{self.chat_id} - \"{self.tower}\" - {self.is_built} / {self.crash_times}>"
 
+    @staticmethod
+    def get_key(chat_id: int, day: int) -> str:
+        """
+        Returns the storage key of the chat data for the day.
+        """
+        return f"{day}_{chat_id}"
+
+    @property
+    def key(self) -> str:
+        return self.get_key(self.chat_id, self.day)
+
+    @property
+    def expire(self) -> int:
+        """
+        Returns the moment when the data expires: the end of the day in
+        the timezone of the chat.
+        """
+        return get_day_end(self.day, get_chat_timezone(self.chat_id))
+
     @classmethod
-    def _from_mc(cls, mc_client: McClient, chat_id: int) -> ChatObserver:
+    async def _from_mc(cls, write_behind: WriteBehind, chat_id: int, day: int) -> ChatObserver:
         """
-        Loads data from MC by chat_id and creates an observer object.
+        Loads data from the storage by chat_id and creates an observer object.
         """
 
-        data: TOWER_ON_MC_TYPE = mc_client.get(str(chat_id))
-        data = data or get_null_tower_data()
+        value = await write_behind.storage.get(cls.get_key(chat_id, day))
+        return cls._from_value(write_behind, chat_id, day, value)
+
+    @classmethod
+    def _from_value(cls, write_behind: WriteBehind, chat_id: int, day: int, value) -> ChatObserver:
+        """
+        Creates an observer object from the value stored in the storage.
+        """
+
+        data: TOWER_ON_MC_TYPE = TOWER_CODEC.decode(value) or get_null_tower_data()
         new_chat_observer = cls(
-            mc_client=mc_client,
+            write_behind=write_behind,
             chat_id=chat_id,
+            day=day,
             tower=Tower(letters=data[0]),
             crash_times=data[1],
             is_built=data[2],
@@ -245,9 +394,9 @@ class ChatObserver:
         )
         return new_chat_observer
 
-    def _to_mc(self):
+    def _dump(self) -> bytes:
         """
-        Overwrites its data in the MC.
+        Returns its data in the form in which it is stored in the storage.
         """
 
         data: TOWER_ON_MC_TYPE = (
@@ -256,13 +405,13 @@ class ChatObserver:
             self.is_built,
             self.is_disable,
         )
-        self.mc_client.set(str(self.chat_id), data)
+        return TOWER_CODEC.encode(data)
 
-    def _delete(self):
+    def _to_mc(self):
         """
-        Deletes all data about this chat from memory.
+        Marks its data to be overwritten in the storage.
         """
-        self.mc_client.delete(str(self.chat_id))
+        self.write_behind.mark(self)
 
     def add_letter(self, letter: LETTER_MSG_TYPE):
         """
@@ -322,67 +471,351 @@ class ChatObserver:
 class Observer:
     """
     A class that groups observers from all chats.
-    The is_enable parameter indicates whether observers are working now
-    or not (needed for WEDNESDAY_MODE).
+    Every chat lives by the day of its timezone: it is observed only
+    during the day it was enabled in, and the bot works in it only on
+    Wednesdays of its timezone (for WEDNESDAY_MODE).
+    The ids of the observed chats are loaded from the registry by `load()`,
+    which must be called inside the event loop before the bot starts. The
+    observers themselves are loaded on the first access and are kept in
+    an LRU cache: the observers, which are unused for `idle_time` seconds
+    or do not fit into `cache_size`, are forgotten as soon as their data
+    is written to the storage. The storage is chosen by `Args.STORAGE`
+    unless it is given.
+    The written states are also saved to the local snapshot file (if its
+    path is set), on start it restores the towers that the storage has
+    lost.
+    If the chats are split between the processes, the observer knows only
+    the chats of its `shard` (of `shards`).
+    All data in the storage expires at the end of the day of its chat by
+    itself. The chat stops being observed as soon as its day is over, and
+    it is forgotten by the `rollover` of its timezone.
     """
 
-    is_enable: bool
-    infos: Dict[int, ChatObserver]
-    mc_client: McClient
-
-    def __init__(self):
-        self.is_enable = is_same_day_today()
-        self.mc_client = McClient([Args.MEMCACHED_HOST], prefix="tower_")
-        self._init_infos()
+    shard: int
+    shards: int
+    cache_size: int
+    idle_time: float
+    chat_days: Dict[int, int]  # the observed chats and their days
+    infos: OrderedDict[int, ChatObserver]  # the least recently used go first
+    used: Dict[int, float]
+    storage: BaseStorage
+    registry: ChatRegistry
+    snapshot: Optional[Snapshot]
+    write_behind: WriteBehind
+
+    def __init__(
+            self,
+            storage: Optional[BaseStorage] = None,
+            shard: int = 0,
+            shards: int = 1,
+            cache_size: int = Args.OBSERVER_CACHE_SIZE,
+            idle_time: float = Args.OBSERVER_IDLE_TIME,
+            snapshot_path: str = Args.SNAPSHOT_PATH,
+    ):
+        self.shard = shard
+        self.shards = shards
+        self.cache_size = cache_size
+        self.idle_time = idle_time
+        self.chat_days = dict()
+        self.infos = OrderedDict()
+        self.used = dict()
+        self.storage = storage or get_storage()
+        self.registry = ChatRegistry(self.storage)
+        if snapshot_path and shards > 1:
+            # each process has its own file
+            snapshot_path = f"{snapshot_path}.{shard}"
+        self.snapshot = Snapshot(snapshot_path) if snapshot_path else None
+        self.write_behind = WriteBehind(self.storage, snapshot=self.snapshot)
+
+    @staticmethod
+    def get_day(chat_id: int) -> int:
+        """
+        Returns the current day of the chat.
+        """
+        return get_day_epoch(get_chat_timezone(chat_id))
+
+    async def load(self):
+        """
+        Loads from the registry the ids of all chats that are already
+        building a towers today (by their timezones), and of the chats,
+        whose yesterday has not been ended yet.
+        """
+
+        start = time.perf_counter()
+        self.infos = OrderedDict()
+        self.used = dict()
+        if self.shard == 0:
+            # the old data is migrated only once, by the first shard
+            await self._migrate_legacy_meta()
+
+        # the days of all timezones differ from the UTC one by a day at most
+        self.chat_days = dict()
+        utc_day = get_day_epoch()
+        for day in range(utc_day - 2, utc_day + 2):
+            for chat_id in await self.registry.all(day):
+                if get_shard(chat_id, self.shards) != self.shard:
+                    continue
+                if day in (self.get_day(chat_id) - 1, self.get_day(chat_id)):
+                    self.chat_days[chat_id] = max(day, self.chat_days.get(chat_id, day))
+        if self.snapshot is not None:
+            await self._restore_snapshot()
+
+        logger.info(
+            "Loaded %d chats in %.3f seconds",
+            len(self.chat_days),
+            time.perf_counter() - start,
+        )
 
-    def _init_infos(self):
+    async def _migrate_legacy_meta(self):
         """
-        Loads from MC the data of all chats that are already building a
-        towers.
+        Moves the chats from the old list of chat ids (and their data
+        from the old keys) to the registry of the current day.
         """
 
-        self.infos = dict()
-        all_chats = self.mc_client.get(TOWER_META_KEY)
-        if all_chats is None:
-            all_chats = []
-            self.mc_client.set(TOWER_META_KEY, [])
+        legacy_chats = await self.storage.get(LEGACY_META_KEY)
+        if legacy_chats is None:
+            return
 
-        for chat_id in all_chats:
-            self.infos[chat_id] = ChatObserver._from_mc(self.mc_client, chat_id)
+        legacy_keys = [str(chat_id) for chat_id in legacy_chats]
+        values = await self.storage.get_multi(legacy_keys)
+        for chat_id in legacy_chats:
+            day = self.get_day(chat_id)
+            await self.registry.add(chat_id, day)
+            value = values.get(str(chat_id))
+            if value is not None:
+                chat = ChatObserver._from_value(self.write_behind, chat_id, day, value)
+                chat._to_mc()
+        await self.write_behind.flush()
+
+        await self.storage.delete_multi(legacy_keys)
+        await self.storage.delete(LEGACY_META_KEY)
+
+    async def _restore_snapshot(self):
+        """
+        Reconciles the snapshot with the storage: the storage is newer, but
+        the chats that it has lost are restored from the snapshot. The
+        states of the ended days are dropped.
+        """
+
+        states = {
+            chat_id: (day, state)
+            for (chat_id, (day, state)) in self.snapshot.load().items()
+            if get_shard(chat_id, self.shards) == self.shard
+            and day == self.get_day(chat_id)
+        }
+        self.snapshot.states = dict(states)
+        if not states:
+            return
+
+        keys = {ChatObserver.get_key(chat_id, day): chat_id for (chat_id, (day, _)) in states.items()}
+        stored = await self.storage.get_multi(keys.keys())
+        for (key, value) in stored.items():
+            if isinstance(value, bytes):
+                chat_id = keys[key]
+                self.snapshot.remember(states[chat_id][0], chat_id, value)
+
+        lost: Dict[int, Dict[str, bytes]] = dict()
+        for (key, chat_id) in keys.items():
+            if key not in stored:
+                day, state = states[chat_id]
+                expire = get_day_end(day, get_chat_timezone(chat_id))
+                lost.setdefault(expire, dict())[key] = state
+        for (expire, data) in lost.items():
+            await self.storage.set_multi(data, expire)
+
+        for (chat_id, (day, _)) in states.items():
+            if self.chat_days.get(chat_id) != day:
+                await self.registry.add(chat_id, day)
+                self.chat_days[chat_id] = day
+        logger.info("Restored %d chats from the snapshot", sum(map(len, lost.values())))
+
+    def _forget(self, chat_id: int):
+        """
+        Forgets everything about the chat, whose day is over (its data in
+        the storage expires by itself).
+        """
+
+        del self.chat_days[chat_id]
+        self.infos.pop(chat_id, None)
+        self.used.pop(chat_id, None)
+        if self.snapshot is not None:
+            self.snapshot.forget(chat_id)
+
+    def _remember(self, chat: ChatObserver):
+        """
+        Puts the observer into the cache as the most recently used one.
+        """
+
+        self.infos[chat.chat_id] = chat
+        self.infos.move_to_end(chat.chat_id)
+        self.used[chat.chat_id] = time.monotonic()
+        if len(self.infos) > self.cache_size:
+            self.evict()
+
+    def evict(self):
+        """
+        Forgets the least recently used observers that are idle or do not
+        fit into the cache. The observers with unsaved changes (or being
+        written right now) are kept until they are written.
+        """
+
+        idle_since = time.monotonic() - self.idle_time
+        excess = len(self.infos) - self.cache_size
+        for (chat_id, chat) in list(self.infos.items()):
+            if excess <= 0 and self.used[chat_id] > idle_since:
+                # the rest are used even more recently
+                break
+            if not self.write_behind.is_saved(chat):
+                continue
+            del self.infos[chat_id]
+            del self.used[chat_id]
+            excess -= 1
 
     @property
     def all_chats(self) -> List[int]:
         """
-        Returns a list with the ids of all chats that have observers.
+        Returns a list with the ids of all observed chats.
         """
-        return list(self.infos.keys())
+        return list(self.chat_days)
 
-    def is_looked(self, chat_id: int) -> bool:
+    def is_working(self, chat_id: int) -> bool:
+        """
+        Checks if the bot works in this chat today (in its timezone).
         """
-        Checks if there is an observer for this chat.
+        return is_same_day_today(get_chat_timezone(chat_id))
+
+    def is_cached(self, chat_id: int) -> bool:
+        """
+        Checks if the observer of this chat is kept in memory.
         """
         return chat_id in self.infos
 
-    def get(self, chat_id: int) -> ChatObserver:
+    def is_looked(self, chat_id: int) -> bool:
         """
-        Returns the observer for this chat.
+        Checks if there is an observer for this chat today.
         """
-        return self.infos[chat_id]
 
-    def add(self, chat_id: int):
+        day = self.chat_days.get(chat_id)
+        return day is not None and day == self.get_day(chat_id)
+
+    TRIAGE_CODES = Literal[
+        "ignore",
+        "letter",
+        "edit",
+        "check",
+    ]
+
+    def triage(self, chat_id: int, text: Optional[str], edited_id: Optional[int] = None) -> TRIAGE_CODES:
+        """
+        Decides what the message of the chat (or the edit of the message
+        `edited_id`) is for the towers, only by what is already in memory:
+        - "ignore" - it does not matter, the tower does not change
+        - "letter" - it can be the next letter
+        - "edit" - it is the edit of a tower message
+        - "check" - it needs the full processing (the observer is not in
+          memory or the message falls the tower)
+        The decision is right only if the chat has no unprocessed updates.
+        """
+
+        day = self.chat_days.get(chat_id)
+        if day is None:
+            return "ignore"
+        chat = self.infos.get(chat_id)
+        if chat is None or chat.day != day:
+            return "check"
+        if chat.is_disable:
+            return "ignore"
+
+        if edited_id is not None:
+            is_tower_edit = Checks.CHANGING and edited_id in chat.tower._message_ids
+            return "edit" if is_tower_edit else "ignore"
+        if TOWER_TRIE.is_possible(text):
+            return "letter"
+        # if there are no letters, nothing can fall
+        return "check" if chat.tower.letters else "ignore"
+
+    async def get(self, chat_id: int) -> ChatObserver:
+        """
+        Returns the observer for this chat (the chat must be observed),
+        loads it from the storage if it is not in the cache.
+        """
+
+        day = self.get_day(chat_id)
+        chat = self.infos.get(chat_id)
+        if chat is None or chat.day != day:
+            key = ChatObserver.get_key(chat_id, day)
+            # the evicted observer may still wait for writing, then it is
+            # the most recent one
+            chat = self.write_behind.dirty.get(key)
+            if chat is None:
+                loaded = await ChatObserver._from_mc(self.write_behind, chat_id, day)
+                # it could be loaded by someone else at the same time
+                cached = self.infos.get(chat_id)
+                chat = cached if cached is not None and cached.day == day else loaded
+        self._remember(chat)
+        return chat
+
+    async def add(self, chat_id: int):
+        """
+        Creates a new observer for the given chat and registers it.
+        """
+
+        day = self.get_day(chat_id)
+        self.chat_days[chat_id] = day
+        chat = ChatObserver(
+            write_behind=self.write_behind,
+            chat_id=chat_id,
+            day=day,
+        )
+        # the empty state is stored too, so the chat gets into the snapshot
+        chat._to_mc()
+        self._remember(chat)
+        await self.registry.add(chat_id, day)
+
+    def rollover(self, timezone: tzinfo) -> List[int]:
         """
-        Creates a new observer for the given chat.
+        Ends the day of the chats from the timezone and returns the ids of
+        the chats that were observed during it.
         """
 
-        self.infos[chat_id] = ChatObserver(mc_client=self.mc_client, chat_id=chat_id)
-        self.mc_client.set(TOWER_META_KEY, list(self.infos.keys()))
+        day = get_day_epoch(timezone)
+        ended_chats = [
+            chat_id
+            for (chat_id, chat_day) in self.chat_days.items()
+            if chat_day < day and get_chat_timezone(chat_id) == timezone
+        ]
+        for chat_id in ended_chats:
+            self._forget(chat_id)
+        return ended_chats
+
+    async def run(self):
+        """
+        Writes the changes of the observers in the background (see
+        `WriteBehind.run`), forgets the idle ones and saves the snapshot.
+        """
+
+        async def evict_periodically():
+            while True:
+                await asyncio.sleep(Args.EVICT_INTERVAL)
+                self.evict()
+
+        coros = [self.write_behind.run(), evict_periodically()]
+        if self.snapshot is not None:
+            coros.append(self.snapshot.run())
+        await asyncio.gather(*coros)
+
+    async def flush(self):
+        """
+        Writes all unsaved changes of the observers.
+        """
+        await self.write_behind.flush()
 
-    def delete_all(self):
+    async def close(self):
         """
-        Deletes all observers.
+        Writes the last changes and closes the storage.
         """
 
-        for chat in self.infos.values():
-            chat._delete()
-        self.infos = dict()
-        self.mc_client.set(TOWER_META_KEY, [])
+        await self.flush()
+        if self.snapshot is not None:
+            await self.snapshot.save()
+        self.storage.close()
@@ -1,89 +1,293 @@
+"""
+The days of the chats and the daily jobs.
+Every chat lives by the day of its timezone (`Args.CHAT_TIMEZONES`, the
+rest use `Args.TIMEZONE`), so its towers start over at its own midnight.
+The jobs are kept in a timer heap: the scheduler sleeps until the
+nearest one, runs it and puts it back with the next midnight of its
+timezone.
+"""
+
 import asyncio
 import datetime as dt
+import heapq
+import logging
 import time
-from typing import Callable, Coroutine, List
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Callable, Coroutine, Dict, Final, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
-from config import Params
+from config import Args, Params
+from storage import BaseStorage
 
 
 __all__ = [
+    "ACTION_TYPE",
+
+    "DEFAULT_TIMEZONE",
+    "get_chat_timezone",
+    "get_all_timezones",
+
     "is_same_day_today",
     "is_next_day_today",
+    "get_day_epoch",
+    "get_day_end",
 
+    "Scheduler",
     "add_action",
-    "wait_for_next_day",
     "everyday_cron",
 ]
 
 
+logger = logging.getLogger(__name__)
+
 SECOND_IN_DAYS = 24 * 60 * 60
 ACTION_TYPE = Callable[[], Coroutine]
+JOB_TYPE = Tuple[str, dt.tzinfo, ACTION_TYPE]
+
+EPOCH_ORDINAL: Final[int] = dt.date(1970, 1, 1).toordinal()
+DEFAULT_TIMEZONE: Final[dt.tzinfo] = ZoneInfo(Args.TIMEZONE)
+CHAT_TIMEZONES: Final[Dict[int, dt.tzinfo]] = {
+    chat_id: ZoneInfo(name)
+    for (chat_id, name) in Args.CHAT_TIMEZONES.items()
+}
+# the moment of the last run of the job is kept under this key
+LAST_RUN_KEY_TEMPLATE: Final[str] = "cron_last_run_{}"
+
+actions: List[JOB_TYPE] = []
+
 
-actions: List[ACTION_TYPE] = []
+def get_chat_timezone(chat_id: int) -> dt.tzinfo:
+    """
+    Returns the timezone by which the chat lives.
+    """
+    return CHAT_TIMEZONES.get(chat_id, DEFAULT_TIMEZONE)
+
+
+def get_all_timezones() -> List[dt.tzinfo]:
+    """
+    Returns all timezones of the chats, the default one goes first.
+    """
+    return list(dict.fromkeys([DEFAULT_TIMEZONE, *CHAT_TIMEZONES.values()]))
 
 
-def is_same_day_today() -> bool:
+def is_same_day_today(timezone: dt.tzinfo = dt.timezone.utc) -> bool:
     """
-    Returns whether the bot should work today (in UTC) or not.
+    Returns whether the bot should work today (in the timezone) or not.
     """
 
     if not Params.ONEDAY_MODE:
         # it should always work if it is not a one-day mode
         return True
 
-    utc_now = dt.datetime.utcnow()
-    return dt.date.isoweekday(utc_now) == Params.DAY_NUMBER
+    now = dt.datetime.now(timezone)
+    return now.isoweekday() == Params.DAY_NUMBER
 
 
-def is_next_day_today() -> bool:
+def is_next_day_today(timezone: dt.tzinfo = dt.timezone.utc) -> bool:
     """
-    Returns whether the bot should shut down today(in UTC) or not.
+    Returns whether the bot should shut down today (in the timezone) or
+    not.
     """
 
     if not Params.ONEDAY_MODE:
         # it should not shut down without a one-day mode
         return False
 
-    utc_now = dt.datetime.utcnow()
+    now = dt.datetime.now(timezone)
     next_day_number = Params.DAY_NUMBER % 7 + 1
-    return dt.date.isoweekday(utc_now) == next_day_number
+    return now.isoweekday() == next_day_number
 
 
-def add_action(action: ACTION_TYPE):
+def get_day_epoch(timezone: dt.tzinfo = dt.timezone.utc, moment: Optional[float] = None) -> int:
     """
-    Appends the action to the list of others actions.
-    Actions are executed every day at midnight.
-    The action must be an asynchronous function, the actions are
-    executed one after the other.
+    Returns the number of the day (in the timezone) since the epoch, by
+    default of the current one.
+    All tower data is tagged with it, so the new day starts with the new
+    data without deleting anything.
     """
-    actions.append(action)
+
+    moment = time.time() if moment is None else moment
+    return dt.datetime.fromtimestamp(moment, timezone).toordinal() - EPOCH_ORDINAL
 
 
-async def wait_for_next_day():
+def get_day_end(day: int, timezone: dt.tzinfo = dt.timezone.utc) -> int:
     """
-    Calculates how much time is left until midnight and waits for that
-    time.
+    Returns the timestamp of the end of the day (the midnight in the
+    timezone), the data of the day expires then.
     """
 
-    now = dt.datetime.utcnow()
-    midnight = now.replace(hour=0, minute=0, second=1)
-    seconds_from_midnight = (now - midnight).seconds
-    await asyncio.sleep(SECOND_IN_DAYS - seconds_from_midnight)
+    next_date = dt.date.fromordinal(EPOCH_ORDINAL + day + 1)
+    midnight = dt.datetime.combine(next_date, dt.time(), tzinfo=timezone)
+    return int(midnight.timestamp())
 
 
-async def wait_minute():
-    # testing function
-    await asyncio.sleep(60 - (time.time() % 60))
+@dataclass(order=True)
+class Job:
+    """
+    The job of the scheduler, it runs every day at the midnight of its
+    timezone.
+    The jobs are ordered by the moment of the next run.
+    """
+
+    when: int
+    number: int
+    name: str = field(compare=False)
+    timezone: dt.tzinfo = field(compare=False)
+    action: ACTION_TYPE = field(compare=False)
+
+    @property
+    def last_run_key(self) -> str:
+        return LAST_RUN_KEY_TEMPLATE.format(self.name)
+
+    def get_last_midnight(self) -> int:
+        """
+        Returns the moment of the last run that should already have been.
+        """
+        return get_day_end(get_day_epoch(self.timezone) - 1, self.timezone)
+
+    def reschedule(self):
+        """
+        Moves the job to the next midnight after its current run.
+        It is counted from the planned moment, not from the real one, so
+        the delays do not add up.
+        """
+        self.when = get_day_end(get_day_epoch(self.timezone, self.when), self.timezone)
+
+
+class Scheduler:
+    """
+    The timer heap of the daily jobs.
+    All jobs are waited for by one task, however many there are; the due
+    jobs are executed one after the other. The moments are absolute, so
+    the scheduler does not drift.
+    If there is a storage, the moments of the last runs are kept in it,
+    and the runs missed while the bot was stopped are made up (once) on
+    start.
+    """
+
+    storage: Optional[BaseStorage]
+    heap: List[Job]
+    _numbers: count
+    _changed: Optional[asyncio.Event]
+
+    def __init__(self, storage: Optional[BaseStorage] = None):
+        self.storage = storage
+        self.heap = []
+        self._numbers = count()
+        self._changed = None  # it is created inside the event loop
+
+    def add(self, name: str, action: ACTION_TYPE, timezone: dt.tzinfo = DEFAULT_TIMEZONE):
+        """
+        Adds the job, which runs the action every midnight in the
+        timezone. The name must be unique, it identifies the job between
+        the restarts.
+        """
+
+        job = Job(
+            when=get_day_end(get_day_epoch(timezone), timezone),
+            number=next(self._numbers),
+            name=name,
+            timezone=timezone,
+            action=action,
+        )
+        heapq.heappush(self.heap, job)
+        if self._changed is not None:
+            self._changed.set()
+
+    async def _execute(self, job: Job, moment: int):
+        """
+        Runs the action of the job and remembers the moment of the run.
+        """
+
+        try:
+            await job.action()
+        except Exception:
+            logger.exception("The job %s failed", job.name)
+
+        if self.storage is not None:
+            try:
+                await self.storage.set(job.last_run_key, moment)
+            except asyncio.TimeoutError:
+                logger.warning("Failed to save the last run of the job %s", job.name)
+
+    async def catch_up(self):
+        """
+        Runs the jobs, whose last run was missed.
+        The job that has never been run is only remembered as run.
+        """
+
+        if self.storage is None:
+            return
+
+        for job in sorted(self.heap):
+            last_midnight = job.get_last_midnight()
+            try:
+                last_run = await self.storage.get(job.last_run_key)
+                if last_run is None:
+                    await self.storage.set(job.last_run_key, last_midnight)
+            except asyncio.TimeoutError:
+                logger.warning("Failed to check the last run of the job %s", job.name)
+                continue
+            if last_run is not None and last_run < last_midnight:
+                logger.info("The job %s was missed, it is run now", job.name)
+                await self._execute(job, last_midnight)
+
+    async def _wait(self, delay: float):
+        """
+        Sleeps for the delay, but wakes up earlier if a new job is added.
+        """
+
+        try:
+            await asyncio.wait_for(self._changed.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
+
+    async def run(self):
+        """
+        Makes up the missed runs and then runs the jobs on time forever.
+        """
+
+        self._changed = asyncio.Event()
+        await self.catch_up()
+
+        while True:
+            if not self.heap:
+                await self._wait(SECOND_IN_DAYS)
+                continue
+
+            job = self.heap[0]
+            delay = job.when - time.time()
+            if delay > 0:
+                # the sleep may be a bit shorter, then it is just repeated
+                await self._wait(delay)
+                continue
+
+            moment = job.when
+            job.reschedule()
+            heapq.heapreplace(self.heap, job)
+            await self._execute(job, moment)
+
+
+def add_action(action: ACTION_TYPE, timezone: dt.tzinfo = DEFAULT_TIMEZONE, name: Optional[str] = None):
+    """
+    Appends the action to the list of others actions.
+    Actions are executed every day at midnight in the timezone.
+    The action must be an asynchronous function, the actions are
+    executed one after the other.
+    """
+    actions.append((name or action.__name__, timezone, action))
 
 
-async def everyday_cron():
+async def everyday_cron(storage: Optional[BaseStorage] = None):
     """
     Every day at midnight executes the set actions.
     This is designed to avoid using the system cron and adding
     unnecessary dependencies.
     """
 
-    while True:
-        await wait_for_next_day()
-        for action in actions:
-            await action()
+    scheduler = Scheduler(storage)
+    for (name, timezone, action) in actions:
+        scheduler.add(name, action, timezone)
+    await scheduler.run()
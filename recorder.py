@@ -0,0 +1,125 @@
+"""
+Recording of the incoming updates.
+If `Args.RECORD_PATH` is set, every update is appended to the file as a
+JSON line `{"time": <unix time>, "update": <raw update>}` as soon as it
+arrives, before any handler. The file can be replayed by
+`python -m benchmarks.replay`.
+
+With `Args.RECORD_ANONYMIZE` the ids of the users and chats are replaced
+by keyed hashes (the same id gets the same hash within one run), the
+names are dropped, and the texts are kept only if they are commands or
+possible letters of the tower, so the replay goes the same way.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, IO, Iterator, Tuple
+
+from telegram import Update
+from telegram.ext import CallbackContext
+
+from config import Args
+from observer import TOWER_TRIE
+
+
+__all__ = [
+    "UpdateRecorder",
+    "read_records",
+]
+
+
+RECORD_TYPE = Tuple[float, dict]
+
+# the fields with the names of the users and chats
+PERSONAL_FIELDS = frozenset((
+    "first_name",
+    "last_name",
+    "username",
+    "title",
+    "bio",
+    "description",
+    "invite_link",
+    "phone_number",
+))
+TEXT_FIELDS = frozenset(("text", "caption"))
+HIDDEN_TEXT = "<hidden>"
+
+
+class UpdateRecorder:
+    """
+    Appends the updates to the JSONL file (line by line, so the file is
+    consistent at any moment).
+    """
+
+    path: str
+    is_anonymize: bool
+    file: IO[str]
+    _salt: bytes
+
+    def __init__(self, path: str = Args.RECORD_PATH, is_anonymize: bool = Args.RECORD_ANONYMIZE):
+        self.path = path
+        self.is_anonymize = is_anonymize
+        self.file = open(path, "a", encoding="utf-8", buffering=1)
+        self._salt = os.urandom(16)
+
+    def _hide_id(self, value: int) -> int:
+        digest = hashlib.blake2b(str(value).encode(), key=self._salt, digest_size=6).digest()
+        hidden = int.from_bytes(digest, "little")
+        # the sign of the chat id tells the groups from the users
+        return -hidden if value < 0 else hidden
+
+    def anonymize(self, data: Any) -> Any:
+        """
+        Returns a copy of the raw update without the personal data.
+        """
+
+        if isinstance(data, list):
+            return [self.anonymize(item) for item in data]
+        if not isinstance(data, dict):
+            return data
+
+        # the users and chats are the objects with the name or the type
+        is_person = "first_name" in data or "type" in data
+        result = dict()
+        for (key, value) in data.items():
+            if key in PERSONAL_FIELDS:
+                continue
+            if key == "id" and is_person and isinstance(value, int):
+                value = self._hide_id(value)
+            elif key in TEXT_FIELDS and isinstance(value, str):
+                is_kept = value.startswith("/") or TOWER_TRIE.is_possible(value)
+                value = value if is_kept else HIDDEN_TEXT
+            else:
+                value = self.anonymize(value)
+            result[key] = value
+        if "first_name" in data:
+            result["first_name"] = "user"
+        return result
+
+    async def record(self, update: Update, context: CallbackContext):
+        """
+        The handler, which writes down the update.
+        """
+
+        data = update.to_dict()
+        if self.is_anonymize:
+            data = self.anonymize(data)
+        line = json.dumps({"time": round(time.time(), 3), "update": data}, ensure_ascii=False)
+        self.file.write(line + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+def read_records(path: str) -> Iterator[RECORD_TYPE]:
+    """
+    Reads the recorded updates one by one.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                yield record["time"], record["update"]
@@ -0,0 +1,103 @@
+"""
+The registry of observed chats stored in the storage.
+Instead of one list of all chat ids, that must be rewritten on every
+`/enable`, the ids are spread over several shard keys, and each shard is
+an append-only string of `,<chat_id>` records.
+The chats are registered for one day only: the shard keys contain the
+day number and expire a bit later than the day ends (the chats live by
+their timezones, and the ended day is still needed on a restart to
+notify its chats).
+"""
+
+from typing import Dict, Final, Iterable, List
+
+from config import Args
+from periodic import get_day_end
+from storage import BaseStorage
+
+
+__all__ = [
+    "ChatRegistry",
+]
+
+
+SHARD_KEY_TEMPLATE: Final[str] = "chat_ids_{}_{}"
+# how long the shard of the day is kept after its end in UTC
+EXPIRY_MARGIN: Final[int] = 2 * 24 * 60 * 60
+RECORD_SEPARATOR: Final[bytes] = b","
+
+
+def parse_shard(value: bytes) -> List[int]:
+    """
+    Returns the unique chat ids of the shard in the order of adding.
+    """
+
+    records = value.split(RECORD_SEPARATOR)
+    return list(dict.fromkeys(int(record) for record in records if record))
+
+
+def dump_shard(chat_ids: Iterable[int]) -> bytes:
+    return b"".join(RECORD_SEPARATOR + str(chat_id).encode() for chat_id in chat_ids)
+
+
+class ChatRegistry:
+    """
+    Registry of the observed chats.
+    Adding a chat is an atomic memcached `append` to the shard of the
+    chat, so it costs the same for any number of chats and does not lose
+    the records of other processes. Enumeration is one multi-get of all
+    shards; the shards with duplicate records are compacted back under
+    CAS protection.
+    """
+
+    storage: BaseStorage
+    shards: int
+
+    def __init__(self, storage: BaseStorage, shards: int = Args.REGISTRY_SHARDS):
+        self.storage = storage
+        self.shards = shards
+
+    def _shard_keys(self, day: int) -> List[str]:
+        return [SHARD_KEY_TEMPLATE.format(day, number) for number in range(self.shards)]
+
+    def _shard_key(self, chat_id: int, day: int) -> str:
+        return SHARD_KEY_TEMPLATE.format(day, chat_id % self.shards)
+
+    async def add(self, chat_id: int, day: int):
+        """
+        Registers the chat for the day.
+        """
+
+        key = self._shard_key(chat_id, day)
+        record = dump_shard([chat_id])
+        if await self.storage.append(key, record):
+            return
+        # there is no shard yet; if someone else created it at the same
+        # moment, `add` will fail, and the record can be appended again
+        if not await self.storage.add(key, record, get_day_end(day) + EXPIRY_MARGIN):
+            await self.storage.append(key, record)
+
+    async def all(self, day: int) -> List[int]:
+        """
+        Returns the ids of all chats registered for the day.
+        """
+
+        values: Dict[str, bytes] = await self.storage.get_multi(self._shard_keys(day))
+        all_chats = []
+        for (key, value) in values.items():
+            chat_ids = parse_shard(value)
+            if len(chat_ids) < value.count(RECORD_SEPARATOR):
+                await self._compact(key, day)
+            all_chats.extend(chat_ids)
+        return all_chats
+
+    async def _compact(self, key: str, day: int):
+        """
+        Removes the duplicate records of the shard.
+        If the shard was changed in the meantime, it is left as it is.
+        """
+
+        value, cas_token = await self.storage.gets(key)
+        if value is None:
+            return
+        await self.storage.cas(key, dump_shard(parse_shard(value)), cas_token, get_day_end(day) + EXPIRY_MARGIN)
@@ -0,0 +1,260 @@
+"""
+All outgoing messages of the bot go through one queue.
+The queue keeps the telegram limits on sending (global and per chat),
+waits out the flood control and isolates the errors of each message, so
+a broadcast to thousands of chats is sent as fast as it is allowed.
+"""
+
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from telegram import Bot, Message
+from telegram.error import RetryAfter
+
+from config import Args
+from metrics import TELEGRAM_SECONDS, TELEGRAM_ERRORS
+
+
+__all__ = [
+    "TokenBucket",
+    "Sender",
+]
+
+
+logger = logging.getLogger(__name__)
+
+SEND_TASK_TYPE = Tuple[int, str, Dict[str, Any], asyncio.Future]
+
+
+class TokenBucket:
+    """
+    Token bucket, which gives `rate` tokens per second and stores at most
+    `capacity` of them.
+    The tokens are reserved in advance: the bucket may go into debt, and
+    the reserver just waits until its token is refilled.
+    """
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated: float
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns how many seconds to wait for it.
+        """
+
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / self.rate
+
+    def is_full(self, now: float) -> bool:
+        """
+        Whether the bucket has been refilled up to its capacity by `now`.
+        """
+        return self.tokens + (now - self.updated) * self.rate >= self.capacity
+
+
+class Sender:
+    """
+    The queue of outgoing messages, which is processed by `workers`
+    workers.
+    Each message waits for a token of its chat before it gets into the
+    queue (so the busy chat does not hold the workers), the workers wait
+    only for the global tokens. The private chats have their own limit.
+    On `RetryAfter` the message is resent after the required pause (at
+    most `Args.FLOOD_RETRIES` times). The error of a message is raised
+    only to the one who sent it.
+    The buckets of the chats are dropped as soon as they are full again,
+    they are checked every `prune_interval` seconds.
+    The messages can be only posted (see `post_message`), then nobody
+    waits for them, but they are still sent before the sender is closed.
+    If several processes send the messages, each of them gets its part of
+    the `global_rate`.
+    """
+
+    workers: int
+    global_bucket: TokenBucket
+    chat_buckets: Dict[int, TokenBucket]
+    prune_interval: float
+    pruned: float
+    bot: Optional[Bot]
+    queue: Optional[asyncio.Queue]
+    pending: Set[asyncio.Future]
+    _tasks: List[asyncio.Task]
+
+    def __init__(
+            self,
+            workers: int = Args.SEND_WORKERS,
+            global_rate: float = Args.SEND_GLOBAL_RATE,
+            prune_interval: float = Args.SEND_PRUNE_INTERVAL,
+    ):
+        self.workers = workers
+        self.global_bucket = TokenBucket(global_rate, global_rate)
+        self.chat_buckets = dict()
+        self.prune_interval = prune_interval
+        self.pruned = time.monotonic()
+        self.bot = None
+        self.queue = None
+        self.pending = set()
+        self._tasks = []
+
+    def start(self, bot: Bot):
+        """
+        Starts the workers (must be called inside the event loop).
+        """
+
+        self.bot = bot
+        self.queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def close(self, timeout: float = Args.SEND_CLOSE_TIMEOUT):
+        """
+        Waits (at most `timeout` seconds) until the queued messages are
+        sent and stops the workers.
+        """
+
+        if self.pending:
+            await asyncio.wait(self.pending, timeout=timeout)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            # the ids of the private chats are the ids of the users
+            if chat_id > 0:
+                bucket = TokenBucket(Args.SEND_PRIVATE_RATE, Args.SEND_PRIVATE_BURST)
+            else:
+                bucket = TokenBucket(Args.SEND_CHAT_RATE, Args.SEND_CHAT_BURST)
+            self.chat_buckets[chat_id] = bucket
+        return bucket
+
+    def _prune(self):
+        """
+        Drops the buckets of the chats that have not sent anything for a
+        while.
+        """
+
+        now = time.monotonic()
+        if now - self.pruned < self.prune_interval:
+            return
+        self.pruned = now
+        self.chat_buckets = {
+            chat_id: bucket
+            for (chat_id, bucket) in self.chat_buckets.items()
+            if not bucket.is_full(now)
+        }
+
+    def _put(self, chat_id: int, text: str, kwargs: Dict[str, Any]) -> asyncio.Future:
+        """
+        Puts the message in the queue as soon as its chat is allowed to
+        send it.
+        The messages of one chat get into the queue in their order: each
+        next one reserves a later token.
+        """
+
+        self._prune()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.add(future)
+        future.add_done_callback(self.pending.discard)
+        task: SEND_TASK_TYPE = (chat_id, text, kwargs, future)
+        delay = self._chat_bucket(chat_id).reserve()
+        if delay:
+            loop.call_later(delay, self.queue.put_nowait, task)
+        else:
+            self.queue.put_nowait(task)
+        return future
+
+    async def send_message(self, chat_id: int, text: str, **kwargs) -> Message:
+        """
+        Puts the message in the queue and waits until it is sent.
+        """
+        return await self._put(chat_id, text, kwargs)
+
+    def post_message(self, chat_id: int, text: str, **kwargs) -> asyncio.Future:
+        """
+        Puts the message in the queue and returns at once, so the caller
+        is not held by the limits of the chat. The returned future gets
+        the sent message, if it is needed; the error is logged.
+        """
+
+        future = self._put(chat_id, text, kwargs)
+        future.add_done_callback(partial(self._log_error, chat_id))
+        return future
+
+    @staticmethod
+    def _log_error(chat_id: int, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning("Failed to send a message to %s: %s", chat_id, future.exception())
+
+    async def broadcast(self, chat_ids: Iterable[int], text: str, **kwargs) -> int:
+        """
+        Sends the message to all the chats and returns the number of the
+        chats where it failed (the errors are logged).
+        """
+
+        chat_ids = list(chat_ids)
+        results = await asyncio.gather(
+            *(self.send_message(chat_id, text, **kwargs) for chat_id in chat_ids),
+            return_exceptions=True,
+        )
+        failed = 0
+        for (chat_id, result) in zip(chat_ids, results):
+            if isinstance(result, Exception):
+                failed += 1
+                logger.warning("Failed to send a message to %s: %s", chat_id, result)
+        return failed
+
+    async def _work(self):
+        while True:
+            task: SEND_TASK_TYPE = await self.queue.get()
+            await self._deliver(*task)
+
+    async def _deliver(self, chat_id: int, text: str, kwargs: Dict[str, Any], future: asyncio.Future):
+        """
+        Sends one message within the global limit.
+        """
+
+        if future.cancelled():
+            return
+
+        for attempt in range(Args.FLOOD_RETRIES + 1):
+            await asyncio.sleep(self.global_bucket.reserve())
+            try:
+                with TELEGRAM_SECONDS.time("send_message"):
+                    message = await self.bot.send_message(chat_id, text, **kwargs)
+            except RetryAfter as exc:
+                TELEGRAM_ERRORS.inc("send_message", type(exc).__name__)
+                if attempt < Args.FLOOD_RETRIES:
+                    await asyncio.sleep(exc.retry_after)
+                    continue
+                error = exc
+            except Exception as exc:
+                TELEGRAM_ERRORS.inc("send_message", type(exc).__name__)
+                error = exc
+            else:
+                if not future.cancelled():
+                    future.set_result(message)
+                return
+
+            if not future.cancelled():
+                future.set_exception(error)
+            return
@@ -0,0 +1,243 @@
+"""
+Running the bot in several processes (`Args.WORKERS > 1`).
+
+The front process receives the updates (by polling or webhook) and
+routes each of them by the hash of its chat id to one of the worker
+processes, so all updates of a chat always go to the same worker. Each
+worker is a whole bot with its own observer, which owns only the chats
+of its shard: it loads only them, checks their towers and sends the
+messages to them.
+The midnight cron works only in the front process, its actions are
+fanned out to all workers by their names.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import signal
+from typing import List, Optional, Set, Tuple
+
+from telegram import Update
+from telegram.ext import Application
+
+import bot
+from config import Args
+from funcs import get_shard
+from history import EventLog
+from metrics import MetricsServer
+from observer import Observer
+from stats import Stats
+from storage import get_storage
+from periodic import ACTION_TYPE, add_action, everyday_cron
+from recorder import UpdateRecorder
+from sender import Sender
+
+
+__all__ = [
+    "run_front",
+    "run_worker",
+]
+
+
+logger = logging.getLogger(__name__)
+
+# the messages from the front to the workers
+MESSAGE_UPDATE = "update"  # the raw update
+MESSAGE_CRON = "cron"  # the name of the cron action
+MESSAGE_STOP = "stop"
+MESSAGE_TYPE = Tuple[str, Optional[object]]
+
+# how long the worker waits for the messages at once (in seconds) and how
+# many of them it takes at once
+RECEIVE_TIMEOUT = 0.5
+RECEIVE_BATCH_SIZE = 100
+# how long the front waits for the workers to save their towers
+STOP_TIMEOUT = 30
+
+
+# === front ============================================================
+
+
+def fan_out(name: str, queues: List[multiprocessing.Queue]) -> ACTION_TYPE:
+    """
+    Returns the cron action, which makes all workers run their action with
+    the same name.
+    """
+
+    async def action():
+        for worker_queue in queues:
+            worker_queue.put((MESSAGE_CRON, name))
+
+    action.__name__ = name
+    return action
+
+
+async def serve_front(queues: List[multiprocessing.Queue]):
+    """
+    Receives the updates and routes them to the workers.
+    """
+
+    app = Application.builder().token(Args.TOKEN).build()
+    recorder = UpdateRecorder() if Args.RECORD_PATH else None
+
+    for (name, timezone, _) in bot.get_cron_actions():
+        add_action(fan_out(name, queues), timezone, name)
+    cron_task = asyncio.create_task(everyday_cron(get_storage()))
+
+    await app.initialize()
+    await bot.start_receiving(app)
+    print(f"Bot is running with {len(queues)} workers!")
+
+    while True:
+        update: Update = await app.update_queue.get()
+        if recorder is not None:
+            await recorder.record(update, None)
+        chat = update.effective_chat
+        # the updates without a chat do not matter for the towers
+        shard = get_shard(chat.id, len(queues)) if chat is not None else 0
+        queues[shard].put((MESSAGE_UPDATE, update.to_dict()))
+
+
+def run_front(workers: int):
+    """
+    Starts the workers and receives the updates for them until it is
+    interrupted.
+    """
+
+    # the workers are spawned, so they do not share anything with the front
+    context = multiprocessing.get_context("spawn")
+    queues = [context.Queue() for _ in range(workers)]
+    processes = [
+        context.Process(
+            target=run_worker,
+            args=(shard, workers, queues[shard]),
+            name=f"worker-{shard}",
+        )
+        for shard in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        asyncio.run(serve_front(queues))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker_queue in queues:
+            worker_queue.put((MESSAGE_STOP, None))
+        for process in processes:
+            process.join(STOP_TIMEOUT)
+            if process.is_alive():
+                logger.warning("The worker %s did not stop in time", process.name)
+                process.terminate()
+        for worker_queue in queues:
+            # nobody reads the queues anymore, the exit must not wait for them
+            worker_queue.cancel_join_thread()
+
+
+# === worker ===========================================================
+
+
+def receive(worker_queue: multiprocessing.Queue) -> List[MESSAGE_TYPE]:
+    """
+    Waits for the messages from the front (in the thread), returns
+    several of them at once, or nothing after the timeout.
+    """
+
+    try:
+        messages = [worker_queue.get(timeout=RECEIVE_TIMEOUT)]
+    except queue.Empty:
+        return []
+    while len(messages) < RECEIVE_BATCH_SIZE:
+        try:
+            messages.append(worker_queue.get_nowait())
+        except queue.Empty:
+            break
+    return messages
+
+
+async def run_cron_actions(cron_queue: asyncio.Queue):
+    """
+    Runs the cron actions one after the other, as the cron does.
+    """
+
+    actions = {name: action for (name, _, action) in bot.get_cron_actions()}
+    while True:
+        name = await cron_queue.get()
+        try:
+            await actions[name]()
+        except Exception:
+            logger.exception("The cron action %s failed", name)
+
+
+async def serve_worker(shard: int, worker_queue: multiprocessing.Queue):
+    """
+    Processes the updates of the shard until the front stops it.
+    """
+
+    await bot.observer.load()
+    await bot.stats.load()
+
+    app = bot.create_app(Args.TOKEN)
+    bot.bot = app.bot
+    bot.sender.start(app.bot)
+    await app.initialize()
+    await app.start()
+    if Args.METRICS_PORT:
+        await MetricsServer(port=Args.METRICS_PORT + shard).start()
+
+    cron_queue = asyncio.Queue()
+    background: Set[asyncio.Task] = {
+        asyncio.create_task(bot.observer.run()),
+        asyncio.create_task(bot.history.run()),
+        asyncio.create_task(bot.stats.run()),
+        asyncio.create_task(run_cron_actions(cron_queue)),
+    }
+
+    loop = asyncio.get_running_loop()
+    is_stopped = False
+    while not is_stopped:
+        for (kind, payload) in await loop.run_in_executor(None, receive, worker_queue):
+            if kind == MESSAGE_UPDATE:
+                await app.update_queue.put(Update.de_json(payload, app.bot))
+            elif kind == MESSAGE_CRON:
+                cron_queue.put_nowait(payload)
+            elif kind == MESSAGE_STOP:
+                is_stopped = True
+
+    await app.update_queue.join()
+    await app.stop()
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await bot.chat_dispatcher.close()
+    await bot.sender.close()
+    await app.shutdown()
+
+
+def run_worker(shard: int, shards: int, worker_queue: multiprocessing.Queue):
+    """
+    The entry point of the worker process.
+    """
+
+    logging.basicConfig(format=bot.LOG_FORMAT, level=logging.INFO)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    bot.observer = Observer(shard=shard, shards=shards)
+    # the telegram limit is common for the whole bot
+    bot.sender = Sender(global_rate=Args.SEND_GLOBAL_RATE / shards)
+    # the workers write their own segments of the history
+    bot.history = EventLog(stream=str(shard))
+    # and count the stats of their own chats
+    bot.stats = Stats(bot.observer.storage, shard=shard, shards=shards, is_kept=bot.observer.is_cached)
+    try:
+        asyncio.run(serve_worker(shard, worker_queue))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # the last changes of the towers must not be lost, the observer
+        # closes the shared storage, so it goes last
+        asyncio.run(bot.history.close())
+        asyncio.run(bot.stats.close())
+        asyncio.run(bot.observer.close())
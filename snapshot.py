@@ -0,0 +1,159 @@
+"""
+Local snapshot of the tower states for a fast warm restart.
+The states written to the storage are also remembered here and are
+periodically saved to a local file, so after a restart (or if the
+memcached lost its data) the towers of the day are restored from it.
+The chats live by their own timezones, so each state keeps its day.
+
+Format (little-endian):
+- header: magic (4s), version (B), number of chats (I), crc32 of the
+  records (I)
+- records: chat id (q), day (I), length of the state (H), the state (in
+  the format of `codec.py`)
+
+The file is replaced atomically (it is written to a temporary file,
+which is then renamed), so it is either old or new, never broken; the
+checksum protects from everything else.
+"""
+
+import asyncio
+import logging
+import os
+import struct
+import zlib
+from typing import Dict, Optional, Tuple
+
+from config import Args
+
+
+__all__ = [
+    "Snapshot",
+]
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TWSN"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sBII")
+RECORD = struct.Struct("<qIH")
+
+STATE_TYPE = Tuple[int, bytes]  # the day and the state
+
+
+class Snapshot:
+    """
+    The last known states of the chats and their file.
+    """
+
+    path: str
+    interval: float
+    states: Dict[int, STATE_TYPE]
+    is_changed: bool
+
+    def __init__(self, path: str, interval: float = Args.SNAPSHOT_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.states = dict()
+        self.is_changed = False
+
+    def remember(self, day: int, chat_id: int, state: bytes):
+        """
+        Remembers the state of the chat, the state of its past day is
+        forgotten.
+        """
+
+        known = self.states.get(chat_id)
+        if known is None or day >= known[0]:
+            self.states[chat_id] = (day, state)
+            self.is_changed = True
+
+    def forget(self, chat_id: int):
+        """
+        Forgets the chat, whose day is over.
+        """
+
+        if self.states.pop(chat_id, None) is not None:
+            self.is_changed = True
+
+    def _dump(self) -> bytes:
+        records = b"".join(
+            RECORD.pack(chat_id, day, len(state)) + state
+            for (chat_id, (day, state)) in self.states.items()
+        )
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, len(self.states), zlib.crc32(records))
+        return header + records
+
+    def _write(self, data: bytes):
+        """
+        Replaces the file atomically.
+        """
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+    async def save(self):
+        """
+        Writes the file if something has changed since the last time.
+        """
+
+        if not self.is_changed:
+            return
+        data = self._dump()
+        self.is_changed = False
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, data)
+        except OSError:
+            self.is_changed = True
+            logger.exception("Failed to save the snapshot")
+
+    def load(self) -> Dict[int, STATE_TYPE]:
+        """
+        Reads the states of the chats from the file.
+        Returns nothing if there is no file or it is broken.
+        """
+
+        try:
+            with open(self.path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return dict()
+
+        states = self._parse(data)
+        if states is None:
+            logger.warning("The snapshot %s is broken and is ignored", self.path)
+            return dict()
+        self.states = dict(states)
+        return states
+
+    @staticmethod
+    def _parse(data: bytes) -> Optional[Dict[int, STATE_TYPE]]:
+        if len(data) < HEADER.size:
+            return None
+        magic, version, count, checksum = HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            return None
+        if zlib.crc32(data[HEADER.size:]) != checksum:
+            return None
+
+        states = dict()
+        offset = HEADER.size
+        for _ in range(count):
+            chat_id, day, length = RECORD.unpack_from(data, offset)
+            offset += RECORD.size
+            states[chat_id] = (day, data[offset:offset + length])
+            offset += length
+        return states
+
+    async def run(self):
+        """
+        Saves the file every `interval` seconds.
+        """
+
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.save()
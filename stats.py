@@ -0,0 +1,424 @@
+"""
+Statistics of the towers: built towers, falls by their reasons, crashes
+by the bot, the fastest tower and the best builders, for every chat and
+for all chats together.
+The counters are updated by `standard_message` as the events happen and
+are kept in memory, the changed ones are written to the storage every
+`flush_interval` seconds (without expiry), so answering a query never
+depends on how long the bot has been working: it is a few counters and
+the top of the builders, which is always ready.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from config import Args
+from storage import BaseStorage
+
+
+__all__ = [
+    "Leaderboard",
+    "TowerStats",
+    "Stats",
+]
+
+
+logger = logging.getLogger(__name__)
+
+LEADER_TYPE = Tuple[str, int]  # the name and the number of letters
+
+
+class Leaderboard:
+    """
+    The numbers of letters of the participants with the top of them kept
+    up to date. The numbers only grow, so a participant gets into the top
+    only by passing its last place, and the top is always exact. Only
+    the names of the leaders are kept.
+    The numbers are split into `parts` by the user ids, so that a lot of
+    participants can be written by the changed parts (see `changed`).
+    """
+
+    size: int
+    parts: List[Dict[int, int]]
+    changed: Set[int]  # the numbers of the changed parts
+    names: Dict[int, str]  # the leaders and their names
+    floor: int  # the number of letters of the last place
+
+    def __init__(self, size: int = Args.STATS_TOP_SIZE, parts: int = 1):
+        self.size = size
+        self.parts = [dict() for _ in range(parts)]
+        self.changed = set()
+        self.names = dict()
+        self.floor = 0
+
+    def count(self, user_id: int) -> int:
+        return self.parts[user_id % len(self.parts)].get(user_id, 0)
+
+    def _update_floor(self):
+        self.floor = min(map(self.count, self.names), default=0)
+
+    def add(self, user_id: int, name: str, amount: int = 1):
+        """
+        Adds the letters to the participant, usually without looking
+        through the top at all.
+        """
+
+        number = user_id % len(self.parts)
+        count = self.parts[number].get(user_id, 0) + amount
+        self.parts[number][user_id] = count
+        self.changed.add(number)
+        if user_id in self.names or len(self.names) < self.size:
+            self.names[user_id] = name
+            if count - amount <= self.floor:
+                self._update_floor()
+            return
+
+        if count > self.floor:
+            last = min(self.names, key=self.count)
+            del self.names[last]
+            self.names[user_id] = name
+            self._update_floor()
+
+    def best(self) -> List[LEADER_TYPE]:
+        """
+        Returns the leaders from the first place.
+        """
+
+        leaders = sorted(self.names, key=self.count, reverse=True)
+        return [(self.names[user_id], self.count(user_id)) for user_id in leaders]
+
+    def _dump(self, is_full: bool = True) -> Dict[str, Any]:
+        """
+        Returns the numbers of all participants or only of the leaders.
+        """
+
+        if is_full:
+            counts = {user_id: count for part in self.parts for (user_id, count) in part.items()}
+        else:
+            counts = {user_id: self.count(user_id) for user_id in self.names}
+        return {"counts": counts, "names": dict(self.names)}
+
+    def _load(self, names: Dict[int, str]):
+        """
+        Chooses the top again from the loaded numbers (the size may have
+        changed).
+        """
+
+        counts = dict()
+        for part in self.parts:
+            counts.update(part)
+        leaders = heapq.nlargest(self.size, counts, key=counts.__getitem__)
+        self.names = {user_id: names.get(user_id, str(user_id)) for user_id in leaders}
+        self._update_floor()
+
+    @classmethod
+    def _from_value(cls, value: Dict[str, Any], size: int = Args.STATS_TOP_SIZE) -> "Leaderboard":
+        board = cls(size)
+        board.parts = [dict(value["counts"])]
+        board._load(value["names"])
+        return board
+
+
+@dataclass
+class TowerStats:
+    """
+    The counters of one chat or of all chats.
+    """
+
+    built: int = 0
+    crashes: int = 0
+    falls: Dict[str, int] = field(default_factory=dict)
+    fastest: Optional[float] = None  # in seconds
+    builders: Leaderboard = field(default_factory=Leaderboard)
+
+    @property
+    def falls_count(self) -> int:
+        return sum(self.falls.values())
+
+    def _dump(self, is_full: bool = True) -> Dict[str, Any]:
+        """
+        Returns the counters with all participants of the builders or
+        only with the leaders.
+        """
+
+        return {
+            "built": self.built,
+            "crashes": self.crashes,
+            "falls": dict(self.falls),
+            "fastest": self.fastest,
+            "builders": self.builders._dump(is_full),
+        }
+
+    @classmethod
+    def _from_value(cls, value: Dict[str, Any], builders: Optional[Leaderboard] = None) -> "TowerStats":
+        return cls(
+            built=value["built"],
+            crashes=value["crashes"],
+            falls=dict(value["falls"]),
+            fastest=value["fastest"],
+            builders=builders or Leaderboard._from_value(value["builders"]),
+        )
+
+    def merge(self, other: "TowerStats"):
+        """
+        Adds the counters of the other stats to these.
+        """
+
+        self.built += other.built
+        self.crashes += other.crashes
+        for (reason, count) in other.falls.items():
+            self.falls[reason] = self.falls.get(reason, 0) + count
+        if other.fastest is not None and (self.fastest is None or other.fastest < self.fastest):
+            self.fastest = other.fastest
+        for (user_id, name) in other.builders.names.items():
+            self.builders.add(user_id, name, other.builders.count(user_id))
+
+
+class Stats:
+    """
+    The statistics of all chats of the process.
+    The stats of a chat are loaded from the storage on the first access
+    and are kept in memory while `is_kept` of the chat is true (the chat
+    is in the cache of the observers) or it has unsaved changes. The
+    stats of all chats are loaded by `load()`, their participants are
+    written in `Args.STATS_BUILDERS_PARTS` parts, only the changed ones.
+    If the chats are split between the processes, every process counts
+    its own chats, and the stats of all chats are merged from the
+    summaries of the processes (with only their leaders, so a participant
+    who builds in the chats of different processes may be missed in the
+    top).
+    The duration of a tower is measured from its first letter, the towers
+    started before a restart are not measured.
+    """
+
+    storage: BaseStorage
+    shard: int
+    shards: int
+    flush_interval: float
+    is_kept: Optional[Callable[[int], bool]]
+    chats: Dict[int, TowerStats]
+    total: TowerStats
+    dirty: Set[int]
+    is_total_dirty: bool
+    starts: Dict[int, float]  # the moments of the first letters of the towers
+
+    def __init__(
+            self,
+            storage: BaseStorage,
+            shard: int = 0,
+            shards: int = 1,
+            is_kept: Optional[Callable[[int], bool]] = None,
+            flush_interval: float = Args.STATS_FLUSH_INTERVAL,
+    ):
+        self.storage = storage
+        self.shard = shard
+        self.shards = shards
+        self.is_kept = is_kept
+        self.flush_interval = flush_interval
+        self.chats = dict()
+        self.total = self._new_total()
+        self.dirty = set()
+        self.is_total_dirty = False
+        self.starts = dict()
+
+    @staticmethod
+    def _chat_key(chat_id: int) -> str:
+        return f"stats_chat_{chat_id}"
+
+    @staticmethod
+    def _total_key(shard: int) -> str:
+        return f"stats_total_{shard}"
+
+    @staticmethod
+    def _builders_key(shard: int, number: int) -> str:
+        return f"stats_builders_{shard}_{number}"
+
+    @staticmethod
+    def _new_total() -> TowerStats:
+        return TowerStats(builders=Leaderboard(parts=Args.STATS_BUILDERS_PARTS))
+
+    async def load(self):
+        """
+        Loads the stats of all chats of the process.
+        """
+
+        value = await self.storage.get(self._total_key(self.shard))
+        if value is None:
+            self.total = self._new_total()
+            return
+
+        builders = Leaderboard(parts=Args.STATS_BUILDERS_PARTS)
+        keys = [self._builders_key(self.shard, number) for number in range(len(builders.parts))]
+        parts = await self.storage.get_multi(keys)
+        for key in keys:
+            for (user_id, count) in parts.get(key, dict()).items():
+                # the parts are split again, their number may have changed
+                builders.parts[user_id % len(builders.parts)][user_id] = count
+        builders._load(value["builders"]["names"])
+        self.total = TowerStats._from_value(value, builders)
+
+    async def get(self, chat_id: int) -> Optional[TowerStats]:
+        """
+        Returns the stats of the chat, or `None` if they could not be
+        loaded (the event is then not counted, but the stored counters
+        are not lost).
+        """
+
+        if chat_id in self.chats:
+            return self.chats[chat_id]
+        try:
+            value = await self.storage.get(self._chat_key(chat_id))
+        except Exception:
+            logger.exception("Failed to load the stats of the chat %d", chat_id)
+            return None
+        chat = TowerStats._from_value(value) if value is not None else TowerStats()
+        return self.chats.setdefault(chat_id, chat)
+
+    async def get_total(self) -> TowerStats:
+        """
+        Returns the stats of all chats.
+        """
+
+        if self.shards == 1:
+            return self.total
+
+        keys = [self._total_key(shard) for shard in range(self.shards) if shard != self.shard]
+        values = await self.storage.get_multi(keys)
+        total = TowerStats()
+        total.merge(self.total)
+        for value in values.values():
+            total.merge(TowerStats._from_value(value))
+        return total
+
+    def _mark(self, chat_id: int):
+        self.dirty.add(chat_id)
+        self.is_total_dirty = True
+
+    async def letter(self, chat_id: int, height: int, user_id: int, name: str):
+        """
+        Counts the letter added to the tower.
+        """
+
+        chat = await self.get(chat_id)
+        if chat is None:
+            return
+        if height == 1:
+            self.starts[chat_id] = time.time()
+        chat.builders.add(user_id, name)
+        self.total.builders.add(user_id, name)
+        self._mark(chat_id)
+
+    async def fall(self, chat_id: int, reason: str):
+        """
+        Counts the fallen tower.
+        """
+
+        self.starts.pop(chat_id, None)
+        chat = await self.get(chat_id)
+        if chat is None:
+            return
+        for stats in (chat, self.total):
+            stats.falls[reason] = stats.falls.get(reason, 0) + 1
+        self._mark(chat_id)
+
+    async def built(self, chat_id: int):
+        """
+        Counts the built tower and its duration.
+        """
+
+        start = self.starts.pop(chat_id, None)
+        chat = await self.get(chat_id)
+        if chat is None:
+            return
+        duration = time.time() - start if start is not None else None
+        for stats in (chat, self.total):
+            stats.built += 1
+            if duration is not None and (stats.fastest is None or duration < stats.fastest):
+                stats.fastest = duration
+        self._mark(chat_id)
+
+    async def crash(self, chat_id: int):
+        """
+        Counts the tower crashed by the bot.
+        """
+
+        self.starts.pop(chat_id, None)
+        chat = await self.get(chat_id)
+        if chat is None:
+            return
+        chat.crashes += 1
+        self.total.crashes += 1
+        self._mark(chat_id)
+
+    async def flush(self):
+        """
+        Writes the changed stats to the storage with one multi-set.
+        The stats that could not be written (for any error of the
+        storage) remain changed, they are never rebuilt.
+        """
+
+        if not self.dirty and not self.is_total_dirty:
+            return
+
+        dirty, self.dirty = self.dirty, set()
+        keys = {self._chat_key(chat_id): chat_id for chat_id in dirty}
+        data = {key: self.chats[chat_id]._dump() for (key, chat_id) in keys.items()}
+        builders = self.total.builders
+        changed, builders.changed = builders.changed, set()
+        parts = {self._builders_key(self.shard, number): number for number in changed}
+        data.update({key: dict(builders.parts[number]) for (key, number) in parts.items()})
+        if self.is_total_dirty:
+            self.is_total_dirty = False
+            data[self._total_key(self.shard)] = self.total._dump(is_full=False)
+
+        try:
+            is_success, failed_keys = await self.storage.set_multi(data)
+        except Exception:
+            logger.exception("Failed to write the stats")
+            is_success, failed_keys = False, list(data.keys())
+        if not is_success:
+            for key in failed_keys:
+                if key in keys:
+                    self.dirty.add(keys[key])
+                elif key in parts:
+                    builders.changed.add(parts[key])
+                else:
+                    self.is_total_dirty = True
+            logger.warning("Failed to write the stats of %d keys", len(failed_keys))
+
+    def evict(self):
+        """
+        Forgets the saved stats of the chats that are not kept.
+        """
+
+        if self.is_kept is None:
+            return
+        for chat_id in list(self.chats):
+            if not self.is_kept(chat_id) and chat_id not in self.dirty:
+                del self.chats[chat_id]
+                self.starts.pop(chat_id, None)
+
+    async def run(self):
+        """
+        Writes the changed stats every `flush_interval` seconds and
+        forgets the stats of the chats that are not kept. A failed flush
+        does not stop the writing.
+        """
+
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush the stats")
+            self.evict()
+
+    async def close(self):
+        """
+        Writes the last changes.
+        """
+        await self.flush()
@@ -0,0 +1,467 @@
+"""
+Storages of the bot data.
+The observers depend only on the `BaseStorage` interface (it is modeled
+on the memcached commands), and the storage itself is chosen by
+`Args.STORAGE`:
+- "memcached" - the memcached, the default one
+- "memory" - a dict in the memory of the process, it is lost on restart
+- "sqlite" - a local SQLite database in WAL mode
+
+All storages are asynchronous: the blocking calls run in threads, so a
+slow storage stalls only the coroutines waiting for it.
+The `expire` arguments are the unix timestamps when the values expire
+(`0` - never).
+"""
+
+import asyncio
+import pickle
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from libmc import (
+    ClientPool as McClientPool,
+    MC_MAX_CLIENTS,
+    MC_CONNECT_TIMEOUT,
+    MC_POLL_TIMEOUT,
+)
+
+from config import Args
+from metrics import STORAGE_SECONDS
+
+
+__all__ = [
+    "BaseStorage",
+    "McStorage",
+    "MemoryStorage",
+    "SqliteStorage",
+    "get_storage",
+]
+
+
+class BaseStorage(ABC):
+    """
+    The interface of a key-value storage.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """
+        Returns the value or `None` if there is no key.
+        """
+
+    @abstractmethod
+    async def get_multi(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Returns the values of the found keys.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, expire: int = 0) -> bool:
+        pass
+
+    @abstractmethod
+    async def set_multi(self, data: Dict[str, Any], expire: int = 0) -> Tuple[bool, List[str]]:
+        """
+        Sets all values at once.
+        Returns the success flag and the keys that could not be set.
+        """
+
+    @abstractmethod
+    async def add(self, key: str, value: Any, expire: int = 0) -> bool:
+        """
+        Sets the value only if there is no such key yet.
+        """
+
+    @abstractmethod
+    async def append(self, key: str, value: bytes) -> bool:
+        """
+        Appends bytes to the existing value (fails if there is no key).
+        """
+
+    @abstractmethod
+    async def gets(self, key: str) -> Tuple[Any, int]:
+        """
+        Returns the value with its CAS token.
+        """
+
+    @abstractmethod
+    async def cas(self, key: str, value: Any, cas_token: int, expire: int = 0) -> bool:
+        """
+        Sets the value only if it was not changed since `gets`.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def delete_multi(self, keys: Iterable[str]) -> bool:
+        pass
+
+    def close(self):
+        """
+        Releases the resources of the storage.
+        """
+
+
+class McStorage(BaseStorage):
+    """
+    An asynchronous facade over the `libmc.ClientPool`.
+    Each call takes a client from the pool and runs in one of
+    `pool_size` threads; `timeout` (in seconds) limits the whole call,
+    the socket timeouts of the clients are set from the config.
+    """
+
+    prefix: str
+    timeout: float
+    pool: McClientPool
+    executor: ThreadPoolExecutor
+
+    def __init__(
+            self,
+            host: str = Args.MEMCACHED_HOST,
+            prefix: str = "tower_",
+            pool_size: int = Args.MC_POOL_SIZE,
+            timeout: float = Args.MC_TIMEOUT,
+    ):
+        # `ClientPool` breaks on the `prefix` argument, so the keys are
+        # prefixed by hand
+        self.prefix = prefix
+        self.timeout = timeout
+
+        self.pool = McClientPool([host])
+        self.pool.config(MC_MAX_CLIENTS, pool_size)
+        self.pool.config(MC_CONNECT_TIMEOUT, int(Args.MC_CONNECT_TIMEOUT * 1000))
+        self.pool.config(MC_POLL_TIMEOUT, int(Args.MC_POLL_TIMEOUT * 1000))
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="mc")
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Runs the client method (in the thread of the executor).
+        """
+
+        with self.pool.client() as mc_client:
+            return getattr(mc_client, method)(*args, **kwargs)
+
+    async def _run(self, method: str, *args, **kwargs) -> Any:
+        """
+        Runs the client method without blocking the event loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        call = partial(self._call, method, *args, **kwargs)
+        with STORAGE_SECONDS.time("memcached", method):
+            return await asyncio.wait_for(loop.run_in_executor(self.executor, call), self.timeout)
+
+    async def get(self, key: str) -> Any:
+        return await self._run("get", self.prefix + key)
+
+    async def get_multi(self, keys: Iterable[str]) -> Dict[str, Any]:
+        values = await self._run("get_multi", [self.prefix + key for key in keys])
+        return {
+            key.removeprefix(self.prefix): value
+            for (key, value) in values.items()
+        }
+
+    async def set(self, key: str, value: Any, expire: int = 0) -> bool:
+        return await self._run("set", self.prefix + key, value, expire)
+
+    async def set_multi(self, data: Dict[str, Any], expire: int = 0) -> Tuple[bool, List[str]]:
+        is_success, failed_keys = await self._run(
+            "set_multi",
+            {self.prefix + key: value for (key, value) in data.items()},
+            expire,
+            return_failure=True,
+        )
+        failed_keys = [
+            (key.decode() if isinstance(key, bytes) else key).removeprefix(self.prefix)
+            for key in failed_keys
+        ]
+        return is_success, failed_keys
+
+    async def add(self, key: str, value: Any, expire: int = 0) -> bool:
+        return await self._run("add", self.prefix + key, value, expire)
+
+    async def append(self, key: str, value: bytes) -> bool:
+        return await self._run("append", self.prefix + key, value)
+
+    async def gets(self, key: str) -> Tuple[Any, int]:
+        return await self._run("gets", self.prefix + key)
+
+    async def cas(self, key: str, value: Any, cas_token: int, expire: int = 0) -> bool:
+        return await self._run("cas", self.prefix + key, value, expire, cas_token)
+
+    async def delete(self, key: str) -> bool:
+        return await self._run("delete", self.prefix + key)
+
+    async def delete_multi(self, keys: Iterable[str]) -> bool:
+        return await self._run("delete_multi", [self.prefix + key for key in keys])
+
+    def close(self):
+        """
+        Waits for the running calls and stops the threads.
+        """
+        self.executor.shutdown(wait=True)
+
+
+class MemoryStorage(BaseStorage):
+    """
+    A storage in a dict of the process memory.
+    It costs nothing and is lost on restart, so it is suitable for
+    testing and for the bots that do not care about it.
+    The values are stored as they are (without copying).
+    """
+
+    # key -> (value, expire, cas token)
+    data: Dict[str, Tuple[Any, int, int]]
+    _cas_tokens: Iterator[int]
+
+    def __init__(self):
+        self.data = dict()
+        self._cas_tokens = count(1)
+
+    def _get_item(self, key: str) -> Optional[Tuple[Any, int, int]]:
+        item = self.data.get(key)
+        if item is not None and item[1] and item[1] <= time.time():
+            del self.data[key]
+            return None
+        return item
+
+    def _set_item(self, key: str, value: Any, expire: int):
+        self.data[key] = (value, expire, next(self._cas_tokens))
+
+    async def get(self, key: str) -> Any:
+        item = self._get_item(key)
+        return None if item is None else item[0]
+
+    async def get_multi(self, keys: Iterable[str]) -> Dict[str, Any]:
+        items = {key: self._get_item(key) for key in keys}
+        return {key: item[0] for (key, item) in items.items() if item is not None}
+
+    async def set(self, key: str, value: Any, expire: int = 0) -> bool:
+        self._set_item(key, value, expire)
+        return True
+
+    async def set_multi(self, data: Dict[str, Any], expire: int = 0) -> Tuple[bool, List[str]]:
+        for (key, value) in data.items():
+            self._set_item(key, value, expire)
+        return True, []
+
+    async def add(self, key: str, value: Any, expire: int = 0) -> bool:
+        if self._get_item(key) is not None:
+            return False
+        self._set_item(key, value, expire)
+        return True
+
+    async def append(self, key: str, value: bytes) -> bool:
+        item = self._get_item(key)
+        if item is None:
+            return False
+        self._set_item(key, item[0] + value, item[1])
+        return True
+
+    async def gets(self, key: str) -> Tuple[Any, int]:
+        item = self._get_item(key)
+        if item is None:
+            return None, 0
+        return item[0], item[2]
+
+    async def cas(self, key: str, value: Any, cas_token: int, expire: int = 0) -> bool:
+        item = self._get_item(key)
+        if item is None or item[2] != cas_token:
+            return False
+        self._set_item(key, value, expire)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+    async def delete_multi(self, keys: Iterable[str]) -> bool:
+        for key in keys:
+            self.data.pop(key, None)
+        return True
+
+
+class SqliteStorage(BaseStorage):
+    """
+    A storage in a local SQLite database.
+    The database works in WAL mode with `synchronous=NORMAL`: the writes
+    survive the crash of the process and cost one append to the log. All
+    queries are run in one separate thread.
+    The values that are not bytes are pickled (as memcached does).
+    The expired rows are ignored on reading and are deleted on opening.
+    """
+
+    connection: sqlite3.Connection
+    executor: ThreadPoolExecutor
+
+    def __init__(self, path: str = Args.SQLITE_PATH):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS storage (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                is_pickled INTEGER NOT NULL,
+                expire INTEGER NOT NULL,
+                cas INTEGER NOT NULL
+            );
+        """)
+        self.connection.execute(
+            "DELETE FROM storage WHERE expire != 0 AND expire <= ?",
+            (int(time.time()), ),
+        )
+
+    async def _run(self, func: Callable, *args) -> Any:
+        """
+        Runs the function in the thread of the database.
+        """
+
+        loop = asyncio.get_running_loop()
+        with STORAGE_SECONDS.time("sqlite", func.__name__.lstrip("_")):
+            return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    @staticmethod
+    def _dump(value: Any) -> Tuple[bytes, int]:
+        if isinstance(value, bytes):
+            return value, 0
+        return pickle.dumps(value), 1
+
+    @staticmethod
+    def _load(value: bytes, is_pickled: int) -> Any:
+        return pickle.loads(value) if is_pickled else value
+
+    def _select(self, keys: List[str]) -> Dict[str, Tuple[Any, int]]:
+        """
+        Returns `key -> (value, cas token)` of the found keys.
+        """
+
+        if not keys:
+            return dict()
+        placeholders = ", ".join("?" * len(keys))
+        rows = self.connection.execute(
+            "SELECT key, value, is_pickled, cas FROM storage"
+            f" WHERE key IN ({placeholders}) AND (expire = 0 OR expire > ?)",
+            (*keys, int(time.time())),
+        )
+        return {
+            key: (self._load(value, is_pickled), cas)
+            for (key, value, is_pickled, cas) in rows
+        }
+
+    def _upsert(self, data: Dict[str, Any], expire: int):
+        rows = [
+            (key, *self._dump(value), expire)
+            for (key, value) in data.items()
+        ]
+        self.connection.execute("BEGIN")
+        try:
+            self.connection.executemany(
+                "INSERT INTO storage (key, value, is_pickled, expire, cas) VALUES (?, ?, ?, ?, 1)"
+                " ON CONFLICT (key) DO UPDATE SET"
+                " value = excluded.value, is_pickled = excluded.is_pickled,"
+                " expire = excluded.expire, cas = cas + 1",
+                rows,
+            )
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def _add(self, key: str, value: Any, expire: int) -> bool:
+        # the thread is the only one, so select + insert is atomic
+        if self._select([key]):
+            return False
+        self.connection.execute(
+            "INSERT OR REPLACE INTO storage (key, value, is_pickled, expire, cas)"
+            " VALUES (?, ?, ?, ?, 1)",
+            (key, *self._dump(value), expire),
+        )
+        return True
+
+    def _append(self, key: str, value: bytes) -> bool:
+        cursor = self.connection.execute(
+            "UPDATE storage SET value = CAST(value || ? AS BLOB), cas = cas + 1"
+            " WHERE key = ? AND is_pickled = 0 AND (expire = 0 OR expire > ?)",
+            (value, key, int(time.time())),
+        )
+        return cursor.rowcount == 1
+
+    def _cas(self, key: str, value: Any, cas_token: int, expire: int) -> bool:
+        cursor = self.connection.execute(
+            "UPDATE storage SET value = ?, is_pickled = ?, expire = ?, cas = cas + 1"
+            " WHERE key = ? AND cas = ? AND (expire = 0 OR expire > ?)",
+            (*self._dump(value), expire, key, cas_token, int(time.time())),
+        )
+        return cursor.rowcount == 1
+
+    def _delete(self, keys: List[str]) -> int:
+        placeholders = ", ".join("?" * len(keys))
+        cursor = self.connection.execute(f"DELETE FROM storage WHERE key IN ({placeholders})", keys)
+        return cursor.rowcount
+
+    async def get(self, key: str) -> Any:
+        found = await self._run(self._select, [key])
+        return found[key][0] if found else None
+
+    async def get_multi(self, keys: Iterable[str]) -> Dict[str, Any]:
+        found = await self._run(self._select, list(keys))
+        return {key: value for (key, (value, _)) in found.items()}
+
+    async def set(self, key: str, value: Any, expire: int = 0) -> bool:
+        await self._run(self._upsert, {key: value}, expire)
+        return True
+
+    async def set_multi(self, data: Dict[str, Any], expire: int = 0) -> Tuple[bool, List[str]]:
+        await self._run(self._upsert, data, expire)
+        return True, []
+
+    async def add(self, key: str, value: Any, expire: int = 0) -> bool:
+        return await self._run(self._add, key, value, expire)
+
+    async def append(self, key: str, value: bytes) -> bool:
+        return await self._run(self._append, key, value)
+
+    async def gets(self, key: str) -> Tuple[Any, int]:
+        found = await self._run(self._select, [key])
+        return found.get(key, (None, 0))
+
+    async def cas(self, key: str, value: Any, cas_token: int, expire: int = 0) -> bool:
+        return await self._run(self._cas, key, value, cas_token, expire)
+
+    async def delete(self, key: str) -> bool:
+        return bool(await self._run(self._delete, [key]))
+
+    async def delete_multi(self, keys: Iterable[str]) -> bool:
+        keys = list(keys)
+        if keys:
+            await self._run(self._delete, keys)
+        return True
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.connection.close()
+
+
+STORAGES: Dict[str, Callable[[], BaseStorage]] = {
+    "memcached": McStorage,
+    "memory": MemoryStorage,
+    "sqlite": SqliteStorage,
+}
+
+
+def get_storage(name: str = Args.STORAGE) -> BaseStorage:
+    """
+    Creates the storage by its name.
+    """
+
+    if name not in STORAGES:
+        raise ValueError(f"Unknown storage `{name}`, expected one of: {', '.join(STORAGES)}")
+    return STORAGES[name]()
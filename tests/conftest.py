@@ -0,0 +1,19 @@
+"""
+The modules of the bot are imported from the root of the project, and the
+config reads `.envs` from the working directory, so the tests run in a
+temporary directory with the example settings.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+
+ROOT = Path(__file__).absolute().parent.parent
+
+sys.path.insert(0, str(ROOT))
+_envs_dir = tempfile.mkdtemp(prefix="tower_tests_")
+shutil.copy(ROOT / ".envs_example", Path(_envs_dir) / ".envs")
+os.chdir(_envs_dir)
@@ -0,0 +1,45 @@
+import pickle
+
+from codec import FORMAT_VERSION, HEADER, TowerCodec
+from funcs import TowerTrie
+
+
+TOWERS = ("ITSWEDNESDAYMYDUDES!", "ITSHOLIDAY!")
+CODEC = TowerCodec(TowerTrie(TOWERS))
+
+
+def test_round_trip():
+    # "Т" is the Cyrillic lookalike of "T"
+    letters = [("I", 1, 10), ("Т", 2, 11), ("S", 3, 12), ("H", 4, 13)]
+    data = (letters, 2, False, True)
+    assert CODEC.decode(CODEC.encode(data)) == data
+
+
+def test_round_trip_empty():
+    data = ([], 0, True, False)
+    value = CODEC.encode(data)
+    assert len(value) == HEADER.size
+    assert CODEC.decode(value) == data
+
+
+def test_legacy_pickled_tuple():
+    legacy = ([("I", 1, 10)], 1, True, False)
+    # the old values were pickled by the storage and come back as tuples
+    assert CODEC.decode(pickle.loads(pickle.dumps(legacy))) == legacy
+
+
+def test_no_value():
+    assert CODEC.decode(None) is None
+
+
+def test_unknown_version():
+    value = bytearray(CODEC.encode(([("I", 1, 10)], 0, False, False)))
+    value[0] = FORMAT_VERSION + 1
+    assert CODEC.decode(bytes(value)) is None
+
+
+def test_other_towers_keep_flags():
+    value = CODEC.encode(([("I", 1, 10), ("T", 2, 11)], 3, True, True))
+    other = TowerCodec(TowerTrie(("ITSWEDNESDAYMYDUDES!", )))
+    assert other.tower_hash != CODEC.tower_hash
+    assert other.decode(value) == ([], 3, True, True)
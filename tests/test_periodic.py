@@ -0,0 +1,72 @@
+import asyncio
+import datetime as dt
+
+from periodic import LAST_RUN_KEY_TEMPLATE, Scheduler
+from storage import MemoryStorage
+
+
+UTC = dt.timezone.utc
+
+
+def _scheduler(storage, runs, name="job"):
+    async def action():
+        runs.append(name)
+
+    scheduler = Scheduler(storage)
+    scheduler.add(name, action, UTC)
+    return scheduler
+
+
+def test_missed_run_is_made_up():
+    async def check():
+        storage = MemoryStorage()
+        runs = []
+        scheduler = _scheduler(storage, runs)
+        job = scheduler.heap[0]
+        last_midnight = job.get_last_midnight()
+        await storage.set(job.last_run_key, last_midnight - 24 * 60 * 60)
+
+        await scheduler.catch_up()
+        assert runs == ["job"]
+        assert await storage.get(job.last_run_key) == last_midnight
+
+        # the run is made up only once
+        await scheduler.catch_up()
+        assert runs == ["job"]
+
+    asyncio.run(check())
+
+
+def test_done_run_is_not_repeated():
+    async def check():
+        storage = MemoryStorage()
+        runs = []
+        scheduler = _scheduler(storage, runs)
+        await storage.set(scheduler.heap[0].last_run_key, scheduler.heap[0].get_last_midnight())
+
+        await scheduler.catch_up()
+        assert runs == []
+
+    asyncio.run(check())
+
+
+def test_new_job_is_only_remembered():
+    async def check():
+        storage = MemoryStorage()
+        runs = []
+        scheduler = _scheduler(storage, runs, "new")
+
+        await scheduler.catch_up()
+        assert runs == []
+        assert await storage.get(LAST_RUN_KEY_TEMPLATE.format("new")) == scheduler.heap[0].get_last_midnight()
+
+    asyncio.run(check())
+
+
+def test_no_storage_no_catch_up():
+    async def check():
+        runs = []
+        await _scheduler(None, runs).catch_up()
+        assert runs == []
+
+    asyncio.run(check())
@@ -0,0 +1,67 @@
+import asyncio
+
+from periodic import get_day_epoch
+from registry import ChatRegistry, dump_shard, parse_shard
+from storage import MemoryStorage
+
+
+def test_parse_shard():
+    assert parse_shard(b",5,-100,5,7") == [5, -100, 7]
+    assert parse_shard(dump_shard([1, -2])) == [1, -2]
+    assert parse_shard(b"") == []
+
+
+def test_duplicates_are_compacted():
+    async def check():
+        storage = MemoryStorage()
+        registry = ChatRegistry(storage, shards=4)
+        day = get_day_epoch()
+        for chat_id in (1, 5, 1, 2, 5, -3):
+            await registry.add(chat_id, day)
+
+        assert sorted(await registry.all(day)) == [-3, 1, 2, 5]
+        # the shard of chats 1, 5 and -3 is rewritten without the duplicates
+        key = registry._shard_key(1, day)
+        assert await storage.get(key) == b",1,5,-3"
+        assert sorted(await registry.all(day)) == [-3, 1, 2, 5]
+
+    asyncio.run(check())
+
+
+def test_changed_shard_is_not_compacted():
+    async def check():
+        storage = MemoryStorage()
+        registry = ChatRegistry(storage, shards=1)
+        day = get_day_epoch()
+        for chat_id in (1, 1):
+            await registry.add(chat_id, day)
+
+        key = registry._shard_key(1, day)
+        gets = storage.gets
+
+        async def gets_and_append(key):
+            # another process appends its chat right after the shard is read
+            result = await gets(key)
+            await storage.append(key, dump_shard([2]))
+            return result
+
+        storage.gets = gets_and_append
+        await registry.all(day)
+        assert await storage.get(key) == b",1,1,2"
+        storage.gets = gets
+        assert await registry.all(day) == [1, 2]
+        assert await storage.get(key) == b",1,2"
+
+    asyncio.run(check())
+
+
+def test_other_day_is_separate():
+    async def check():
+        registry = ChatRegistry(MemoryStorage(), shards=2)
+        day = get_day_epoch()
+        await registry.add(1, day)
+        await registry.add(2, day - 1)
+        assert await registry.all(day) == [1]
+        assert await registry.all(day - 1) == [2]
+
+    asyncio.run(check())
@@ -0,0 +1,45 @@
+import pytest
+
+from funcs import TowerTrie
+
+
+def test_walk_and_complete():
+    trie = TowerTrie(("ITS!", "IT?"))
+    node = trie.walk("ITS!")
+    assert node.completed == 0
+    assert trie.walk("IT?").completed == 1
+    assert trie.walk("IX") is None
+
+
+def test_lookalike_is_not_clean():
+    trie = TowerTrie(("ITS", ))
+    # "Т" is the Cyrillic lookalike of "T"
+    node = trie.walk("IТS")
+    assert node.completed == 0
+    assert node.completed not in node.clean
+    assert trie.walk("ITS").completed in trie.walk("ITS").clean
+
+
+def test_repeated_towers_are_one():
+    trie = TowerTrie(("ITS", "ITS"))
+    assert trie.towers == ("ITS", )
+
+
+def test_prefix_tower_is_rejected():
+    with pytest.raises(ValueError, match="beginning"):
+        TowerTrie(("ITS", "ITSWEDNESDAY!"))
+
+
+def test_lookalike_prefix_tower_is_rejected():
+    # "І" is the Ukrainian lookalike of "I"
+    with pytest.raises(ValueError, match="beginning"):
+        TowerTrie(("ІTS", "ITSWEDNESDAY!"))
+
+
+def test_is_possible():
+    trie = TowerTrie(("ITS", ))
+    assert trie.is_possible("T")
+    assert trie.is_possible("Т")
+    assert not trie.is_possible("X")
+    assert not trie.is_possible("TT")
+    assert not trie.is_possible(None)
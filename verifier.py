@@ -0,0 +1,142 @@
+"""
+Verification that no letter of the tower was deleted.
+The bot API can not check if a message exists, so each message is
+forwarded to the null chat: forwarding a deleted message fails.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable, List, Optional, Set, TypeVar
+
+from telegram import Bot, Chat
+from telegram.error import BadRequest, RetryAfter
+
+from config import Args
+from metrics import TELEGRAM_SECONDS, TELEGRAM_ERRORS
+
+
+__all__ = [
+    "DeletionVerifier",
+]
+
+
+logger = logging.getLogger(__name__)
+
+RESULT_TYPE = TypeVar("RESULT_TYPE")
+
+
+async def measured_call(func: Callable[..., Awaitable[RESULT_TYPE]], *args) -> RESULT_TYPE:
+    """
+    Calls the bot method and records its time and errors.
+    """
+
+    method = getattr(func, "__name__", "unknown")
+    try:
+        with TELEGRAM_SECONDS.time(method):
+            return await func(*args)
+    except Exception as exc:
+        TELEGRAM_ERRORS.inc(method, type(exc).__name__)
+        raise
+
+
+async def call_with_retry(
+        func: Callable[..., Awaitable[RESULT_TYPE]],
+        *args,
+        retries: int = Args.FLOOD_RETRIES,
+) -> RESULT_TYPE:
+    """
+    Calls the bot method, waiting out the flood control of telegram at
+    most `retries` times.
+    """
+
+    for _ in range(retries):
+        try:
+            return await measured_call(func, *args)
+        except RetryAfter as exc:
+            await asyncio.sleep(exc.retry_after)
+    return await measured_call(func, *args)
+
+
+class DeletionVerifier:
+    """
+    Checks the messages of the tower by forwarding them to the null chat.
+    At most `concurrency` messages are forwarded at the same time, and on
+    the first missing message the other forwards are cancelled.
+    The forwarded copies are deleted from the null chat in the background
+    in batches, so the check of the tower does not wait for it.
+    """
+
+    concurrency: int
+    cleanup_batch_size: int
+    _to_cleanup: List[int]
+    _cleanup_task: Optional[asyncio.Task]
+
+    def __init__(
+            self,
+            concurrency: int = Args.VERIFY_CONCURRENCY,
+            cleanup_batch_size: int = Args.CLEANUP_BATCH_SIZE,
+    ):
+        self.concurrency = concurrency
+        self.cleanup_batch_size = cleanup_batch_size
+        self._to_cleanup = []
+        self._cleanup_task = None
+
+    async def verify(self, chat: Chat, message_ids: Iterable[int]) -> bool:
+        """
+        Returns whether all the messages still exist in the chat.
+        """
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        forwarded: List[int] = []
+
+        async def forward(message_id: int):
+            async with semaphore:
+                message = await call_with_retry(chat.forward_to, Args.NULL_CHAT, message_id)
+                forwarded.append(message.id)
+
+        tasks = [asyncio.create_task(forward(message_id)) for message_id in message_ids]
+        try:
+            for task in asyncio.as_completed(tasks):
+                await task
+            return True
+        except BadRequest:
+            # the message is not found, the other ones do not matter
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._cleanup(chat.get_bot(), forwarded)
+
+    def _cleanup(self, bot: Bot, message_ids: List[int]):
+        """
+        Adds the copies to the cleaning queue and starts cleaning if it is
+        not running.
+        """
+
+        self._to_cleanup.extend(message_ids)
+        if self._to_cleanup and (self._cleanup_task is None or self._cleanup_task.done()):
+            self._cleanup_task = asyncio.create_task(self._clean(bot))
+
+    async def _clean(self, bot: Bot):
+        """
+        Deletes the copies from the null chat batch by batch.
+        """
+
+        while self._to_cleanup:
+            batch = self._to_cleanup[:self.cleanup_batch_size]
+            del self._to_cleanup[:self.cleanup_batch_size]
+            results = await asyncio.gather(
+                *(
+                    call_with_retry(bot.delete_message, Args.NULL_CHAT, message_id)
+                    for message_id in batch
+                ),
+                return_exceptions=True,
+            )
+            errors: Set[str] = {
+                str(result)
+                for result in results
+                if isinstance(result, Exception)
+            }
+            if errors:
+                logger.warning("Failed to clean the null chat: %s", "; ".join(errors))
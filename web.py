@@ -0,0 +1,130 @@
+"""
+A tiny HTTP server for the local endpoints of the bot (the webhook and
+so on). It does not need any dependencies and handles only the simplest
+requests: one request per connection, the body only by `Content-Length`.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+__all__ = [
+    "Request",
+    "Response",
+    "HttpServer",
+]
+
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_SIZE = 1024 * 1024
+READ_TIMEOUT = 10
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    headers: Dict[str, str]  # the names are in lower case
+    body: bytes
+
+
+@dataclass
+class Response:
+    status: int = HTTPStatus.OK
+    body: bytes = b""
+    content_type: str = "text/plain; charset=utf-8"
+
+
+HANDLER_TYPE = Callable[[Request], Awaitable[Response]]
+
+
+class HttpServer:
+    """
+    The server calls the handler registered for the method and path of
+    the request, its response is sent back, and the connection is
+    closed.
+    """
+
+    host: str
+    port: int
+    routes: Dict[Tuple[str, str], HANDLER_TYPE]
+    server: Optional[asyncio.AbstractServer]
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.routes = dict()
+        self.server = None
+
+    def route(self, method: str, path: str, handler: HANDLER_TYPE):
+        self.routes[(method, path)] = handler
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Request:
+        """
+        Reads and parses the request, raises `ValueError` if the request
+        is not correct.
+        """
+
+        request_line = (await reader.readline()).decode("latin-1")
+        method, target, _ = request_line.split(" ", 2)
+
+        headers = dict()
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0))
+        if not (0 <= length <= MAX_BODY_SIZE):
+            raise ValueError("Incorrect body size")
+        body = (await reader.readexactly(length)) if length else b""
+
+        return Request(method, urlsplit(target).path, headers, body)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                request = await asyncio.wait_for(self._read_request(reader), READ_TIMEOUT)
+            except (ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                response = Response(HTTPStatus.BAD_REQUEST)
+            else:
+                handler = self.routes.get((request.method, request.path))
+                if handler is None:
+                    response = Response(HTTPStatus.NOT_FOUND)
+                else:
+                    try:
+                        response = await handler(request)
+                    except Exception:
+                        logger.exception("Error while handling %s %s", request.method, request.path)
+                        response = Response(HTTPStatus.INTERNAL_SERVER_ERROR)
+
+            status = HTTPStatus(response.status)
+            head = (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: {response.content_type}\r\n"
+                f"Content-Length: {len(response.body)}\r\n"
+                "Connection: close\r\n"
+                "\r\n"
+            )
+            writer.write(head.encode("latin-1") + response.body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
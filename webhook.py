@@ -0,0 +1,90 @@
+"""
+Receiving of updates by webhook instead of long polling.
+Telegram POSTs the updates to the local HTTP server, which checks the
+secret token and puts them into the update queue of the application, so
+they are processed by the same handlers as with polling.
+
+To test it locally, just POST a recorded update:
+    curl -X POST localhost:8443/webhook \
+        -H "X-Telegram-Bot-Api-Secret-Token: <secret>" \
+        -d @update.json
+"""
+
+import hmac
+import json
+import logging
+from http import HTTPStatus
+from typing import List
+
+from telegram import Update
+from telegram.ext import Application
+
+from config import Args
+from web import HttpServer, Request, Response
+
+
+__all__ = [
+    "WebhookReceiver",
+]
+
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER = "x-telegram-bot-api-secret-token"
+
+
+class WebhookReceiver:
+    """
+    Local HTTP server, which feeds the updates from telegram into the
+    application.
+    If `Args.WEBHOOK_URL` is set, the webhook is registered in telegram on
+    start; otherwise it is expected to be registered by someone else (or
+    the updates are POSTed by hand).
+    """
+
+    app: Application
+    secret: str
+    server: HttpServer
+
+    def __init__(self, app: Application):
+        if not Args.WEBHOOK_SECRET:
+            raise ValueError("The webhook mode requires `WEBHOOK_SECRET` in the `.envs` file")
+
+        self.app = app
+        self.secret = Args.WEBHOOK_SECRET
+        self.server = HttpServer(Args.WEBHOOK_LISTEN, Args.WEBHOOK_PORT)
+        self.server.route("POST", Args.WEBHOOK_PATH, self.receive)
+
+    async def start(self, allowed_updates: List[str]):
+        await self.server.start()
+        if Args.WEBHOOK_URL:
+            await self.app.bot.set_webhook(
+                url=Args.WEBHOOK_URL,
+                allowed_updates=allowed_updates,
+                secret_token=self.secret,
+            )
+
+    async def close(self):
+        await self.server.close()
+
+    async def receive(self, request: Request) -> Response:
+        """
+        Checks the secret token of the request and queues its update.
+        Only a JSON object with an update is accepted.
+        """
+
+        token = request.headers.get(SECRET_HEADER, "")
+        if not hmac.compare_digest(token.encode(), self.secret.encode()):
+            return Response(HTTPStatus.FORBIDDEN)
+
+        try:
+            data = json.loads(request.body)
+            update = Update.de_json(data, self.app.bot) if isinstance(data, dict) else None
+        except (ValueError, TypeError, KeyError, AttributeError):
+            update = None
+        if update is None:
+            logger.warning("Incorrect update received by webhook")
+            return Response(HTTPStatus.BAD_REQUEST)
+
+        await self.app.update_queue.put(update)
+        return Response()